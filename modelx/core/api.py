@@ -35,6 +35,7 @@ from contextlib import contextmanager
 
 from modelx.core import mxsys as _system
 from modelx.core.cells import CellsMaker as _CellsMaker
+from modelx.core.cells import LRU, ArrayCache
 from modelx.core.macro import MacroMaker as _MacroMaker
 from modelx.core.space import BaseSpace as _Space
 from modelx.core.model import Model as _Model
@@ -996,7 +997,8 @@ def trace_stack(maxlen=10000):
         stop_stacktrace()
 
 
-def write_model(model, model_path, backup=True, log_input=False, version=None):
+def write_model(model, model_path, backup=True, log_input=False, version=None,
+                incremental=False, array_data=False):
     """Write model to files.
 
     Write ``model`` to text files in a folder(directory) tree at ``model_path``.
@@ -1041,7 +1043,46 @@ def write_model(model, model_path, backup=True, log_input=False, version=None):
             output to *_input_log.txt* under ``model_path``. Defaults
             to ``False``.
         version(int, optional): Format version to write model.
-            Defaults to the most recent version.
+            Defaults to 7, or to 8 if ``array_data`` is ``True``.
+            Models written in version 8 cannot be read by modelx
+            earlier than 0.32.0.
+        incremental(bool, optional): If ``True``, only the files whose
+            contents have changed since the last incremental write to
+            ``model_path`` are written, and files no longer needed
+            are deleted. Other files in ``model_path`` are not touched,
+            and ``backup`` is ignored. Defaults to ``False``.
+        array_data(bool, optional): If ``True``, the input values of
+            each Cells whose arguments are integers and whose values
+            are numbers are written in a NumPy *.npy* file as an array,
+            which is memory-mapped when the model is read back by
+            :func:`~read_model`. Requires ``version`` 8 or later.
+            Defaults to ``False``.
+
+    An incremental write compares each file with the file on disk
+    and records the hash of each file in the manifest
+    in *_system.json* under ``model_path``.
+    Saving an unchanged model this way leaves all the files
+    other than *_system.json* untouched, which keeps version control
+    diffs small. The spaces not changed since the last incremental
+    write to ``model_path`` in the same session are not encoded again
+    unless their files on disk have been changed. Changes to values
+    made in place, such as appending to a list assigned to a
+    reference, are not detected for skipping spaces,
+    so assign the modified value again to save such changes.
+
+    An array written with ``array_data`` spans from the smallest to
+    the largest argument of each parameter, so input values whose
+    arguments are sparse, such that the array would be more than four
+    times as large as the number of the values, are written
+    in *data.pickle* as usual.
+    Input values in a memory-mapped array are read from the file
+    only when they are looked up, and no Python object is created
+    for the other values.
+    The arrays are not memory-mapped on Windows, as mapped files cannot
+    be replaced when the model is written back to the same folder.
+
+    .. versionchanged:: 0.32.0 ``incremental`` and ``array_data``
+       parameters are added.
 
     .. versionchanged:: 0.22.0
         The source Excel files for spaces and cells created by
@@ -1059,7 +1100,8 @@ def write_model(model, model_path, backup=True, log_input=False, version=None):
     """
     return _serialize.write_model(
         _system, model, model_path, is_zip=False,
-        backup=backup, log_input=log_input, version=version)
+        backup=backup, log_input=log_input, version=version,
+        incremental=incremental, array_data=array_data)
 
 
 def zip_model(model, model_path, backup=True, log_input=False,
@@ -1093,7 +1135,8 @@ def zip_model(model, model_path, backup=True, log_input=False,
             For Python 3.6, this parameter is ignored.
 
         version(int, optional): Format version to write model.
-            Defaults to the most recent version.
+            Defaults to 7. Models written in version 8 cannot be read
+            by modelx earlier than 0.32.0.
             This parameter should be left unspecified in normal cases.
 
     .. _zipfile.ZipFile:
@@ -1118,7 +1161,8 @@ def zip_model(model, model_path, backup=True, log_input=False,
         version=version)
 
 
-def read_model(model_path, name=None):
+def read_model(model_path, name=None, lazy=False, max_workers=None,
+               process_workers=None):
     """Read model from files.
 
     Read model form a folder(directory) tree or a zip file ``model_path``.
@@ -1130,13 +1174,59 @@ def read_model(model_path, name=None):
     Args:
         model_path(str): Path to a model folder or a zipped model file.
         name(str, optional): Model name to overwrite the saved name.
+        lazy(bool, optional): If ``True``, the spaces in the model
+            are not read until they are first accessed.
+            Defaults to ``False``.
+        max_workers(int, optional): If given and ``model_path`` is
+            a zip file, the files in the zip file are decompressed
+            in advance by this number of threads. Ignored if ``lazy``
+            is ``True``.
+        process_workers(int, optional): If given, the source files of
+            the spaces are tokenized by this number of processes.
+            Ignored if ``lazy`` is ``True``.
+            On platforms where processes are not forked,
+            the main module of the program must be importable
+            without side effects, as required by :mod:`multiprocessing`.
+            Starting the processes takes time, so this is only
+            worthwhile for models with many spaces on machines
+            with multiple CPUs.
+
+    When ``lazy`` is ``True``, only the model's own attributes,
+    such as its References and macros, are read first,
+    and each space directly under the model is read with all its
+    descendants when it is first accessed, for example by
+    attribute access such as ``model.Space1``, by :func:`get_object`
+    or by a formula. Spaces that the space being read depends on,
+    such as its base spaces, are read at the same time.
+    Input values are read when the first space that has input
+    values is read. Accessing
+    :attr:`Model.spaces<modelx.core.model.Model.spaces>`
+    and writing the model read all the remaining spaces.
+    Models written by modelx before 0.31.0 are read at once
+    regardless of ``lazy``.
+
+    If the environment variable ``MX_FORMULA_CACHE`` is set to
+    the path to a directory, the formulas are compiled once and
+    kept in files in the directory, together with their cleaned
+    source code and parameters. Formulas found in the directory
+    are created from the files without parsing their source code again,
+    so reading an unchanged model again is faster.
+    The files are looked up by the source code of the formulas,
+    so changed formulas are compiled again. Entries are not
+    shared between Python versions. The directory can be shared by
+    models and by processes, and can be deleted at any time.
 
     Returns:
         A Model object constructed from the files.
 
+    .. versionchanged:: 0.32.0 ``lazy``, ``max_workers`` and
+       ``process_workers`` parameters are added.
+
     .. versionadded:: 0.0.22
     """
-    return _serialize.read_model(_system, model_path, name=name)
+    return _serialize.read_model(_system, model_path, name=name, lazy=lazy,
+                                 max_workers=max_workers,
+                                 process_workers=process_workers)
 
 
 def get_recalc():
@@ -1177,6 +1267,88 @@ def set_recalc(recalc):
     _system._recalc_dependents = bool(recalc)
 
 
+def get_tracing():
+    """Return :obj:`True` if dependency tracing is on.
+
+    See :func:`set_tracing` for details.
+
+    See Also:
+        * :func:`set_tracing`: Turn dependency tracing on or off
+        * :func:`untraced`: Context manager to turn off dependency tracing
+
+    .. versionadded:: 0.32.0
+    """
+    return _system.get_tracing()
+
+
+def set_tracing(tracing):
+    """Turn dependency tracing on or off.
+
+    By default, modelx records which values each calculated value
+    depends on, every time a formula calls a cells or refers to
+    a reference, so that only the dependent values are cleared
+    when the model is changed. This bookkeeping takes a noticeable share
+    of the time of calls to cached cells, especially in
+    deep recursive formulas such as ``pv(t) -> pv(t-1)``.
+
+    When tracing is turned off, the calculated values are still cached
+    but the dependencies between them are not recorded.
+    Instead, models in which values are calculated without tracing
+    are invalidated coarsely: any subsequent change to such a model,
+    such as assigning an input value, changing a formula or
+    a reference, or clearing a value, clears all the calculated values
+    and deletes all the :class:`~modelx.core.space.ItemSpace` objects
+    in the model. Input values are kept.
+
+    Turning off tracing is suitable for batch runs in which
+    the model is not edited during the run.
+    While tracing is off, the call stack cannot be traced by
+    :func:`start_stacktrace`, and
+    :meth:`~modelx.core.model.Model.generate_actions` cannot be used.
+
+    Args:
+        tracing(bool): :obj:`False` to turn off tracing, :obj:`True`
+            to turn it back on.
+
+    Example:
+        .. code-block:: python
+
+            >>> mx.set_tracing(False)
+
+            >>> model.Projection.pv(1200)  # No dependency is recorded
+
+            >>> model.Projection.rate = 0.02   # Clears all calculated values
+
+            >>> mx.set_tracing(True)
+
+    See Also:
+        * :func:`get_tracing`: Check if dependency tracing is on
+        * :func:`untraced`: Context manager to turn off dependency tracing
+
+    .. versionadded:: 0.32.0
+    """
+    _system.set_tracing(tracing)
+
+
+def untraced():
+    """Context manager to turn off dependency tracing.
+
+    Dependency tracing is turned off in the ``with`` block,
+    and the previous setting is restored on leaving the block.
+    See :func:`set_tracing` for details::
+
+        >>> with mx.untraced():
+        ...     model.Projection.pv(1200)
+
+    See Also:
+        * :func:`set_tracing`: Turn dependency tracing on or off
+        * :func:`get_tracing`: Check if dependency tracing is on
+
+    .. versionadded:: 0.32.0
+    """
+    return _system.untraced()
+
+
 def get_error():
     """Returns exception raised during last formula execution
 
@@ -1348,7 +1520,7 @@ def handle_formula_error(handle=None):
     return _system.executor.is_formula_error_handled
 
 
-def export_model(model, path):
+def export_model(model, path, broadcast=False):
     """Export a given model as a self-contained Python package.
 
     .. warning:: This function is currently experimental
@@ -1398,15 +1570,59 @@ def export_model(model, path):
       Users should ensure that such Cells are called using ``()``
       in the original model's formulas.
 
+    **Broadcasting parameters**
+
+    If ``broadcast`` is ``True``, the class of each parameterized space
+    in the package has a ``_mx_broadcast`` method, which takes
+    arrays of the space parameters instead of scalars and
+    returns a single ItemSpace whose parameters are the NumPy arrays
+    broadcast from the arguments, such as::
+
+        >>> proj = mx_model.Projection._mx_broadcast(np.arange(1, 100001))
+
+        >>> proj.pv_net_cf(0)   # Array of 100000 values
+
+    Only the parameters are broadcast. The formulas are exported as they
+    are, and are not vectorized by modelx, so they are evaluated
+    once for each set of the arguments of the Cells, such as ``t``,
+    with the arrays of the parameters. The formulas must be written to
+    work with the arrays, for example by using :func:`numpy.where`
+    instead of ``if`` on the parameters, and looking up data by
+    :attr:`pandas.Series.loc` with the arrays.
+    Formulas that only work with scalar parameters give wrong results
+    or raise errors.
+
+    **Shared input data**
+
+    When the exported package is imported in many processes,
+    the input data, such as the values of PandasData and pickled values,
+    can be shared by the processes instead of being read
+    in each of them. If the environment variable ``MX_IO_CACHE`` is
+    set to the path to a directory when the package is imported,
+    the first process to import the package writes the input data
+    in files in the directory, and the processes, including the first,
+    memory-map the files. NumPy arrays, including those in
+    pandas objects, are then backed by the memory-mapped files
+    without being copied, and are read-only.
+    The files are written again when the data files of the package change.
+    A directory on a RAM disk, such as */dev/shm*, can be used
+    to keep the files in memory.
+    :func:`modelx.export.runner.run_parallel` sets the variable
+    in its workers by its ``io_cache`` parameter.
+
     Args:
         model: The Model object to be exported.
         path: The path where the generated Python package will be located.
+        broadcast(bool, optional): If ``True``, ``_mx_broadcast`` methods
+            are generated for parameterized spaces.
+            Defaults to ``False``.
 
     .. seealso:: :meth:`~modelx.core.model.Model.export`
+    .. versionchanged:: 0.32.0 ``broadcast`` parameter is added.
     .. versionadded:: 0.22.0
     """
     from ..export.exporter import Exporter
-    Exporter(model, path).export()
+    Exporter(model, path, broadcast=broadcast).export()
 
 
 def _new_cells_keep_source(space, formula):
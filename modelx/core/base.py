@@ -589,7 +589,7 @@ class Interface:
     def __reduce__(self):
         if self._is_valid() and self._impl.system.serializing:
 
-            if self._impl.system.serializing.version in (3, 4, 5, 6, 7):
+            if self._impl.system.serializing.version in (3, 4, 5, 6, 7, 8):
                 return self._reduce_serialize_3()
             else:
                 raise ValueError("invalid serializer version")
@@ -648,6 +648,7 @@ class Interface:
     @allow_none.setter
     def allow_none(self, value):
         self._impl.allow_none = value if value is None else bool(value)
+        self._impl.model.record_change(self._impl)
 
     # ----------------------------------------------------------------------
     # Override base class methods
@@ -80,14 +80,15 @@ class AlteredFunction(BaseNamespaceReferrer):
         server (cells).
         """
         self.is_altfunc_updated = False
-        self._is_global_updated = False
 
     @property
     def global_names(self):
+        codeobj = self.altfunc.__code__     # Update altfunc first
         if self._is_global_updated:
             return self._global_names
         else:
-            self._global_names = tuple(self._extract_globals(self.altfunc.__code__))
+            self._global_names = tuple(self._extract_globals(codeobj))
+            self._is_global_updated = True
             return self._global_names
 
     @property
@@ -122,11 +123,22 @@ class AlteredFunction(BaseNamespaceReferrer):
         name = func.__name__  # self.cells.name   # func.__name__
 
         closure = func.__closure__  # None normally.
+        ns_dict = self.ns_server.ns_dict
+
+        altfunc = getattr(self, "_altfunc", None)   # None if not created
+        if (closure is None and altfunc is not None
+                and altfunc.__code__ is codeobj
+                and altfunc.__globals__ is ns_dict
+                and altfunc.__name__ == name):
+            # Reuse altfunc, as ns_dict is updated in place
+            self.is_altfunc_updated = True
+            return
+
         if closure is not None:  # pytest fails without this.
             closure = create_closure(self.interface)
 
         self._altfunc = FunctionType(
-            codeobj, self.ns_server.ns_dict, name=name, closure=closure
+            codeobj, ns_dict, name=name, closure=closure
         )
         self._is_global_updated = False
         self.is_altfunc_updated = True
@@ -170,7 +182,7 @@ class AlteredFunction(BaseNamespaceReferrer):
         if self.formula is None:
             return None
         else:
-            refs = self._get_referents()
+            refs = self.model.depindex.get_referents(self)
             result = refs.copy()
 
             for key, data in refs.items():
@@ -50,6 +50,7 @@ class NamespaceServer(Subject):
         """
         Subject.__init__(self)
         self._namespace = self._ns_class(self)
+        self._ns_dict = {}
         self._is_ns_updated = False
 
     def on_notify(self, subject: Subject) -> None:
@@ -78,7 +79,9 @@ class NamespaceServer(Subject):
             return self._ns_dict
 
     def _update_ns(self) -> BaseNamespace:  # TODO: Refactor.
-        self._ns_dict = {}
+        # Refill the dict in place, as it is the globals of
+        # the functions of the formulas in the namespace.
+        self._ns_dict.clear()
         self.on_update_ns()
         self._is_ns_updated = True
         return self._namespace
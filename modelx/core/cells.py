@@ -12,15 +12,17 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library.  If not, see <http://www.gnu.org/licenses/>.
 import warnings
-from collections import namedtuple
-from collections.abc import Mapping, Callable, Sequence
+import operator
+from collections import namedtuple, OrderedDict
+from collections.abc import (
+    Mapping, MutableMapping, MutableSet, Callable, Sequence)
 from itertools import combinations
 
 from modelx.core.base import (
     Impl, Derivable, Interface, get_mixin_slots
 )
 from modelx.core.execution.trace import (
-    OBJ, KEY, get_node, get_node_repr, tuplize_key, key_to_node
+    OBJ, KEY, get_node, get_node_repr, tuplize_key, key_to_node, ArrayNode
 )
 from modelx.core.formula import (
     Formula, NullFormula, NULL_FORMULA, replace_docstring
@@ -31,6 +33,382 @@ from modelx.core.node import NodeFactory, NodeFactoryImpl
 from modelx.core.binding.boundfunc import AlteredFunction
 
 
+class LRU:
+    """Cache policy to evict least recently used values
+
+    Assigning an :class:`LRU` object to
+    :attr:`Cells.cache_policy<modelx.core.cells.Cells.cache_policy>`
+    bounds the number of calculated values the Cells keeps
+    to ``maxsize``. When a new value is calculated and the bound is
+    exceeded, the least recently used calculated values are evicted.
+    Evicted values are recalculated when they are accessed again.
+
+    The values that depend on evicted values are kept, as they are
+    still valid. The dependency of the evicted values is kept,
+    so the values that depend on them are cleared as usual when
+    the values that the evicted values depend on are changed.
+    Input values are never evicted and do not count toward ``maxsize``.
+
+    Args:
+        maxsize(:obj:`int`): Max number of calculated values to keep
+
+    .. versionadded:: 0.32.0
+    """
+
+    __slots__ = ("maxsize",)
+    is_arrayed = False
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+
+    def __repr__(self):
+        return "LRU(maxsize=%s)" % self.maxsize
+
+    def create_data(self, data):
+        return LRUData(data)
+
+    def on_store(self, cells, key):
+        self.evict(cells, current=key)
+
+    def evict(self, cells, current=None):
+        """Evict the least recently used values over ``maxsize``"""
+        data, input_keys = cells.data, cells.input_keys
+        excess = len(data) - len(input_keys) - self.maxsize
+        if excess <= 0:
+            return
+
+        keys = []
+        for k in data:  # From the least recently used
+            if k != current and k not in input_keys:
+                keys.append(k)
+                if len(keys) == excess:
+                    break
+
+        for k in keys:
+            cells.evict_value_at(k)
+
+
+class LRUData(OrderedDict):
+    """Cells data ordered from the least recently used key
+
+    ``evicted`` is the set of the keys of the evicted values
+    whose nodes are kept in the trace graph.
+    """
+
+    __slots__ = ("evicted",)
+
+    def __init__(self, data=()):
+        self.evicted = set()
+        OrderedDict.__init__(self, data)
+
+    def __getitem__(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        OrderedDict.__setitem__(self, key, value)
+        self.evicted.discard(key)
+
+
+class ArrayCache:
+    """Cache policy to store values in a NumPy array
+
+    Assigning an :class:`ArrayCache` object to
+    :attr:`Cells.cache_policy<modelx.core.cells.Cells.cache_policy>`
+    of a Cells that has one parameter, such as ``t``, stores
+    the values of the Cells for the integer arguments from 0 to
+    ``size - 1`` in a NumPy array of ``dtype``, instead of
+    keeping a Python object and a trace node for each argument.
+    A value is stored in the array only if it is of the Python type
+    of the array's elements, such as :obj:`float` for the default
+    ``dtype``, and is read back unchanged from the array.
+    Values for other arguments and other values, such as
+    :obj:`int` values for a :obj:`float` array,
+    are kept as they are.
+
+    The dependency of the calculated values is traced for the array
+    as a whole. When any value that a calculated value in the array
+    depends on is cleared or changed,
+    all the calculated values in the array are cleared
+    together with their dependents.
+    Input values are traced individually as usual.
+
+    :meth:`Cells.eval_many<modelx.core.cells.Cells.eval_many>`
+    reads values for integer arrays of arguments from the array at once
+    when all of them are calculated.
+
+    Args:
+        size(:obj:`int`): Length of the array
+        dtype(optional): NumPy data type of the array.
+            Defaults to :obj:`float`.
+
+    Example:
+
+        .. code-block:: python
+
+            >>> space.pv.cache_policy = mx.ArrayCache(size=1200)
+
+    .. versionadded:: 0.32.0
+    """
+
+    __slots__ = ("size", "dtype")
+    is_arrayed = True
+
+    def __init__(self, size, dtype=float):
+        import numpy as np
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+        self.size = size
+        self.dtype = np.dtype(dtype)
+
+    def __repr__(self):
+        return "ArrayCache(size=%s, dtype='%s')" % (self.size, self.dtype)
+
+    def create_data(self, data):
+        return ArrayData(self.size, self.dtype, data)
+
+    def on_store(self, cells, key):
+        pass
+
+
+class ArrayData(MutableMapping):
+    """Cells data with the values for ``(0,)`` to ``(size - 1,)`` in an array
+
+    Other keys and values that would not be read back unchanged
+    from the array are kept in a dict.
+    """
+
+    __slots__ = ("array", "itemtype", "mask", "others", "count")
+
+    def __init__(self, size, dtype, data):
+        import numpy as np
+        self.array = np.zeros(size, dtype=dtype)
+        self.itemtype = self.array.item(0).__class__
+        self.mask = bytearray(size)     # 1 if the element has a value
+        self.others = {}
+        self.count = 0
+        self.update(data)
+
+    def _index(self, key):
+        try:
+            t, = key
+            if t.__class__ is not int:
+                t = operator.index(t)
+        except (TypeError, ValueError):
+            return -1
+        return t if 0 <= t < len(self.mask) else -1
+
+    def __contains__(self, key):
+        i = self._index(key)
+        return (i >= 0 and self.mask[i] == 1) or key in self.others
+
+    def __getitem__(self, key):
+        i = self._index(key)
+        if i >= 0 and self.mask[i]:
+            return self.array.item(i)
+        return self.others[key]
+
+    def _store(self, i, value):
+        # Store value only if it is read back as it is
+        if value.__class__ is not self.itemtype:
+            return False
+        try:
+            self.array[i] = value
+        except (TypeError, ValueError, OverflowError):
+            return False
+        stored = self.array.item(i)
+        return stored == value or (stored != stored and value != value)
+
+    def __setitem__(self, key, value):
+        i = self._index(key)
+        if i >= 0:
+            if self._store(i, value):
+                if not self.mask[i]:
+                    self.mask[i] = 1
+                    self.count += 1
+                self.others.pop(key, None)
+                return
+
+            if self.mask[i]:
+                self.mask[i] = 0
+                self.count -= 1
+
+        self.others[key] = value
+
+    def __delitem__(self, key):
+        i = self._index(key)
+        if i >= 0 and self.mask[i]:
+            self.mask[i] = 0
+            self.count -= 1
+        else:
+            del self.others[key]
+
+    def __iter__(self):
+        for i, has_value in enumerate(self.mask):
+            if has_value:
+                yield (i,)
+        yield from self.others
+
+    def __len__(self):
+        return self.count + len(self.others)
+
+    def clear(self):
+        self.mask[:] = bytes(len(self.mask))
+        self.count = 0
+        self.others.clear()
+
+    def take(self, indices):
+        """Return the values at integer ``indices`` in a NumPy array
+
+        :obj:`None` is returned if any of the values is missing.
+        """
+        import numpy as np
+
+        indices = np.asarray(indices)
+        if indices.dtype.kind not in "iu":
+            return None
+        if indices.size:
+            if indices.min() < 0 or indices.max() >= len(self.mask):
+                return None
+            mask = np.frombuffer(self.mask, dtype=np.bool_)
+            if not mask[indices].all():
+                return None
+
+        return self.array[indices.ravel()].reshape(indices.shape)
+
+
+class MappedData(MutableMapping):
+    """Cells data with input values in an N-dimensional array
+
+    The input value for an integer key ``(i, j, ...)`` is the element of
+    ``values`` at ``(i - offset[0], j - offset[1], ...)`` if the element
+    of ``mask`` at the same index is true, or if ``mask`` is :obj:`None`.
+    ``values`` can be a memory-mapped array, whose elements are read
+    from the file only when looked up.
+    Values stored later are kept in ``others``, and the keys in
+    the array that are deleted or overwritten are kept in ``hidden``.
+    """
+
+    __slots__ = ("values", "offset", "mask", "count", "others", "hidden")
+
+    def __init__(self, values, offset, mask=None, others=None):
+        self.values = values
+        self.offset = tuple(offset)
+        self.mask = mask
+        self.count = values.size if mask is None else int(mask.sum())
+        self.others = {} if others is None else others
+        self.hidden = set(
+            k for k in self.others if self._index(k) is not None)
+
+    def _index(self, key):
+        # Index of key in values, or None
+        offset = self.offset
+        try:
+            if len(key) != len(offset):
+                return None
+            idx = tuple(operator.index(k) - o for k, o in zip(key, offset))
+        except TypeError:
+            return None
+
+        for i, n in zip(idx, self.values.shape):
+            if not 0 <= i < n:
+                return None
+
+        if self.mask is not None and not self.mask[idx]:
+            return None
+
+        return idx
+
+    def is_mapped(self, key):
+        """True if the value for ``key`` is in the array"""
+        return self._index(key) is not None and key not in self.hidden
+
+    def iter_mapped(self):
+        """Iterate over the keys of the values in the array"""
+        import numpy as np
+
+        if self.mask is None:
+            indices = np.ndindex(self.values.shape)
+        else:
+            indices = zip(*np.nonzero(self.mask))
+
+        offset, hidden = self.offset, self.hidden
+        for idx in indices:
+            key = tuple(int(i) + o for i, o in zip(idx, offset))
+            if key not in hidden:
+                yield key
+
+    def __contains__(self, key):
+        return key in self.others or self.is_mapped(key)
+
+    def __getitem__(self, key):
+        try:
+            return self.others[key]
+        except KeyError:
+            if key in self.hidden:
+                raise
+            idx = self._index(key)
+            if idx is None:
+                raise
+
+        return self.values.item(idx)
+
+    def __setitem__(self, key, value):
+        if self.is_mapped(key):
+            self.hidden.add(key)
+        self.others[key] = value
+
+    def __delitem__(self, key):
+        if key in self.others:
+            del self.others[key]
+        elif self.is_mapped(key):
+            self.hidden.add(key)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.others
+        yield from self.iter_mapped()
+
+    def __len__(self):
+        return len(self.others) + self.count - len(self.hidden)
+
+
+class MappedKeys(MutableSet):
+    """Input keys of a Cells whose data is :class:`MappedData`
+
+    The keys of the values in the array are input keys as long as
+    the values are in the array. Other input keys are kept in ``others``.
+    """
+
+    __slots__ = ("data", "others")
+
+    def __init__(self, data, others):
+        self.data = data
+        self.others = set(others)
+
+    def __contains__(self, key):
+        return key in self.others or self.data.is_mapped(key)
+
+    def __iter__(self):
+        yield from self.others
+        yield from self.data.iter_mapped()
+
+    def __len__(self):
+        data = self.data
+        return len(self.others) + data.count - len(data.hidden)
+
+    def add(self, key):
+        if not self.data.is_mapped(key):
+            self.others.add(key)
+
+    def discard(self, key):
+        self.others.discard(key)
+
+
 class CellsMaker:
     def __init__(self, *, space, name, is_cached):
         self.space = space  # SpaceImpl
@@ -193,6 +571,46 @@ class Cells(Interface, Mapping, Callable, NodeFactory):
     def __call__(self, *args, **kwargs):
         return self._impl.get_value(args, kwargs)
 
+    def eval_many(self, *args, **kwargs):
+        """Evaluate the Cells over arrays of arguments
+
+        Arguments are passed in the same way as when calling the Cells,
+        but each argument can be an array-like object.
+        The arguments are broadcast against each other
+        by the NumPy broadcasting rules,
+        and the Cells is evaluated for each element of the broadcast
+        arguments. The values are returned in a NumPy array
+        of the broadcast shape.
+
+        The arguments are bound to the parameters only once for
+        the whole arrays. Values already in the Cells are read directly,
+        duplicate arguments are evaluated only once,
+        and the missing values are calculated in the order of the
+        elements of the broadcast arguments.
+        Dependencies are recorded in the same way as calling the Cells
+        for each element.
+
+        Example:
+            .. code-block:: python
+
+                >>> import numpy as np
+
+                >>> @mx.defcells
+                ... def bar(x, y):
+                ...     return x * y
+
+                >>> bar.eval_many(np.arange(3)[:, None], y=np.arange(2))
+                array([[0, 0],
+                       [0, 1],
+                       [0, 2]])
+
+        Returns:
+            :class:`numpy.ndarray` of the values
+
+        .. versionadded:: 0.32.0
+        """
+        return self._impl.eval_many(args, kwargs)
+
     def match(self, *args, **kwargs):
         """Returns the best matching args and their value.
 
@@ -522,6 +940,38 @@ class Cells(Interface, Mapping, Callable, NodeFactory):
         else:
             self._impl.spmgr.set_cache(self._impl, enable_cache)
 
+    @property
+    def cache_policy(self):
+        """Property to get or set the cache policy of the Cells
+
+        By default, the Cells keeps all the calculated values
+        until they are cleared, and this property is :obj:`None`.
+        Setting an :class:`~modelx.LRU` object bounds
+        the number of calculated values the Cells keeps,
+        which is useful in long runs that would otherwise exhaust memory::
+
+            >>> space.pv.cache_policy = mx.LRU(maxsize=10000)
+
+        Setting an :class:`~modelx.ArrayCache` object stores
+        the values of a Cells that has one integer parameter,
+        such as ``t``, in a NumPy array, and traces their dependency
+        for the array as a whole::
+
+            >>> space.pv.cache_policy = mx.ArrayCache(size=1200)
+
+        Setting :obj:`None` restores the default.
+        Dynamic Cells in :class:`~modelx.core.space.ItemSpace` objects
+        take the cache policy of their base Cells when they are created.
+        The cache policy is not saved with the model.
+
+        .. versionadded:: 0.32.0
+        """
+        return self._impl.cache_policy
+
+    @cache_policy.setter
+    def cache_policy(self, policy):
+        self._impl.set_cache_policy(policy)
+
     @property
     def value(self):
         """Get, set, delete the scalar value.
@@ -657,12 +1107,15 @@ class CellsImpl(*_cells_impl_base):
         "formula",
         "data",
         "input_keys",
-        "is_cached"
+        "is_cached",
+        "cache_policy",
+        "is_arrayed"
     ) + get_mixin_slots(*_cells_impl_base)
 
     def __init__(
         self, *, space, name=None, formula=None, data=None, base=None,
-        is_derived=False, is_cached=True, edit_source=True
+        is_derived=False, is_cached=True, edit_source=True,
+        is_new_observer=False
     ):
         # Side-effect-free w.r.t. the parent's cells container (D-11):
         # the caller registers self into ``space.cells``.
@@ -692,7 +1145,12 @@ class CellsImpl(*_cells_impl_base):
         )
         Derivable.__init__(self, is_derived)
 
-        AlteredFunction.__init__(self, space)
+        if is_new_observer:
+            # self cannot be in the observers yet, so skip the de-dupe
+            AlteredFunction.__init__(self, space, observe=False)
+            space.observers.append(self)
+        else:
+            AlteredFunction.__init__(self, space)
 
         try:
             # Set formula
@@ -710,11 +1168,18 @@ class CellsImpl(*_cells_impl_base):
 
             if base:
                 self.is_cached = base.is_cached
+                self.cache_policy = base.cache_policy
             else:
                 self.is_cached = is_cached
+                self.cache_policy = None
 
             # Set data
-            self.data = {}
+            if self.cache_policy is None:
+                self.data = {}
+                self.is_arrayed = False
+            else:
+                self.data = self.cache_policy.create_data({})
+                self.is_arrayed = self.cache_policy.is_arrayed
             if data is None:
                 data = {}
             self.data.update(data)
@@ -796,7 +1261,10 @@ class CellsImpl(*_cells_impl_base):
 
     def on_eval_formula(self, key):
         if self.is_cached:
-            return self._store_value(key, self.altfunc(*key))
+            value = self._store_value(key, self.altfunc(*key))
+            if self.cache_policy is not None:
+                self.cache_policy.on_store(self, key)
+            return value
         else:
             return self.altfunc(*key)
 
@@ -811,6 +1279,49 @@ class CellsImpl(*_cells_impl_base):
     def get_value_from_key(self, key):
         return self.system.executor.eval_node(key_to_node(self, key))
 
+    def eval_many(self, args, kwargs):
+        import numpy as np
+
+        boundargs = self.formula.signature.bind(*args, **kwargs)
+        boundargs.apply_defaults()
+        arrays = np.broadcast_arrays(
+            *(np.asarray(arg) for arg in boundargs.arguments.values()))
+
+        if (len(arrays) == 1 and self.is_arrayed
+                and not self.system.callstack):
+            result = self.data.take(arrays[0])
+            if result is not None:
+                return result
+
+        if arrays:
+            shape = arrays[0].shape
+            keys = list(zip(*(a.ravel().tolist() for a in arrays)))
+        else:
+            shape = ()
+            keys = [()]
+
+        result = np.array(self.get_values_from_keys(keys))
+        return result.reshape(shape + result.shape[1:])
+
+    def get_values_from_keys(self, keys):
+        """Return a list of the values for ``keys``"""
+        executor = self.system.executor
+        values = {}
+        if self.is_cached and not self.system.callstack:
+            # Cached values can be read directly at the top level,
+            # as no dependency is recorded on them.
+            data = self.data
+            for key in dict.fromkeys(keys):
+                if key in data:
+                    values[key] = data[key]
+                else:
+                    values[key] = executor.eval_node(key_to_node(self, key))
+        else:
+            for key in dict.fromkeys(keys):
+                values[key] = executor.eval_node(key_to_node(self, key))
+
+        return [values[k] for k in keys]
+
     def find_match(self, args, kwargs):
 
         node = get_node(self, args, kwargs)
@@ -841,7 +1352,8 @@ class CellsImpl(*_cells_impl_base):
         node = key_to_node(self, key)
 
         if self.system.callstack:
-            if node == self.system.callstack[-1]:
+            last = self.system.callstack[-1]
+            if last[OBJ] is self and last[KEY] == key:
                 self._store_value(key, value)
             else:
                 raise KeyError("Assignment in cells other than %s" % key)
@@ -850,8 +1362,9 @@ class CellsImpl(*_cells_impl_base):
                 targets = self.model.tracegraph.get_startnodes_from(node)
             self.clear_value_at(key)
             self._store_value(key, value)
-            self.model.tracegraph.add_node(node)
             self.input_keys.add(key)
+            self.model.tracegraph.add_node(key_to_node(self, key))
+            self.model.record_change(self)
             if self.system._recalc_dependents:
                 for trg in targets:
                     trg[OBJ].get_value_from_key(trg[KEY])
@@ -871,18 +1384,101 @@ class CellsImpl(*_cells_impl_base):
     # Clear value
 
     def on_clear_trace(self, key):
-        del self.data[key]
         if key in self.input_keys:
             self.input_keys.remove(key)
+            del self.data[key]
+            self.model.record_change(self)
+        elif self.is_arrayed:   # Clear all the calculated values
+            inputs = {k: self.data[k] for k in self.input_keys}
+            self.data.clear()
+            self.data.update(inputs)
+        elif key in self.data:
+            del self.data[key]
+        else:
+            self.data.evicted.remove(key)
+
+    @property
+    def evicted_keys(self):
+        if self.data.__class__ is LRUData:
+            return self.data.evicted
+        return ()
+
+    def evict_value_at(self, key):
+        """Delete the calculated value at ``key`` but not its node"""
+        del self.data[key]
+        if key_to_node(self, key) in self.model.tracegraph:
+            self.data.evicted.add(key)
+
+    def set_cache_policy(self, policy):
+        is_arrayed = policy is not None and policy.is_arrayed
+        if is_arrayed and len(self.formula.parameters) != 1:
+            raise ValueError(
+                "%s must have one parameter" % self.get_repr(fullname=True))
+
+        for key in list(self.evicted_keys):
+            self.model.clear_with_descs(key_to_node(self, key))
+
+        if is_arrayed or self.is_arrayed:
+            # Values are traced differently
+            self.clear_all_values(clear_input=False)
+
+        if self.data.__class__ is MappedData:
+            self.unmap_inputs()
+
+        if policy is None:
+            self.data = dict(self.data)
+        else:
+            self.data = policy.create_data(self.data)
+        self.cache_policy = policy
+        self.is_arrayed = is_arrayed
+
+    def set_input_array(self, values, offset, mask=None):
+        """Set input values in an array
+
+        The values are looked up in ``values`` without being stored
+        individually. See :class:`MappedData` for the parameters.
+        """
+        data = MappedData(values, offset, mask)
+        if self.cache_policy is not None:
+            for key in data:
+                self.set_value(key, data[key])
+            return
+
+        if self.data.__class__ is MappedData:
+            self.unmap_inputs()
 
-    def clear_all_values(self, clear_input):
         for key in list(self.data):
+            if data.is_mapped(key):
+                self.clear_value_at(key)
+
+        # Values in the array have no trace node until they are referred to
+        data.others = self.data
+        self.data = data
+        self.input_keys = MappedKeys(data, self.input_keys)
+        self.model.record_change(self)
+
+    def unmap_inputs(self):
+        """Store input values in the array individually"""
+        self.data = dict(self.data)
+        self.input_keys = set(self.input_keys)
+        self.model.tracegraph.add_nodes_from(
+            key_to_node(self, k) for k in self.input_keys)
+
+    def clear_all_values(self, clear_input):
+        if self.data.__class__ is MappedData and not clear_input:
+            keys = list(self.data.others)   # Values in the array are inputs
+        else:
+            keys = list(self.data)
+        keys.extend(self.evicted_keys)
+        for key in keys:
             self.clear_value_at(key, clear_input)
 
     def clear_value_at(self, key, clear_input=True):
         if self.has_node(key):
             if clear_input or (key not in self.input_keys):
                 self.model.clear_with_descs(key_to_node(self, key))
+        elif key in self.evicted_keys:
+            self.model.clear_with_descs(key_to_node(self, key))
 
     # ----------------------------------------------------------------------
     # Pandas I/O
@@ -919,7 +1515,22 @@ class CellsImpl(*_cells_impl_base):
     def check_sanity(self):
         # Check consistency between data elements and nodes in trace graph
         nodes = self.model.tracegraph.get_nodes_with(self)
-        assert set(self.data.keys()) == set(n[KEY] for n in nodes)
+        if self.is_arrayed:
+            assert set(self.input_keys) == set(
+                n[KEY] for n in nodes if n.__class__ is not ArrayNode)
+            assert (len(self.data) > len(self.input_keys)) == any(
+                n.__class__ is ArrayNode for n in nodes)
+        elif self.data.__class__ is MappedData:
+            keys = set(n[KEY] for n in nodes)
+            assert keys <= set(self.data.keys())
+            assert set(self.data.others.keys()) <= keys
+        else:
+            keys = set(n[KEY] for n in nodes)
+            assert not self.evicted_keys & self.data.keys()
+            if self.model.is_untraced:  # Untraced values have no node
+                assert keys <= set(self.data.keys()) | set(self.evicted_keys)
+            else:
+                assert set(self.data.keys()) | set(self.evicted_keys) == keys
         return True
 
 
@@ -949,6 +1560,7 @@ class UserCellsImpl(CellsImpl):
         newsrc = self.formula._reload(module).source
         if oldsrc != newsrc:
             self.model.clear_obj(self)
+            self.model.record_change(self)
 
     def set_doc(self, doc, insert_indents=False):
 
@@ -1030,6 +1642,18 @@ class UserCellsImpl(CellsImpl):
 class DynamicCellsImpl(CellsImpl):
     __slots__ = ()
 
+    @classmethod
+    def from_base(cls, space, base):
+        """Create a cells in the dynamic ``space`` derived from ``base``
+
+        Equivalent to ``cls(space=space, base=base, is_derived=True)``,
+        except that the new cells is added to the observers of ``space``
+        without checking if it is already there, which speeds up
+        creating ItemSpaces with many cells.
+        """
+        return cls(space=space, base=base, is_derived=True,
+                   is_new_observer=True)
+
 
 def shareable_parameters(cells):
     """Return parameter names if the parameters are shareable among cells.
@@ -20,11 +20,85 @@
 # A copy of the license is also included in this package.
 
 import _collections_abc
+import weakref
 from reprlib import recursive_repr as _recursive_repr
 
 # Modified from ChainMap:
 # * custom slots support
 # * Add get_map_from_key and get_map_index_from_key
+# * Look up keys in a flattened dict when all the maps are ChainedDict
+
+
+class ChainedDict(dict):
+    """dict to notify the CustomChainMap objects chaining it of changes
+
+    Changing the dict discards the flattened dicts of the
+    CustomChainMap objects that looked up keys in it since its
+    last change, and increments ``version``.
+    """
+    __slots__ = ("version", "chainmaps", "_maxlen")
+
+    def __init__(self, *args, **kwargs):
+        self.version = 0
+        self.chainmaps = []     # weakrefs to CustomChainMap
+        self._maxlen = 16
+        dict.__init__(self, *args, **kwargs)
+
+    def __reduce__(self):
+        # Items are set after self is created, as they may refer to self
+        return self.__class__, (), None, None, iter(self.items())
+
+    def add_chainmap(self, chainmap):
+        chainmaps = self.chainmaps
+        chainmaps.append(weakref.ref(chainmap))
+        if len(chainmaps) > self._maxlen:
+            # Remove deleted CustomChainMap objects
+            self.chainmaps = [r for r in chainmaps if r() is not None]
+            self._maxlen = 2 * len(self.chainmaps) + 16
+
+    def _notify(self):
+        self.version += 1
+        if self.chainmaps:
+            for ref in self.chainmaps:
+                m = ref()
+                if m is not None:
+                    m._flat = None
+            self.chainmaps = []
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._notify()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._notify()
+
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        self._notify()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._notify()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = dict.setdefault(self, key, default)
+        self._notify()
+        return value
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._notify()
+
+    def clear(self):
+        dict.clear(self)
+        self._notify()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
 
 
 class CustomChainMap(_collections_abc.MutableMapping):
@@ -39,8 +113,13 @@ class CustomChainMap(_collections_abc.MutableMapping):
     In contrast, writes, updates, and deletions only operate on the first
     mapping.
 
+    When all the mappings are ChainedDict, lookups are made in a dict
+    flattened from the mappings, which is created on the first lookup
+    after any of the mappings is changed. The maps list must not be
+    updated after initialization.
+
     '''
-    __slots__ = ("maps",)
+    __slots__ = ("maps", "_flat", "_versions", "__weakref__")
 
     def __init__(self, *maps):
         '''Initialize a ChainMap by setting *maps* to the given mappings.
@@ -48,11 +127,46 @@ class CustomChainMap(_collections_abc.MutableMapping):
 
         '''
         self.maps = list(maps) or [{}]          # always at least one map
+        self._flat = None
+        if all(isinstance(m, ChainedDict) for m in self.maps):
+            # Versions of the maps when self was added to them
+            self._versions = [None] * len(self.maps)
+        else:
+            self._versions = None
+
+    def __getstate__(self):
+        return self.maps
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):    # Pickled before flattening
+            state = state[1]["maps"]
+        self.__init__(*state)
+
+    def _get_flat(self):
+        flat = self._flat
+        if flat is None and self._versions is not None:
+            versions = self._versions
+            for i, mapping in enumerate(self.maps):
+                if versions[i] != mapping.version:
+                    mapping.add_chainmap(self)
+                    versions[i] = mapping.version
+            flat = {}
+            for mapping in reversed(self.maps):
+                flat.update(mapping)
+            self._flat = flat
+        return flat
 
     def __missing__(self, key):
         raise KeyError(key)
 
     def __getitem__(self, key):
+        flat = self._flat or self._get_flat()
+        if flat is not None:
+            try:
+                return flat[key]
+            except KeyError:
+                return self.__missing__(key)
+
         for mapping in self.maps:
             try:
                 return mapping[key]             # can't use 'key in mapping' with defaultdict
@@ -61,18 +175,30 @@ class CustomChainMap(_collections_abc.MutableMapping):
         return self.__missing__(key)            # support subclasses that define __missing__
 
     def get(self, key, default=None):
+        flat = self._flat or self._get_flat()
+        if flat is not None:
+            return flat.get(key, default)
         return self[key] if key in self else default
 
     def __len__(self):
+        flat = self._flat or self._get_flat()
+        if flat is not None:
+            return len(flat)
         return len(set().union(*self.maps))     # reuses stored hash values if possible
 
     def __iter__(self):
+        flat = self._flat or self._get_flat()
+        if flat is not None:
+            return iter(flat)
         d = {}
         for mapping in reversed(self.maps):
             d.update(mapping)                   # reuses stored hash values if possible
         return iter(d)
 
     def __contains__(self, key):
+        flat = self._flat or self._get_flat()
+        if flat is not None:
+            return key in flat
         return any(key in m for m in self.maps)
 
     def __bool__(self):
@@ -0,0 +1,61 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class ChangeLog:
+    """Per-model record of the static spaces changed for writing.
+
+    Each change is numbered by :attr:`serial`. The number of the last
+    change is kept for each UserSpace whose files the change affects:
+
+    - Edits run through the edit pipeline record the spaces in their
+      ChangeSets (``ModelEditor._record_changes``). Edits that can
+      change the files of other spaces, such as renaming and
+      deleting members, record all the spaces as changed.
+    - Changes made outside the pipeline, such as input values,
+      docstrings and space formulas, record the spaces of the changed
+      objects (:meth:`ModelImpl.record_change`).
+
+    Incremental writing keeps the state of each write in :attr:`writes`
+    and skips encoding the spaces not changed since the write.
+    Values changed in place, such as a list assigned to
+    a reference, are not recorded as changes.
+
+    Not pickled: unpickled models start with no writes to skip.
+    """
+
+    __slots__ = ("model", "serial", "all_changed", "spaces", "writes")
+
+    def __init__(self, model):
+        self.model = model
+        self.serial = 0
+        self.all_changed = 0    # Serial of the last change to all spaces
+        self.spaces = {}        # space -> serial of its last change
+        self.writes = {}        # path -> state of the last write to it
+
+    def __reduce__(self):
+        return self.__class__, (self.model,)
+
+    def record(self, space=None):
+        """Record a change to ``space`` or to all spaces if ``None``"""
+        self.serial += 1
+        if space is None:
+            self.all_changed = self.serial
+            self.spaces.clear()
+        else:
+            self.spaces[space] = self.serial
+
+    def last_changed(self, space):
+        """Return the serial of the last change to ``space``"""
+        return max(self.all_changed, self.spaces.get(space, 0))
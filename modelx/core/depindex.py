@@ -0,0 +1,101 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class DependencyIndex:
+    """Per-model index of the objects the formulas refer to by name.
+
+    The referents of the formula of a Cells or a UserSpace are the
+    Cells, Spaces and References that the global names in the formula
+    resolve to in the namespace of the formula's space
+    (:meth:`AlteredFunction._get_referents`). They are computed once
+    and kept until either:
+
+    - the namespace of the space is invalidated, which discards the
+      entries of the space and its Cells
+      (:meth:`UserSpaceImpl.on_ns_invalidated` calls :meth:`discard`),
+      or
+    - the formula is changed, which replaces the function of the
+      formula, detected by comparing the function kept in the entry.
+
+    Edits reach the index through the edit pipeline's batched
+    namespace invalidation, so entries of spaces not touched by an
+    edit survive it.
+
+    Only static objects are indexed. The formulas of dynamic objects
+    are those of their bases.
+
+    Not pickled: unpickled models start with an empty index.
+    """
+
+    __slots__ = ("model", "_entries")
+
+    def __init__(self, model):
+        self.model = model
+        self._entries = {}  # space -> {impl: (altfunc, referents)}
+
+    def __reduce__(self):
+        return self.__class__, (self.model,)
+
+    def discard(self, space):
+        self._entries.pop(space, None)
+
+    def get_referents(self, impl):
+        space = impl.ns_server
+        if space.is_dynamic():
+            return impl._get_referents()
+
+        entries = self._entries.get(space)
+        if entries is None:
+            entries = self._entries[space] = {}
+
+        altfunc = impl.altfunc
+        entry = entries.get(impl)
+        if entry is None or entry[0] is not altfunc:
+            entry = entries[impl] = (altfunc, impl._get_referents())
+        return entry[1]
+
+    def iter_formulas(self):
+        """Yield static Cells and UserSpaces that have formulas"""
+        for space in self.model.yield_spaces():
+            if space.formula is not None:
+                yield space
+            for cells in space.cells.values():
+                if cells.formula is not None:
+                    yield cells
+
+    def get_graph(self):
+        """Directed graph from the referents to the referrers
+
+        The nodes are :class:`~modelx.core.node.ObjectNode` objects
+        of the Cells, Spaces and References.
+        Entries of deleted objects are dropped.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        entries = {}
+        for impl in self.iter_formulas():
+            referents = self.get_referents(impl)
+            space = impl.ns_server
+            entries.setdefault(space, {})[impl] = self._entries[space][impl]
+
+            node = impl.to_node()
+            graph.add_node(node)
+            for kind in ("cells", "spaces", "refs"):
+                for obj in referents[kind].values():
+                    graph.add_edge(obj.to_node(), node)
+
+        self._entries = entries
+        return graph
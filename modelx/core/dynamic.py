@@ -31,7 +31,7 @@ from modelx.core.base import (
     get_mixin_slots,
     Interface,
 )
-from modelx.core.chainmap import CustomChainMap
+from modelx.core.chainmap import CustomChainMap, ChainedDict
 from modelx.core.reference import ReferenceImpl
 from modelx.core.cells import DynamicCellsImpl
 from modelx.core.util import is_valid_name
@@ -107,13 +107,16 @@ class DynamicSpaceImpl(BaseSpaceImpl):
 
     def _init_cells(self):
         for base in self._dynbase.cells.values():
-            cells = DynamicCellsImpl(space=self, base=base, is_derived=True)
+            cells = DynamicCellsImpl.from_base(self, base)
             self.cells[cells.name] = cells
-            self.on_notify(self.cells)
+        # The new cells have nothing to invalidate,
+        # so only the namespace of self is invalidated without notifying.
+        self._is_ns_updated = False
+        self.on_ns_invalidated()
 
     def _init_refs(self, arguments=None):
         self._allargs = self._init_allargs()
-        self._dynbase_refs = {}
+        self._dynbase_refs = ChainedDict()
         self.refs = CustomChainMap(
                 *self._allargs.maps,     # underlying parent's _allargs
                 self.own_refs,
@@ -294,7 +297,7 @@ class ItemSpaceImpl(DynamicSpaceImpl):
             self.tree_dynbases = None
 
     def _init_refs(self, arguments=None):
-        args = {}
+        args = ChainedDict()
         for k, v in arguments.items():
             args[k] = ReferenceImpl(self, k, v, container=args)
         self._arguments = args
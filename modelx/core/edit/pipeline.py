@@ -52,6 +52,7 @@ class Edit:
     """
 
     result = None
+    is_local = False    # Changes only the files of the spaces it marks
 
     def validate(self, model, txn):
         pass
@@ -84,8 +85,30 @@ class ModelEditor:
             raise
         txn.commit()
         self._finalize(txn.changes)
+        self._record_changes(edit, txn.changes)
         return edit.result
 
+    def _record_changes(self, edit, changes):
+        """Record the spaces whose files the edit changed
+
+        Edits that are not local, such as renaming and deleting members,
+        can change the files of any space referring to the members,
+        so all the spaces are recorded.
+        """
+        model = self.model
+        if not edit.is_local:
+            model.record_change()
+            return
+
+        for impl in itertools.chain(
+                changes.created, changes.removed, changes.modified):
+            model.record_change(impl)
+        for parent, _ in changes.dirty_containers:
+            model.record_change(parent)
+        for space in itertools.chain(
+                changes.dirty_spaces.values(), changes.dirty_bases.values()):
+            model.record_change(space)
+
     def _finalize(self, changes):
         """Post-commit side effects; must not fail the edit."""
         model = self.model
@@ -153,6 +176,8 @@ class ModelEditor:
 class NewRef(Edit):
     """Create a reference in a space and derive it into sub spaces."""
 
+    is_local = True
+
     def __init__(self, space, name, value, refmode, register=False):
         self.space = space
         self.name = name
@@ -187,6 +212,8 @@ class NewRef(Edit):
 class ChangeRef(Edit):
     """Assign a new value to an existing reference in a space."""
 
+    is_local = True
+
     def __init__(self, space, name, value, refmode, rebind=False):
         self.space = space
         self.name = name
@@ -212,6 +239,8 @@ class ChangeRef(Edit):
 class DelRef(Edit):
     """Delete a reference from a space and re-derive its sub spaces."""
 
+    is_local = True
+
     def __init__(self, space, name, unregister=False):
         self.space = space
         self.name = name
@@ -245,6 +274,8 @@ class DelRef(Edit):
 class NewCells(Edit):
     """Create a cells in a space and derive it into sub spaces."""
 
+    is_local = True
+
     def __init__(self, space, name=None, formula=None, data=None,
                  is_derived=False, is_cached=True, edit_source=True):
         self.space = space
@@ -362,6 +393,8 @@ class RenameCells(Edit):
 class SetCellsProperty(Edit):
     """Set formula and/or is_cached on a cells and its derived cells."""
 
+    is_local = True
+
     def __init__(self, cells, flags, func, enable_cache):
         self.cells = cells
         self.flags = flags
@@ -711,6 +744,8 @@ class DelSpace(Edit):
 class NewGlobalRef(Edit):
     """Create a global reference on the model."""
 
+    is_local = True
+
     def __init__(self, model, name, value, register=False):
         self.name = name
         self.value = value
@@ -730,6 +765,8 @@ class NewGlobalRef(Edit):
 class DelGlobalRef(Edit):
     """Delete a global reference from the model."""
 
+    is_local = True
+
     def __init__(self, model, name, unregister=False):
         self.name = name
         self.unregister = unregister
@@ -746,6 +783,8 @@ class DelGlobalRef(Edit):
 class ChangeGlobalRef(Edit):
     """Assign a new value to an existing global reference."""
 
+    is_local = True
+
     def __init__(self, model, name, value, rebind=False):
         self.name = name
         self.value = value
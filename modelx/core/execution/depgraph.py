@@ -0,0 +1,327 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact directed graph for dependency tracking
+
+:class:`DependencyGraph` stores the trace and reference graphs of a model.
+It implements the subset of the :class:`networkx.DiGraph` interface
+that modelx uses, but instead of dict-of-dict adjacency keyed by node
+objects, each node is interned to an integer ID and its successors and
+predecessors are kept in plain lists of IDs, indexed by the node ID.
+No attribute dicts are allocated for nodes or edges.
+
+IDs of removed nodes are recycled, so the adjacency lists stay dense
+while nodes are repeatedly added and cleared.
+"""
+
+_EMPTY = ()
+
+
+class NodeView:
+    """Set-like view of the nodes in a :class:`DependencyGraph`
+
+    Calling the view returns itself, so both ``graph.nodes`` and
+    ``graph.nodes()`` work as with networkx.
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __call__(self):
+        return self
+
+    def __iter__(self):
+        return iter(self._graph._index)
+
+    def __len__(self):
+        return len(self._graph._index)
+
+    def __contains__(self, node):
+        return self._graph.has_node(node)
+
+
+class EdgeView:
+    """Set-like view of the edges in a :class:`DependencyGraph`"""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __call__(self):
+        return self
+
+    def __iter__(self):
+        g = self._graph
+        nodes = g._nodes
+        for u, uid in g._index.items():
+            for vid in g._succ[uid] or _EMPTY:
+                yield u, nodes[vid]
+
+    def __len__(self):
+        return sum(len(s) for s in self._graph._succ if s)
+
+    def __contains__(self, edge):
+        return self._graph.has_edge(*edge)
+
+
+class DependencyGraph:
+    """Directed graph with integer-indexed list adjacency"""
+
+    __slots__ = ("_index", "_nodes", "_succ", "_pred", "_free")
+
+    def __init__(self):
+        self._index = {}    # node -> ID, in insertion order
+        self._nodes = []    # ID -> node, None if the ID is free
+        self._succ = []     # ID -> list of successor IDs or None
+        self._pred = []     # ID -> list of predecessor IDs or None
+        self._free = []     # IDs available for reuse
+
+    # ----------------------------------------------------------------------
+    # Nodes
+
+    def _intern(self, node):
+        try:
+            return self._index[node]
+        except KeyError:
+            pass
+
+        if self._free:
+            nid = self._free.pop()
+            self._nodes[nid] = node
+        else:
+            nid = len(self._nodes)
+            self._nodes.append(node)
+            self._succ.append(None)
+            self._pred.append(None)
+
+        self._index[node] = nid
+        return nid
+
+    def add_node(self, node):
+        self._intern(node)
+
+    def add_nodes_from(self, nodes):
+        for n in nodes:
+            self._intern(n)
+
+    def remove_node(self, node):
+        nid = self._index.pop(node)
+
+        succ, pred = self._succ, self._pred
+        for s in succ[nid] or _EMPTY:
+            pred[s].remove(nid)
+        for p in pred[nid] or _EMPTY:
+            succ[p].remove(nid)
+
+        self._nodes[nid] = None
+        succ[nid] = pred[nid] = None
+        self._free.append(nid)
+
+    def remove_nodes_from(self, nodes):
+        for n in nodes:
+            if n in self._index:
+                self.remove_node(n)
+
+    def has_node(self, node):
+        try:
+            return node in self._index
+        except TypeError:   # unhashable node, as in networkx
+            return False
+
+    __contains__ = has_node
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def number_of_nodes(self):
+        return len(self._index)
+
+    @property
+    def nodes(self):
+        return NodeView(self)
+
+    def clear(self):
+        self.__init__()
+
+    # ----------------------------------------------------------------------
+    # Edges
+
+    def add_edge(self, u, v):
+        uid = self._intern(u)
+        vid = self._intern(v)
+        if uid == vid:  # Self-loops are not recorded
+            return
+
+        succ = self._succ[uid]
+        pred = self._pred[vid]
+
+        if succ is None:
+            self._succ[uid] = [vid]
+        elif pred is None:
+            succ.append(vid)
+        # Scan the shorter list for an existing edge
+        elif len(succ) <= len(pred):
+            if vid in succ:
+                return
+            succ.append(vid)
+        else:
+            if uid in pred:
+                return
+            succ.append(vid)
+
+        if pred is None:
+            self._pred[vid] = [uid]
+        else:
+            pred.append(uid)
+
+    def has_edge(self, u, v):
+        index = self._index
+        if self.has_node(u) and self.has_node(v):
+            succ = self._succ[index[u]]
+            return bool(succ) and index[v] in succ
+        return False
+
+    @property
+    def edges(self):
+        return EdgeView(self)
+
+    def number_of_edges(self):
+        return sum(len(s) for s in self._succ if s)
+
+    # ----------------------------------------------------------------------
+    # Adjacency
+
+    def successors(self, node):
+        nodes = self._nodes
+        return iter([nodes[i] for i in self._succ[self._index[node]] or _EMPTY])
+
+    def predecessors(self, node):
+        nodes = self._nodes
+        return iter([nodes[i] for i in self._pred[self._index[node]] or _EMPTY])
+
+    def out_degree(self, node):
+        return len(self._succ[self._index[node]] or _EMPTY)
+
+    def in_degree(self, node):
+        return len(self._pred[self._index[node]] or _EMPTY)
+
+    def degree(self, node):
+        nid = self._index[node]
+        return len(self._succ[nid] or _EMPTY) + len(self._pred[nid] or _EMPTY)
+
+    # ----------------------------------------------------------------------
+    # Traversal
+
+    def _postorder_ids(self, nid):
+        succ = self._succ
+        visited = {nid}
+        result = []
+        stack = [(nid, iter(succ[nid] or _EMPTY))]
+        while stack:
+            parent, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(succ[child] or _EMPTY)))
+                    break
+            else:
+                stack.pop()
+                result.append(parent)
+
+        return result
+
+    def dfs_postorder_nodes(self, source):
+        """Return the nodes reachable from ``source`` in DFS postorder
+
+        ``source`` is included as the last element.
+        The order is the same as :func:`networkx.dfs_postorder_nodes`.
+        """
+        nodes = self._nodes
+        return [nodes[i] for i in self._postorder_ids(self._index[source])]
+
+    def any_reachable(self, source, pred):
+        """Return :obj:`True` if ``pred`` is true for any node reachable
+
+        ``source`` is included. The search stops at the first node
+        for which ``pred`` is true.
+        """
+        nodes, succ = self._nodes, self._succ
+        nid = self._index[source]
+        visited = {nid}
+        stack = [nid]
+        while stack:
+            nid = stack.pop()
+            if pred(nodes[nid]):
+                return True
+            for child in succ[nid] or _EMPTY:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
+        return False
+
+    def descendants(self, source):
+        """Return the set of nodes reachable from ``source``"""
+        nodes = self._nodes
+        nid = self._index[source]
+        return set(nodes[i] for i in self._postorder_ids(nid) if i != nid)
+
+    def topological_sort(self, nodes=None):
+        """Return a list of ``nodes`` sorted topologically
+
+        Only the edges between ``nodes`` are considered.
+        If ``nodes`` is not given, all the nodes are sorted.
+        The order is the same as :func:`networkx.topological_sort`
+        applied to the subgraph induced by ``nodes``.
+        """
+        index = self._index
+        if nodes is None:
+            ids = list(index.values())
+        else:
+            nodes = set(nodes)
+            ids = [i for n, i in index.items() if n in nodes]
+
+        members = set(ids)
+        succ, pred = self._succ, self._pred
+
+        indegree = {}
+        zero_indegree = []
+        for i in ids:
+            d = sum(1 for p in pred[i] or _EMPTY if p in members)
+            if d:
+                indegree[i] = d
+            else:
+                zero_indegree.append(i)
+
+        result = []
+        while zero_indegree:
+            result.extend(zero_indegree)
+            generation, zero_indegree = zero_indegree, []
+            for i in generation:
+                for child in succ[i] or _EMPTY:
+                    if child in indegree:
+                        indegree[child] -= 1
+                        if not indegree[child]:
+                            zero_indegree.append(child)
+                            del indegree[child]
+
+        if indegree:
+            raise ValueError("Graph contains a cycle")
+
+        return [self._nodes[i] for i in result]
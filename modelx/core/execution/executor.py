@@ -8,7 +8,7 @@ from typing import Optional
 import modelx   # https://bugs.python.org/issue18145
 from modelx.core.errors import DeepReferenceError, FormulaError
 from modelx.core.execution.trace import (
-    OBJ, KEY, get_node_repr, TraceGraph, ReferenceGraph, TraceNode
+    OBJ, KEY, get_node_repr, TraceGraph, ReferenceGraph, TraceNode, ArrayNode
 )
 
 
@@ -25,6 +25,51 @@ class NonThreadedExecutor:
         self.refgraph: Optional[ReferenceGraph] = None
         self.is_formula_error_used = True
         self.is_formula_error_handled = False
+        self.is_tracing: bool = True
+        self.blocked_evictions = set()  # Nodes not evictable until return
+        self.deferred_evictions = {}
+
+    def set_tracing(self, tracing: bool):
+        """Switch dependency tracing on or off
+
+        When tracing is off, :meth:`eval_node` is shadowed by
+        :meth:`eval_node_untraced` and the call stack must be
+        an :class:`UntracedCallStack`.
+        """
+        self.is_tracing = tracing
+        if tracing:
+            if "eval_node" in self.__dict__:
+                del self.eval_node
+        else:
+            self.eval_node = self.eval_node_untraced
+
+    def defer_eviction(self, obj, evict):
+        """Call ``evict`` when the top-level calculation returns
+
+        ``evict`` is called once for each ``obj`` to evict the values
+        that were kept because they were used in the calculation.
+        """
+        self.deferred_evictions[obj] = evict
+
+    def _evict_deferred(self):
+        self.blocked_evictions.clear()
+        while self.deferred_evictions:
+            _, evict = self.deferred_evictions.popitem()
+            evict()
+        self.blocked_evictions.clear()
+
+    def eval_node_untraced(self, node: TraceNode):
+
+        obj = node[OBJ]
+        key = node[KEY]
+
+        if obj.is_cached and obj.has_node(key):
+            return obj.data[key]
+        elif self.is_executing:
+            return self._eval_formula(node)
+        else:
+            obj.model.is_untraced = True
+            return self._start_exec(node)
 
     def eval_node(self, node: TraceNode):
 
@@ -80,6 +125,7 @@ class NonThreadedExecutor:
             self.is_executing = False
             self.tracegraph = None
             self.refgraph = None
+            self._evict_deferred()
 
         assert not self.callstack
         assert not self.callstack.counter
@@ -118,7 +164,7 @@ class NonThreadedExecutor:
             return self.buffer
 
     def add_reference(self, ref):
-        if self.is_executing:
+        if self.is_executing and self.is_tracing:
             self.refstack.append((self.callstack.counter - 1, ref))
         return ref
 
@@ -211,6 +257,7 @@ class ThreadedExecutor(NonThreadedExecutor):
             self.is_executing = False
             self.tracegraph = None
             self.refgraph = None
+            self._evict_deferred()
 
 
 class CallStack(deque):
@@ -297,7 +344,8 @@ class CallStack(deque):
         obj = node[OBJ]
 
         graph = self.executor.tracegraph
-        if graph.has_node(node):
+        if graph.has_node(node) and not (
+                _is_array_in_use(node) or _is_evicted(node)):
             graph.remove_node(node)
 
         while self.refstack:
@@ -327,6 +375,49 @@ class CallStack(deque):
         return result
 
 
+class UntracedCallStack(CallStack):
+    """Call stack that records no dependency
+
+    Used while dependency tracing is turned off. Nothing is added to
+    the trace graph or to the reference graph. The calculated values
+    are cleared all together when the model is changed.
+    """
+
+    def append(self, item):
+
+        if len(self) > self.maxdepth:
+            raise DeepReferenceError(
+                "Formula chain exceeded the %s limit" % self.maxdepth)
+
+        deque.append(self, item)
+        self.counter += 1
+
+    def pop(self):
+        node = deque.pop(self)
+        self.counter -= 1
+        return node
+
+    def rollback(self):
+        node = deque.pop(self)
+        self.executor.rolledback.append(node)
+        self.counter -= 1
+
+        graph = self.executor.tracegraph
+        if graph.has_node(node) and not (
+                _is_array_in_use(node) or _is_evicted(node)):
+            graph.remove_node(node)
+
+
+def _is_array_in_use(node):
+    # The node of an array stands for the other values in the array
+    return node.__class__ is ArrayNode and node.has_values()
+
+
+def _is_evicted(node):
+    # The node of an evicted value links its dependents to its precedents
+    return node[KEY] in node[OBJ].evicted_keys
+
+
 if sys.version_info < (3, 7, 0):
     _trace_time = time.time
 else:
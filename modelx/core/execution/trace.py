@@ -14,7 +14,7 @@
 
 from collections import deque
 from typing import Any, Tuple, Dict, Union
-import networkx as nx
+from modelx.core.execution.depgraph import DependencyGraph
 
 
 TraceKey = Tuple[Any, ...]
@@ -28,6 +28,12 @@ class TraceObject:
     is_cached: bool
     data: Dict[TraceKey, Any]
 
+    # Keys of evicted values whose nodes are kept in the trace graph
+    evicted_keys = ()
+
+    # True if calculated values are traced as a whole by an ArrayNode
+    is_arrayed: bool = False
+
     def has_node(self, key: TraceKey) -> bool:
         raise NotImplementedError
 
@@ -44,8 +50,37 @@ OBJ = 0
 KEY = 1
 
 
+class ArrayNode(tuple):
+    """Trace node of a calculated value of an arrayed object
+
+    The calculated values of an object whose ``is_arrayed`` is
+    :obj:`True` are stored in an array and traced as a whole.
+    All the ArrayNodes of the same object compare equal regardless of
+    their keys, so the trace graph has only one node for the array,
+    which holds the key of the value that was traced first.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(self[OBJ])
+
+    def __eq__(self, other):
+        return other.__class__ is ArrayNode and self[OBJ] is other[OBJ]
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def has_values(self):
+        """Return :obj:`True` if the array has calculated values"""
+        obj = self[OBJ]
+        return len(obj.data) > len(obj.input_keys)
+
+
 def key_to_node(obj: TraceObject, key: TraceKey) -> TraceNode:
     """Return node form object ane ky"""
+    if obj.is_arrayed and key not in obj.input_keys:
+        return ArrayNode((obj, key))
     return obj, key
 
 
@@ -57,6 +92,8 @@ def get_node(obj: TraceObject, args, kwargs) -> TraceNode:
 
     if kwargs is None:
         kwargs = {}
+    if obj.is_arrayed:
+        return key_to_node(obj, _bind_args(obj, args, kwargs))
     return obj, _bind_args(obj, args, kwargs)
 
 
@@ -89,9 +126,7 @@ def tuplize_key(obj, key, remove_extra=False):
 
 
 def _bind_args(obj: TraceObject, args, kwargs) -> TraceKey:
-    boundargs = obj.formula.signature.bind(*args, **kwargs)
-    boundargs.apply_defaults()
-    return tuple(boundargs.arguments.values())
+    return obj.formula.bind_key(args, kwargs)
 
 
 def get_node_repr(node: TraceNode) -> str:
@@ -112,45 +147,35 @@ def get_node_repr(node: TraceNode) -> str:
         return name + "(" + arglist + ")"
 
 
-class TraceGraph(nx.DiGraph):
+class TraceGraph(DependencyGraph):
     """Directed Graph of ObjectArgs"""
 
+    __slots__ = ()
+
     NODE = 1
     EDGE = 2
 
     def get_nodes_with(self, obj):
         """Return nodes with `obj`."""
-        result = set()
-
-        if nx.__version__[0] == "1":
-            nodes = self.nodes_iter()
-        else:
-            nodes = self.nodes
-
-        for node in nodes:
-            if node[OBJ] == obj:
-                result.add(node)
-        return result
+        return set(node for node in self._index if node[OBJ] == obj)
 
     def get_startnodes_from(self, node):
         if node in self:
-            return [n for n in nx.descendants(self, node)
+            return [n for n in self.descendants(node)
                     if self.out_degree(n) == 0]
         else:
             return []
 
-    def fresh_copy(self):
-        """Overriding Graph.fresh_copy"""
-        return TraceGraph()
 
+class ReferenceGraph(DependencyGraph):
 
-class ReferenceGraph(nx.DiGraph):
+    __slots__ = ()
 
     def remove_with_descs(self, ref):
         if ref not in self:
             return deque()
 
-        descs = deque(nx.dfs_postorder_nodes(self, ref)) # includes ref
+        descs = deque(self.dfs_postorder_nodes(ref)) # includes ref
         self.remove_nodes_from(descs)
         descs.pop()     # remove ref
 
@@ -177,16 +202,40 @@ class TraceManager:
     __slots__ = ()
     __mixin_slots = (
         "tracegraph",
-        "refgraph"
+        "refgraph",
+        "is_untraced"
     )
 
     def __init__(self):
         self.tracegraph: TraceGraph = TraceGraph()
         self.refgraph: ReferenceGraph = ReferenceGraph()
+        self.is_untraced: bool = False
+
+    def on_clear_untraced(self) -> None:
+        """Clear all the calculated values of the model.
+
+        Called before clearing any value when values have been
+        calculated with dependency tracing turned off.
+        """
+        raise NotImplementedError
+
+    def _clear_untraced(self):
+        # Reset first, as on_clear_untraced calls back the clear methods
+        self.is_untraced = False
+        self.on_clear_untraced()
 
     def clear_with_descs(self, node):
         """Clear values and nodes calculated from `source`."""
-        for n in list(nx.dfs_postorder_nodes(self.tracegraph, node)):
+        if self.is_untraced:
+            self._clear_untraced()
+
+        if node not in self.tracegraph:
+            # Calculated untraced, or an input in an array not referred to
+            if node[OBJ].has_node(node[KEY]):
+                node[OBJ].on_clear_trace(node[KEY])
+            return
+
+        for n in self.tracegraph.dfs_postorder_nodes(node):
             self.tracegraph.remove_node(n)
             self.refgraph.remove_with_referred(n)
             n[OBJ].on_clear_trace(n[KEY])
@@ -200,6 +249,9 @@ class TraceManager:
         the flag before a deferred clear (the values were recorded under
         the pre-flip flag).
         """
+        if self.is_untraced:
+            self._clear_untraced()
+
         if is_cached is None:
             is_cached = obj.is_cached
         if not is_cached:
@@ -207,40 +259,83 @@ class TraceManager:
             return
 
         keys = deque(obj.data)
+        keys.extend(obj.evicted_keys)
         removed = set()
 
         while keys:
             k = keys.popleft()
-            if (obj, k) not in removed:
-                for n in list(nx.dfs_postorder_nodes(self.tracegraph, (obj, k))):
+            node = key_to_node(obj, k)
+            if node not in self.tracegraph:
+                if obj.has_node(k):     # Input in an array
+                    obj.on_clear_trace(k)
+            elif node not in removed:
+                for n in self.tracegraph.dfs_postorder_nodes(node):
                     self.tracegraph.remove_node(n)
                     self.refgraph.remove_with_referred(n)
                     n[OBJ].on_clear_trace(n[KEY])
                     removed.add(n)
 
     def clear_attr_referrers(self, ref):
+        if self.is_untraced:
+            self._clear_untraced()
+
         descs = self.refgraph.remove_with_descs(ref)
         while descs:
             node = descs.popleft()
             if node in self.tracegraph:
-                for n in list(nx.dfs_postorder_nodes(self.tracegraph, node)):
+                for n in self.tracegraph.dfs_postorder_nodes(node):
                     self.tracegraph.remove_node(n)
                     n[OBJ].on_clear_trace(n[KEY])
 
+    def get_precedents(self, targets):
+        """Return the calculated nodes that ``targets`` depend on
+
+        The nodes are collected from the trace graph by following
+        the edges backward from ``targets``, so the values of ``targets``
+        must have been calculated with dependency tracing turned on.
+        ``targets`` are included. Nodes of input values are excluded.
+        """
+        graph = self.tracegraph
+        visited = set()
+        stack = [n for n in targets if n in graph]
+        result = []
+        while stack:
+            n = stack.pop()
+            if n in visited:
+                continue
+            visited.add(n)
+            # ItemSpace nodes have no input keys
+            if n[KEY] not in getattr(n[OBJ], "input_keys", ()):
+                result.append(n)
+            stack.extend(graph.predecessors(n))
+
+        return result
+
     def get_calcsteps(self, targets, nodes, step_size):
         """ Get calculation steps
         Calculate a new block
         Find nodes to paste in the block
         Find nodes to clear from the earlier blocks
         Push the paste node in the earlier blocks
+
+        If ``nodes`` is :obj:`None`, the nodes are
+        collected from the trace graph by :meth:`get_precedents`.
         """
         from modelx.core.node import ItemNode
-        subgraph = self.tracegraph.subgraph(nodes)
+        graph = self.tracegraph
+        if nodes is None:
+            nodes = self.get_precedents(targets)
+        ordered = graph.topological_sort(nodes)
+        position = {n: i for i, n in enumerate(ordered)}
+        targets = set(targets)
+
+        def successors(n):
+            return (position[s] for s in graph.successors(n)
+                    if s in position)
 
-        ordered = list(nx.topological_sort(subgraph))
         node_len = len(ordered)
 
-        pasted = []         # in reverse order
+        pasted = {}         # in reverse order, as an ordered set
         step = 0
         result = []
         while step * step_size < node_len:
@@ -251,39 +346,22 @@ class TraceManager:
             cur_block = ordered[start:stop]
             cur_paste = []
             cur_clear = []
-            cur_targets = []    # also included in cur_paste
             for n in cur_block:
 
-                paste = False
-                if n in targets:
-                    cur_targets.append(n)
-                    paste = True
-                else:
-                    for suc in subgraph.successors(n):
-                        if suc not in cur_block:
-                            paste = True
-                            break
-                if paste:
+                # Paste targets and nodes used in later blocks
+                if n in targets or any(i >= stop for i in successors(n)):
                     cur_paste.append(n)
                 else:
                     cur_clear.append(n)
 
-            accum_nodes = set(ordered[:stop])
-            for n in pasted.copy():
-
-                paste = False
-                for suc in subgraph.successors(n):
-                    if suc not in accum_nodes:
-                        paste = True
-                        break
-
-                if not paste:
+            for n in list(pasted):
+                if not any(i >= stop for i in successors(n)):
                     cur_clear.append(n)
-                    pasted.remove(n)
+                    del pasted[n]
 
             for n in cur_paste:
-                if n not in cur_targets:
-                    pasted.append(n)
+                if n not in targets:
+                    pasted[n] = None
 
             result.append(['calc', [ItemNode(n) for n in cur_block]])
             result.append(['paste', [ItemNode(n) for n in reversed(cur_paste)]])
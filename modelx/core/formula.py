@@ -12,12 +12,18 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import sys
 import token
 import ast
+import marshal
+import hashlib
+import pathlib
+import tempfile
 import warnings
+import importlib.util
 from types import FunctionType, CodeType
-from inspect import signature, getsource, getsourcefile, findsource
+from inspect import signature, getsource, getsourcefile, findsource, Parameter
 from textwrap import dedent, indent
 from modelx.core.base import Interface
 
@@ -263,10 +269,125 @@ def extract_lambda_from_func(func: FunctionType):
         raise ValueError("no lambda expression found")
 
 
+def make_key_binder(sig):
+    """Create a function to bind arguments to a key tuple
+
+    The returned function takes a tuple of positional arguments and
+    a dict of keyword arguments, and returns the key tuple
+    that ``sig.bind`` and ``apply_defaults`` would produce.
+    Calls with positional arguments only, which are the most common,
+    are bound without creating a ``BoundArguments`` object.
+    Calls with keyword arguments and signatures with
+    variable or keyword-only parameters fall back on ``sig.bind``.
+    """
+    def bind_by_signature(args, kwargs):
+        boundargs = sig.bind(*args, **kwargs)
+        boundargs.apply_defaults()
+        return tuple(boundargs.arguments.values())
+
+    params = tuple(sig.parameters.values())
+    if any(p.kind not in (Parameter.POSITIONAL_ONLY,
+                          Parameter.POSITIONAL_OR_KEYWORD) for p in params):
+        return bind_by_signature
+
+    paramlen = len(params)
+    defaults = tuple(p.default for p in params if p.default is not p.empty)
+
+    if not defaults:
+        def bind_key(args, kwargs):
+            if not kwargs and len(args) == paramlen:
+                return args if args.__class__ is tuple else tuple(args)
+            return bind_by_signature(args, kwargs)
+    else:
+        minlen = paramlen - len(defaults)
+
+        def bind_key(args, kwargs):
+            if not kwargs:
+                arglen = len(args)
+                if arglen == paramlen:
+                    return args if args.__class__ is tuple else tuple(args)
+                elif minlen <= arglen < paramlen:
+                    return tuple(args) + defaults[arglen - minlen:]
+            return bind_by_signature(args, kwargs)
+
+    return bind_key
+
+
+FORMULA_CACHE_VAR = "MX_FORMULA_CACHE"
+
+# Entries from other Python versions or cache formats are not hit
+_FORMULA_CACHE_TAG = (importlib.util.MAGIC_NUMBER, 1)
+
+
+class FormulaCache:
+    """On-disk cache of formulas compiled from source strings
+
+    Each entry is a file in the directory ``path`` that holds
+    the marshalled code object of a formula together with
+    its cleaned source, whether it is a lambda and the name
+    the code binds the function to. The file name is
+    a hash of the source and the arguments the formula is created with,
+    so a changed formula gets a new entry, as with ``__pycache__``.
+    Reading or writing entries never fails the creation of formulas.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+
+    @staticmethod
+    def get_key(src, name, edit_source):
+        data = repr((_FORMULA_CACHE_TAG, src, name, edit_source))
+        return hashlib.sha256(
+            data.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def load(self, key):
+        try:
+            with open(self.path / key, "rb") as f:
+                entry = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if isinstance(entry, tuple) and len(entry) == 4:
+            return entry
+        else:
+            return None
+
+    def save(self, key, entry):
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, as other processes
+            # may be reading the entry.
+            fd, temp = tempfile.mkstemp(dir=self.path)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump(entry, f)
+                os.replace(temp, self.path / key)
+            except BaseException:
+                os.remove(temp)
+                raise
+        except OSError:
+            pass
+
+
+_formula_cache = None
+
+
+def get_formula_cache():
+    """Return the cache in the directory ``MX_FORMULA_CACHE`` if set"""
+    global _formula_cache
+
+    path = os.environ.get(FORMULA_CACHE_VAR)
+    if not path:
+        return None
+    elif _formula_cache is None or _formula_cache.path != pathlib.Path(path):
+        _formula_cache = FormulaCache(path)
+    return _formula_cache
+
+
 class Formula:
 
     __slots__ = (
-        "func", "signature", "source", "module", "_is_lambda")
+        "func", "signature", "bind_key", "source", "module", "_is_lambda")
 
     def __init__(self, func, name=None, module=None, edit_source=True):
 
@@ -289,7 +410,7 @@ class Formula:
                     "%s.source set to None." % (func.__name__, func.__name__)
                 )
                 self.func = func
-                self.signature = signature(func)
+                self._set_signature()
                 self.source = None
 
         elif isinstance(func, str):
@@ -308,14 +429,39 @@ class Formula:
 
     def _init_from_source(self, src: str, name: str, edit_source: bool):
 
+        cache = get_formula_cache()
+        if cache is not None:
+            key = cache.get_key(src, name, edit_source)
+            entry = cache.load(key)
+            if entry is not None:
+                self._init_from_entry(entry, name)
+                return
+
         if is_funcdef(src):
-            self._init_from_funcdef(src, name, edit_source)
+            code, funcname = self._init_from_funcdef(src, name, edit_source)
         elif has_lambda(src):
             src = extract_lambda_from_source(dedent(src))
-            self._init_from_lambda(src, name)
+            code, funcname = self._init_from_lambda(src, name)
         else:
             raise ValueError("invalid function or lambda definition")
 
+        if cache is not None:
+            cache.save(key, (self._is_lambda, self.source, code, funcname))
+
+    def _init_from_entry(self, entry, name: str):
+
+        self._is_lambda, src, code, funcname = entry
+
+        namespace = {}
+        exec(code, namespace)
+        self.func = namespace[funcname]
+
+        if self._is_lambda and name:
+            self.func.__name__ = name
+
+        self._set_signature()
+        self.source = src
+
     def _init_from_funcdef(self, src: str, name: str, edit_source: bool):
 
         self._is_lambda = False
@@ -338,17 +484,20 @@ class Formula:
         if not edit_source:
             # Get function name from code object
             if len(code.co_names) == 1:
-                self.func = namespace[code.co_names[0]]
+                name = code.co_names[0]
+                self.func = namespace[name]
             else:
                 for n in code.co_names:
                     # ex. def foo(x: str) -> co_names = ('str', 'foo')
                     v = namespace.get(n, None)
                     if isinstance(v, FunctionType):
+                        name = n
                         self.func = v
                         break
 
-        self.signature = signature(self.func)
+        self._set_signature()
         self.source = src
+        return code, name
 
     def _init_from_lambda(self, src: str, name: str):
 
@@ -358,14 +507,20 @@ class Formula:
         # Assign the lambda to a temporary name to extract its object.
         lambda_assignment = "_lambdafunc = " + src
 
-        exec(lambda_assignment, namespace)
+        code = compile(lambda_assignment, "<string>", mode="exec")
+        exec(code, namespace)
         self.func = namespace["_lambdafunc"]
 
         if name:
             self.func.__name__ = name
 
-        self.signature = signature(self.func)
+        self._set_signature()
         self.source = src
+        return code, "_lambdafunc"
+
+    def _set_signature(self):
+        self.signature = signature(self.func)
+        self.bind_key = make_key_binder(self.signature)
 
     def _copy_other(self, other):
         for attr in self.__slots__:
@@ -270,6 +270,12 @@ class SpaceManager:
             source: A source module from which cell definitions are read.
             prefix: Prefix to the autogenerated name when name is None.
         """
+        if parent.is_model():   # Names of deferred spaces must be known
+            if name is None:
+                parent.load_lazy_spaces()
+            else:
+                parent.load_lazy_space(name)
+
         return self.model.editor.execute(NewSpace(
             parent,
             name=name,
@@ -32,9 +32,10 @@ from modelx.core.parent import (
 from modelx.core.binding.namespace import BaseNamespace
 from modelx.core.util import is_valid_name
 from modelx.core.execution.trace import TraceManager
-from modelx.core.chainmap import CustomChainMap
+from modelx.core.chainmap import CustomChainMap, ChainedDict
 from modelx.core.views import RefView, MacroView
 from modelx.core.macro import MacroImpl
+from modelx.core.space import BaseSpaceImpl
 
 # Permanent import aliases (Phase 8, CoreRefactorDesign §7): runtime
 # pickles of live models record classes by module path, so classes whose
@@ -52,6 +53,8 @@ from modelx.core.edit.pipeline import (
     DelGlobalRef,
 )
 from modelx.core.itemspaces import ItemSpaceManager
+from modelx.core.depindex import DependencyIndex
+from modelx.core.changelog import ChangeLog
 from modelx.core.refs import ValueRegistry
 
 
@@ -494,12 +497,15 @@ class Model(IOSpecOperation, EditableParent):
             self._impl, "path", self._impl.path,
             container=self._impl._property_refs)
 
-    def write(self, model_path, backup=True, log_input=False):
+    def write(self, model_path, backup=True, log_input=False,
+              incremental=False, array_data=False):
         """Write model to files.
 
         This method performs the :py:func:`~modelx.write_model`
         on self. See :py:func:`~modelx.write_model` section for the details.
 
+        .. versionchanged:: 0.32.0 ``incremental`` and ``array_data``
+           parameters are added.
         .. versionchanged:: 0.8.0
         .. versionadded:: 0.0.22
 
@@ -510,10 +516,16 @@ class Model(IOSpecOperation, EditableParent):
             log_input(bool, optional): If ``True``, input values in Cells are
                 output to *_input_log.txt* under ``model_path``. Defaults
                 to ``False``.
+            incremental(bool, optional): If ``True``, only the changed
+                files are written. Defaults to ``False``.
+            array_data(bool, optional): If ``True``, numeric input values
+                of Cells are written in NumPy arrays in serializer
+                version 8. Defaults to ``False``.
         """
         from modelx.serialize import write_model
         write_model(self._impl.system, self, model_path, is_zip=False,
-                    backup=backup, log_input=log_input)
+                    backup=backup, log_input=log_input,
+                    incremental=incremental, array_data=array_data)
 
     def zip(self, model_path, backup=True, log_input=False,
             compression=zipfile.ZIP_DEFLATED, compresslevel=None):
@@ -560,7 +572,7 @@ class Model(IOSpecOperation, EditableParent):
                     backup=backup, log_input=log_input,
                     compression=compression, compresslevel=compresslevel)
 
-    def export(self, path):
+    def export(self, path, broadcast=False):
         """Export the model as a Python package.
 
         .. warning:: This feature is experimental.
@@ -569,10 +581,53 @@ class Model(IOSpecOperation, EditableParent):
         This method performs the :py:func:`~modelx.export_model`
         on self. See :py:func:`~modelx.export_model` section for the details.
 
+        .. versionchanged:: 0.32.0 ``broadcast`` parameter is added.
         .. versionadded:: 0.22.0
         """
         from ..export.exporter import Exporter
-        Exporter(self, path).export()
+        Exporter(self, path, broadcast=broadcast).export()
+
+    def compile(self):
+        """Compile the model into plain Python code in this session.
+
+        .. warning:: This feature is experimental.
+            See the limitaions section in :py:func:`~modelx.export_model`.
+
+        The model is exported by :py:func:`~modelx.export_model`
+        to a temporary directory, and the exported package is imported
+        under a unique name. A callable object is returned,
+        which takes a Cells in a static space of the model followed by
+        its arguments, evaluates the Cells through the exported code,
+        and stores in the model the values calculated in the exported code.
+        The values are stored as if they were calculated with
+        dependency tracing turned off (See :func:`~modelx.set_tracing`),
+        so the next change to the model clears them.
+
+        Input values of Cells are passed to the exported code.
+        The compiled code does not reflect changes to the model made
+        after compiling, so compile the model again after changing it.
+        Values in ItemSpaces are not stored in the model,
+        but the exported model is available as the ``mx_model``
+        attribute of the returned object, such as
+        ``compiled.mx_model.Projection[1].pv(0)``.
+
+        Example:
+            .. code-block:: python
+
+                >>> compiled = model.compile()
+
+                >>> compiled(model.Projection.pv, 0)
+                1234.5
+
+                >>> model.Projection.pv(0)  # Stored by compiled
+                1234.5
+
+                >>> compiled.close()
+
+        .. versionadded:: 0.32.0
+        """
+        from ..export.compiler import CompiledModel
+        return CompiledModel(self)
 
     # ----------------------------------------------------------------------
     # Getting and setting attributes
@@ -586,8 +641,19 @@ class Model(IOSpecOperation, EditableParent):
     def __dir__(self):
         result = list(self._impl._namespace)
         result.extend(self._impl._macros.keys())
+        if self._impl.lazy_loader is not None:
+            result.extend(self._impl.lazy_loader.names)
         return result
 
+    @property
+    def spaces(self):
+        """A mapping of the names of child spaces to the Space objects
+
+        If the model is read lazily, the spaces not read yet are read.
+        """
+        self._impl.load_lazy_spaces()
+        return super().spaces
+
     @property
     def tracegraph(self):
         """A directed graph of cells."""
@@ -677,6 +743,46 @@ class Model(IOSpecOperation, EditableParent):
         return result
 
     # ----------------------------------------------------------------------
+    def static_dependency_graph(self):
+        """Returns a graph of the names the formulas refer to
+
+        Returns a :class:`networkx.DiGraph` object that represents which
+        objects the formulas of the Cells and the Spaces in the model
+        refer to by name, without calculating the model.
+        The nodes are :class:`~modelx.core.node.ObjectNode` objects
+        of Cells, Spaces and References,
+        and each edge is from an object referred to by a formula
+        to the Cells or the Space that has the formula.
+        Only the Cells and the Spaces in the static spaces are included.
+
+        The names each formula refers to are analyzed once and kept
+        in the model until the formula or the namespace of the formula
+        is changed, so calling this method again after changing a part
+        of the model only analyzes the changed part.
+
+        Unlike :attr:`tracegraph`, the graph contains the objects
+        the formulas refer to regardless of whether they are actually
+        used in calculation, and does not have the arguments of Cells.
+        Names referring to attributes of objects, such as ``Child.foo``,
+        are represented by the object of the first name, such as
+        ``Child``.
+
+        Example:
+            .. code-block:: python
+
+                >>> graph = model.static_dependency_graph()
+
+                >>> for node in graph:
+                ...     print(node, list(graph.predecessors(node)))
+                Model1.Space1.foo(t) [Model1.Space1.x=1]
+                Model1.Space1.x=1 []
+                Model1.Space1.bar(t) [Model1.Space1.foo(t)]
+
+        .. versionadded:: 0.32.0
+        """
+        self._impl.load_lazy_spaces()
+        return self._impl.depindex.get_graph()
+
     def generate_actions(self, targets, step_size=1000):
         """Generates actions for memory-optimized run
 
@@ -684,6 +790,16 @@ class Model(IOSpecOperation, EditableParent):
         to perform a memory-optimized calculation.
         See :meth:`execute_actions` for details.
 
+        The dependency of the target nodes is taken from the
+        trace of the calculation, so the targets are calculated
+        only if they have no values yet,
+        and the values calculated by this method are cleared
+        before it returns.
+        The targets are not planned from
+        :meth:`static_dependency_graph`, as the graph does not know
+        the arguments that the formulas pass to other cells.
+        Dependency tracing must be turned on.
+
         Args:
             targets: :obj:`list` of :class:`~modelx.core.node.ItemNode`.
             step_size(:obj:`int`, optional): Number of calculations in a step.
@@ -695,27 +811,34 @@ class Model(IOSpecOperation, EditableParent):
             * :meth:`execute_actions`
         """
 
+        impl = self._impl
+        if not impl.system.get_tracing():
+            raise RuntimeError("dependency tracing is off")
+        if impl.is_untraced:    # Values calculated without dependency
+            impl._clear_untraced()
+
+        graph = impl.tracegraph
         calc_targets = []
-        calculated = []
+        existing = None     # Nodes in the trace graph before calculation
         try:
             for n in targets:
                 obj, key = n._impl[OBJ], n._impl[KEY]
                 if key not in obj.input_keys:
-                    with self._impl.system.trace_stack(maxlen=None):
+                    if n._impl not in graph:
+                        if existing is None:
+                            existing = set(graph)
                         obj.get_value_from_key(key)
-                        tracestack = self._impl.system.callstack.tracestack
-                        for trace in tracestack:
-                            if trace[0] == "ENTER":
-                                calculated.append(trace[3])
 
                     calc_targets.append(n._impl)
 
-            result = self._impl.get_calcsteps(
-                calc_targets, calculated, step_size)
+            result = impl.get_calcsteps(calc_targets, None, step_size)
 
         finally:
-            for n in calculated:
-                n[OBJ].clear_value_at(n[KEY])
+            if existing is not None:
+                # Also cleared if the calculation fails
+                calculated = [n for n in graph if n not in existing]
+                for n in calculated:
+                    n[OBJ].clear_value_at(n[KEY])
 
         return result
 
@@ -1146,6 +1269,9 @@ class ModelNamespace(BaseNamespace):
         elif name in self._impl.named_spaces:
             return self._impl.named_spaces[name].interface
         else:
+            self._impl.load_lazy_space(name)
+            if name in self._impl.named_spaces:
+                return self._impl.named_spaces[name].interface
             raise AttributeError(f"{name!r} not found in {repr(self._impl.interface)}")
 
     def __contains__(self, item):
@@ -1185,7 +1311,10 @@ class ModelImpl(*_model_impl_base):
         "currentspace",
         "path",
         "valreg",
-        "spmgr"      # shadows Impl.spmgr property; the SpaceManager home
+        "spmgr",     # shadows Impl.spmgr property; the SpaceManager home
+        "lazy_loader",   # Reads deferred spaces if the model is read lazily
+        "_depindex",
+        "_changelog"
     ) + get_mixin_slots(*_model_impl_base)
 
     def __init__(self, *, system, name):
@@ -1202,7 +1331,7 @@ class ModelImpl(*_model_impl_base):
 
         self.currentspace = None
         self.path = None
-        self._global_refs = {}
+        self._global_refs = ChainedDict()
         self._global_refs['__builtins__'] = ReferenceImpl(
             self, '__builtins__', builtins, container=self._global_refs)
         self._property_refs = {}
@@ -1210,11 +1339,12 @@ class ModelImpl(*_model_impl_base):
             self, "path", self.path, container=self._property_refs)
         self._macros = {}
         self._macro_namespace = None
-        self.named_spaces = {}
+        self.named_spaces = ChainedDict()
         self._namespace = CustomChainMap(self.named_spaces, self._global_refs)
         self.namespace = ModelNamespace(self)
         self.allow_none = False
         self.valreg = ValueRegistry(self, system.iomanager)
+        self.lazy_loader = None
 
     def rename(self, name):
         """Rename self. Must be called only by its system."""
@@ -1257,6 +1387,14 @@ class ModelImpl(*_model_impl_base):
         else:
             return space
 
+    def on_clear_untraced(self):
+        for space in self.spaces.values():
+            space.clear_all_cells(
+                clear_input=False,
+                recursive=True,
+                del_items=True
+            )
+
     def _check_sanity(self):
 
         for name, r in self.global_refs.items():
@@ -1290,6 +1428,45 @@ class ModelImpl(*_model_impl_base):
         """
         return ModelEditor(self)
 
+    @property
+    def depindex(self):
+        """Index of the referents of formulas, created on first use"""
+        try:
+            return self._depindex
+        except AttributeError:  # Also for models pickled without it
+            self._depindex = DependencyIndex(self)
+            return self._depindex
+
+    @property
+    def changelog(self):
+        """Record of the changed spaces, created on first use"""
+        try:
+            return self._changelog
+        except AttributeError:  # Also for models pickled without it
+            self._changelog = ChangeLog(self)
+            return self._changelog
+
+    def record_change(self, obj=None):
+        """Record a change to ``obj`` for incremental writing
+
+        ``obj`` is a Cells, a Space or a Reference. The change is
+        recorded for the static space whose files contain ``obj``,
+        or for all the spaces if ``obj`` is ``None``.
+        Changes to model members are not recorded, as the files of
+        the model are always written.
+        """
+        if obj is None:
+            self.changelog.record()
+            return
+        elif obj is self:
+            return
+
+        space = obj if isinstance(obj, BaseSpaceImpl) else obj.parent
+        while space is not self and space.is_dynamic():
+            space = space.rootspace.parent
+        if space is not self:
+            self.changelog.record(space)
+
     @property
     def itemspacemgr(self):
         """Per-model itemspace invalidation policy (§5.8); stateless."""
@@ -1305,7 +1482,18 @@ class ModelImpl(*_model_impl_base):
         return self.editor.execute(
             NewGlobalRef(self, name, value, register=register))
 
+    def load_lazy_space(self, name):
+        """Read the space ``name`` if its reading is deferred"""
+        if self.lazy_loader is not None:
+            self.lazy_loader.load(name)
+
+    def load_lazy_spaces(self):
+        """Read all the spaces whose reading is deferred"""
+        if self.lazy_loader is not None:
+            self.lazy_loader.load_all()
+
     def get_attr(self, name):
+        self.load_lazy_space(name)
         if name in self.spaces:
             return self.spaces[name].interface
         elif name in self.global_refs:
@@ -1318,6 +1506,7 @@ class ModelImpl(*_model_impl_base):
             )
 
     def set_attr(self, name, value, refmode=None):
+        self.load_lazy_space(name)
         if name in self.spaces:
             raise KeyError("Space named '%s' already exist" % self.name)
         elif name in self._macros:
@@ -1329,6 +1518,7 @@ class ModelImpl(*_model_impl_base):
 
     def del_attr(self, name):
 
+        self.load_lazy_space(name)
         if name in self.named_spaces:
             self.updater.del_defined_space(self.named_spaces[name])
         elif name in self._macros:
@@ -0,0 +1,114 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Evaluation of ItemSpaces in parallel worker processes
+
+With the ``fork`` start method, workers inherit the model from
+the parent process. With the other start methods, the model is written
+to a temporary directory and read once by each worker.
+"""
+
+import os
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from modelx.core.execution.trace import tuplize_key
+
+# The parameterized space in a worker process
+_worker_space = None
+
+
+def _init_forked(fullname):
+    global _worker_space
+    from modelx.core.api import get_object
+    _worker_space = get_object(fullname)
+
+
+def _init_spawned(path, fullname):
+    global _worker_space
+    from modelx.core.api import read_model, get_object
+    read_model(path)
+    _worker_space = get_object(fullname)
+
+
+def _eval_items(keys, targets, args):
+    """Evaluate targets in the ItemSpaces of keys and delete them"""
+    impl = _worker_space._impl
+    result = []
+    for key in keys:
+        item = impl.get_itemspace(key).interface
+        result.append(
+            (key, tuple(getattr(item, t)(*args) for t in targets)))
+        impl.clear_itemspace_at(key)
+
+    return result
+
+
+def _chunk(keys, size):
+    return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+
+def parallel_map(space, keys, target, args=(), workers=None,
+                 chunksize=None, callback=None, start_method=None):
+
+    import pandas as pd
+
+    impl = space._impl
+    if not impl.formula:
+        raise ValueError("%s has no formula" % space.fullname)
+
+    keys = list(dict.fromkeys(tuplize_key(impl, k) for k in keys))
+    targets = (target,) if isinstance(target, str) else tuple(target)
+    args = tuple(args)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(keys) // (workers * 4))
+
+    if start_method is None:
+        start_method = multiprocessing.get_start_method()
+    context = multiprocessing.get_context(start_method)
+
+    values = {}
+    with tempfile.TemporaryDirectory() as tempdir:
+
+        if start_method == "fork":
+            init, initargs = _init_forked, (space.fullname,)
+        else:
+            path = os.path.join(tempdir, space.model.name)
+            space.model.write(path, backup=False)
+            init, initargs = _init_spawned, (path, space.fullname)
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=init,
+                                 initargs=initargs) as executor:
+
+            futures = [executor.submit(_eval_items, chunk, targets, args)
+                       for chunk in _chunk(keys, chunksize)]
+
+            for f in as_completed(futures):
+                for key, value in f.result():
+                    values[key] = value
+                    if callback is not None:
+                        callback(key if len(key) > 1 else key[0],
+                                 value if len(value) > 1 else value[0])
+
+    params = impl.formula.parameters
+    if len(params) == 1:
+        index = pd.Index([k[0] for k in keys], name=params[0])
+    else:
+        index = pd.MultiIndex.from_tuples(keys, names=params)
+
+    return pd.DataFrame(
+        [values[k] for k in keys], index=index, columns=list(targets))
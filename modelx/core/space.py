@@ -21,7 +21,7 @@ from collections.abc import Sequence, Mapping
 from types import FunctionType, ModuleType, MappingProxyType
 from modelx.core.binding.namespace import NamespaceServer, BaseNamespace
 from modelx.core.binding.boundfunc import AlteredFunction
-from modelx.core.chainmap import CustomChainMap
+from modelx.core.chainmap import CustomChainMap, ChainedDict
 from modelx.core.views import CellsView, SpaceView, RefView, _to_frame_inner
 
 from modelx.core.base import (
@@ -42,6 +42,7 @@ from modelx.core.execution.trace import (
     tuplize_key,
     get_node,
     key_to_node,
+    OBJ,
     KEY
 )
 from modelx.core.node import (
@@ -58,6 +59,7 @@ from modelx.core.formula import Formula, ModuleSource
 from modelx.core.cells import (
     Cells,
     DynamicCellsImpl,
+    LRUData,
     shareable_parameters,
 )
 from modelx.core.util import AutoNamer, is_valid_name, get_module
@@ -500,7 +502,7 @@ class BaseSpace(BaseParent, NodeFactory):
     def clear_at(self, *args, **kwargs):
         """Delete a child :class:`ItemSpace` object"""
 
-        key = get_node(self, args, kwargs)[KEY]
+        key = get_node(self._impl, args, kwargs)[KEY]
         if key in list(self._impl.param_spaces):
             self._impl.clear_itemspace_at(key)
         else:
@@ -1696,11 +1698,117 @@ class UserSpace(BaseSpace, EditableParent):
         """
         self._impl.del_formula()
 
+    def parallel_map(self, keys, target, args=(), workers=None,
+                     chunksize=None, callback=None, start_method=None):
+        """Evaluate Cells in ItemSpaces in parallel worker processes
+
+        For each key in ``keys``, the :class:`ItemSpace` of the key is
+        created in a worker process, the Cells named ``target`` in the
+        ItemSpace is called with ``args``, and the ItemSpace is deleted.
+        The ItemSpaces must be independent of each other, as
+        each worker only has its own copy of the model.
+
+        When the start method of the worker processes is ``fork``,
+        the workers inherit the model from this process.
+        Otherwise, the model is written to a temporary directory and
+        read by each worker process once.
+
+        The keys are sent to the workers in chunks of ``chunksize``
+        keys. As each chunk is finished, ``callback``, if given,
+        is called in this process for each key with the key and
+        the value, so that partial results can be processed
+        before all the keys are finished.
+
+        Args:
+            keys: An iterable of the arguments of the ItemSpaces.
+                Each element is a tuple of arguments or a single argument.
+            target(:obj:`str` or a sequence of :obj:`str`): The name of
+                the Cells to evaluate, or a sequence of the names.
+            args(:obj:`tuple`, optional): Arguments to the Cells.
+            workers(:obj:`int`, optional): Number of worker processes.
+                Defaults to the number of CPUs.
+            chunksize(:obj:`int`, optional): Number of keys sent to
+                a worker at a time. Defaults to about a quarter of
+                the keys per worker.
+            callback(optional): A function called with each key
+                and the value of ``target`` as each chunk is finished.
+                If ``target`` is a sequence, the value is a tuple.
+            start_method(:obj:`str`, optional): The start method of
+                the worker processes, ``"fork"``, ``"spawn"`` or
+                ``"forkserver"``. Defaults to the default start method
+                of :mod:`multiprocessing`.
+
+        Returns:
+            :class:`pandas.DataFrame` indexed by the keys
+            with a column for each name in ``target``.
+
+        Example:
+            .. code-block:: python
+
+                >>> df = model.Projection.parallel_map(
+                ...         range(1, 10001), "pv_net_cf", workers=8)
+
+        .. versionadded:: 0.32.0
+        """
+        from modelx.core.parallel import parallel_map
+        return parallel_map(
+            self, keys, target, args=args, workers=workers,
+            chunksize=chunksize, callback=callback,
+            start_method=start_method)
+
+    @property
+    def max_itemspaces(self):
+        """Max number of ItemSpaces to keep, or :obj:`None` for no limit
+
+        When an :obj:`int` is set, the number of the :class:`ItemSpace`
+        objects of this space is bounded to it. When a new ItemSpace is
+        created and the bound is exceeded, the least recently used
+        ItemSpaces are deleted together with the values that depend on
+        them, in the same way as :meth:`clear_at` deletes them.
+        Deleted ItemSpaces are created again when they are accessed
+        again.
+
+        ItemSpaces in which a value is being calculated,
+        and ItemSpaces on which a value being calculated depends,
+        are not deleted until the calculation completes,
+        so the bound can be exceeded temporarily.
+        The ItemSpaces over the bound are deleted when the top-level
+        calculation returns.
+        To keep memory usage constant, access the ItemSpaces from
+        outside formulas, such as in a ``for`` loop.
+        Nothing is deleted while dependency tracing is turned off.
+
+        Example:
+            .. code-block:: python
+
+                >>> model.Projection.max_itemspaces = 100
+
+                >>> result = [model.Projection[i].pv(0) for i in range(1, 100001)]
+
+                >>> len(model.Projection.itemspaces)
+                100
+
+        .. versionadded:: 0.32.0
+        """
+        return self._impl.max_itemspaces
+
+    @max_itemspaces.setter
+    def max_itemspaces(self, maxsize):
+        self._impl.set_max_itemspaces(maxsize)
+
     @Interface.doc.setter
     def doc(self, value):
         self._impl.doc = value
 
 
+class LRUItemSpaces(LRUData):
+    """ItemSpaces ordered from the least recently used key"""
+
+    def __init__(self, maxsize=None, data=None):
+        LRUData.__init__(self, () if data is None else data.items())    # Not to reorder data
+        self.maxsize = maxsize
+
+
 class ItemSpaceParent(NodeFactoryImpl, AlteredFunction):
 
     __slots__ = ()
@@ -1754,6 +1862,7 @@ class ItemSpaceParent(NodeFactoryImpl, AlteredFunction):
                     self.formula = ParamFunc(formula, name="_formula")
 
                 self.is_altfunc_updated = False
+                self.model.record_change(self)
             else:
                 self.del_formula()
                 self.set_formula(formula)
@@ -1768,6 +1877,7 @@ class ItemSpaceParent(NodeFactoryImpl, AlteredFunction):
         else:
             self.del_all_itemspaces()
             self.formula = None
+            self.model.record_change(self)
 
     def del_all_itemspaces(self):
         for key in list(self.param_spaces):
@@ -1777,6 +1887,89 @@ class ItemSpaceParent(NodeFactoryImpl, AlteredFunction):
         if self.has_node(key):
             self.model.clear_with_descs(key_to_node(self, key))
 
+    @property
+    def max_itemspaces(self):
+        if self.param_spaces.__class__ is LRUItemSpaces:
+            return self.param_spaces.maxsize
+        else:
+            return None
+
+    def set_max_itemspaces(self, maxsize):
+        if maxsize is None:
+            self.param_spaces = dict(self.param_spaces)
+        elif maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        else:
+            self.param_spaces = LRUItemSpaces(maxsize, self.param_spaces)
+            self.evict_itemspaces()
+
+    def evict_itemspaces(self, current=None):
+        """Delete the least recently used ItemSpaces over the limit
+
+        ItemSpaces used in the calculations in progress
+        and ItemSpaces whose dependents are being calculated are kept,
+        and they are moved to the most recently used end not to be
+        checked again until the top-level calculation returns,
+        when the ItemSpaces still over the limit are deleted.
+        """
+        spaces = self.param_spaces
+        if len(spaces) <= spaces.maxsize or self.model.is_untraced:
+            return
+
+        executor = self.system.executor
+        blocked = executor.blocked_evictions
+        graph = self.model.tracegraph
+        busy = None
+
+        def is_busy(n):
+            obj, key = n[OBJ], n[KEY]
+            return n in busy or not (
+                obj.has_node(key) or key in obj.evicted_keys)
+
+        while True:
+            excess = len(spaces) - spaces.maxsize
+            if excess <= 0:
+                return
+
+            candidates = []
+            for key in spaces:  # From the least recently used
+                if (self, key) in blocked:
+                    break   # The rest were blocked or created later
+                if key != current:
+                    candidates.append(key)
+                    if len(candidates) == excess:
+                        break
+
+            if not candidates:
+                break
+
+            if busy is None:
+                busy = set(self._iter_busy_nodes())
+
+            for key in candidates:
+                if key not in spaces:
+                    continue    # Cleared as a dependent
+                node = key_to_node(self, key)
+                if node in busy or (
+                        node in graph and graph.any_reachable(node, is_busy)):
+                    blocked.add(node)
+                    spaces.move_to_end(key)
+                else:
+                    self.clear_itemspace_at(key)
+
+        if executor.is_executing:
+            executor.defer_eviction(self, self.evict_itemspaces)
+
+    def _iter_busy_nodes(self):
+        """Yield the nodes of the ItemSpaces being calculated in"""
+        for node in self.system.executor.callstack:
+            obj = node[OBJ]
+            space = obj if isinstance(obj, ItemSpaceParent) else obj.parent
+            while space.is_dynamic():
+                root = space.rootspace
+                yield key_to_node(root.parent, root.argvalues_if)
+                space = root.parent
+
     def on_clear_trace(self, key):
         self._del_itemspace(key)
 
@@ -1855,6 +2048,8 @@ class ItemSpaceParent(NodeFactoryImpl, AlteredFunction):
 
         self.param_spaces[key] = space
         self.dynamic_cache[dkey] = space.interface
+        if self.param_spaces.__class__ is LRUItemSpaces:
+            self.evict_itemspaces(current=key)
         return space
 
     # ----------------------------------------------------------------------
@@ -1961,10 +2156,10 @@ class BaseSpaceImpl(*_base_space_impl_base):
         # ------------------------------------------------------------------
         # Construct member containers
 
-        self.own_refs = {}
+        self.own_refs = ChainedDict()
         self.cells = {}
         self.named_spaces = {}
-        self.sys_refs = {}
+        self.sys_refs = ChainedDict()
         self._init_refs(arguments)
 
         self.is_cached = True
@@ -2268,9 +2463,14 @@ class UserSpaceImpl(*_user_space_impl_base):
         self.refs = CustomChainMap(self.own_refs, self.sys_refs, self.model._global_refs)
         self.refs_outer = CustomChainMap(self.own_refs, self.model._global_refs)
 
+    def on_ns_invalidated(self):
+        AlteredFunction.on_ns_invalidated(self)
+        self.model.depindex.discard(self)
+
     @Impl.doc.setter
     def doc(self, value):
         self._doc = value
+        self.model.record_change(self)
 
     # ----------------------------------------------------------------------
     # Cells creation
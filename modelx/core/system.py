@@ -22,7 +22,9 @@ from modelx.core.model import ModelImpl
 from modelx.core.util import AutoNamer
 from modelx.core.errors import DeepReferenceError
 from modelx.io.baseio import IOManager
-from modelx.core.execution.executor import NonThreadedExecutor, ThreadedExecutor, CallStack, TraceableCallStack
+from modelx.core.execution.executor import (
+    NonThreadedExecutor, ThreadedExecutor, CallStack, TraceableCallStack,
+    UntracedCallStack)
 
 
 def custom_showwarning(
@@ -234,6 +236,7 @@ class System:
             return m.currentspace
 
     def close_model(self, model):
+        model.lazy_loader = None
         model.valreg.del_all_spec()
         del self.models[model.name]
         if self.currentmodel is model:
@@ -294,6 +297,9 @@ class System:
         if self._is_stacktrace_active():
             return False
 
+        if not self.executor.is_tracing:
+            raise RuntimeError("dependency tracing is off")
+
         if self.callstack.is_empty():
             self.callstack = self.executor.callstack = TraceableCallStack(
                 self.executor,
@@ -347,6 +353,40 @@ class System:
             self.clear_stacktrace()
             self.stop_stacktrace()
 
+    # ----------------------------------------------------------------------
+    # Dependency tracing
+
+    def get_tracing(self):
+        return self.executor.is_tracing
+
+    def set_tracing(self, tracing):
+        tracing = bool(tracing)
+        if tracing == self.executor.is_tracing:
+            return
+
+        if self._is_stacktrace_active():
+            raise RuntimeError("call stack trace active")
+
+        if self.callstack.is_empty():
+            callstack_cls = CallStack if tracing else UntracedCallStack
+            self.callstack = self.executor.callstack = callstack_cls(
+                self.executor,
+                maxdepth=self.callstack.maxdepth
+            )
+            self.executor.set_tracing(tracing)
+        else:
+            raise RuntimeError("callstack not empy")
+
+    @contextmanager
+    def untraced(self):
+        """Context manager to turn off dependency tracing"""
+        tracing = self.get_tracing()
+        self.set_tracing(False)
+        try:
+            yield None
+        finally:
+            self.set_tracing(tracing)
+
     def _check_sanity(self, check_members=True):
         self.iomanager._check_sanity()
         if check_members:
@@ -1,4 +1,8 @@
+import os
 import sys
+import time
+import mmap
+import hashlib
 import collections
 import pickle
 from importlib import import_module
@@ -44,6 +48,18 @@ class BaseModel(BaseParent):
 
     def _mx_load_io(self):
 
+        cache_dir = os.environ.get(IO_CACHE_VAR)
+        if cache_dir:
+            io_data, pickle_data = SharedIOCache(
+                self.path, cache_dir).load(self._mx_read_io)
+        else:
+            io_data, pickle_data = self._mx_read_io()
+
+        for m_or_s in self._mx_walk():
+            m_or_s._mx_assign_refs(io_data, pickle_data)
+
+    def _mx_read_io(self):
+
         ios = {}
         io_data = {}
         if has_io:
@@ -63,8 +79,177 @@ class BaseModel(BaseParent):
         else:
             pickle_data = {}
 
-        for m_or_s in self._mx_walk():
-            m_or_s._mx_assign_refs(io_data, pickle_data)
+        return io_data, pickle_data
+
+
+# Environment variable for the directory of the shared input data
+IO_CACHE_VAR = 'MX_IO_CACHE'
+
+
+def pid_exists(pid):
+    """Return if the process exists, or None if it cannot be checked"""
+    if os.name != 'posix':
+        # os.kill terminates the process on Windows
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedIOCache:
+    """Input data of a model in files memory-mapped by processes
+
+    The data is pickled with protocol 5, and the out-of-band buffers,
+    such as those of NumPy arrays, are written in ``buffers.bin``.
+    The arrays unpickled from the memory-mapped file share
+    the same memory across the processes and are read-only.
+    The first process to load the model writes the files, while the
+    other processes wait for the files to be written.
+    The writing process holds ``lock``, which has its PID and the time
+    it is taken. The lock is taken over if the process is gone.
+    If the PID cannot be read or checked, the lock is taken over
+    when it is older than :attr:`stale_after` seconds.
+    While the process is alive, the other processes wait for
+    :attr:`timeout` seconds at most and then read the data by themselves.
+    """
+
+    align = 64
+    timeout = 600   # Seconds to wait for another process to write
+    stale_after = 60    # Seconds after which a lock of no PID is taken over
+
+    def __init__(self, path, cache_dir):
+        self.dir = pathlib.Path(cache_dir) / (
+            path.name + '-' + self.get_digest(path))
+        self.data_file = self.dir / 'data.pickle'
+        self.buffers_file = self.dir / 'buffers.bin'
+        self.lock_file = self.dir / 'lock'
+
+    @staticmethod
+    def get_digest(path):
+        """Hash of the package path and the states of the data files"""
+        files = ['_mx_pickled']
+        if has_io:
+            files.extend(_mx_io.ios)
+
+        h = hashlib.sha256(str(path.resolve()).encode())
+        for f in files:
+            p = path / f
+            if p.exists():
+                st = p.stat()
+                h.update(('%s:%s:%s' % (f, st.st_size, st.st_mtime_ns)).encode())
+
+        return h.hexdigest()[:16]
+
+    def load(self, reader):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        while not self.data_file.exists():
+            if self.acquire():
+                try:
+                    self.write(reader())
+                finally:
+                    self.release()
+            elif time.monotonic() - start > self.timeout:
+                return reader()
+            else:
+                self.wait()
+
+        return self.read()
+
+    def acquire(self):
+        try:
+            fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w') as f:
+            f.write('%d %f' % (os.getpid(), time.time()))
+        return True
+
+    def release(self):
+        # The lock may have been taken over
+        if self.read_lock()[0] == os.getpid():
+            self.remove_lock()
+
+    def read_lock(self):
+        """Return the PID and the time in the lock"""
+        try:
+            pid, stamp = self.lock_file.read_text().split()
+            return int(pid), float(stamp)
+        except FileNotFoundError:
+            return None, None
+        except ValueError:  # Being written
+            try:
+                return None, self.lock_file.stat().st_mtime
+            except FileNotFoundError:
+                return None, None
+
+    def remove_lock(self):
+        try:
+            os.remove(self.lock_file)
+        except FileNotFoundError:
+            pass
+
+    def wait(self):
+        """Wait for a while, taking over the lock if it is stale"""
+        pid, stamp = self.read_lock()
+        if stamp is None:
+            return
+
+        is_alive = None if pid is None else pid_exists(pid)
+        if is_alive is False or (
+                is_alive is None and time.time() - stamp > self.stale_after):
+            self.remove_lock()
+        else:
+            time.sleep(0.1)
+
+    def write(self, data):
+        buffers = []
+
+        def callback(buf):
+            try:
+                buffers.append(buf.raw())
+            except BufferError:     # Not contiguous
+                return True
+            return False
+
+        payload = pickle.dumps(data, protocol=5, buffer_callback=callback)
+
+        offsets = []
+        tmp = self.buffers_file.with_name('buffers.bin.%s' % os.getpid())
+        with open(tmp, 'wb') as f:
+            pos = 0
+            for buf in buffers:
+                pad = -pos % self.align
+                f.write(bytes(pad))
+                pos += pad
+                offsets.append((pos, buf.nbytes))
+                f.write(buf)
+                pos += buf.nbytes
+        os.replace(tmp, self.buffers_file)
+
+        # Written last, as its existence marks the completion
+        tmp = self.data_file.with_name('data.pickle.%s' % os.getpid())
+        with open(tmp, 'wb') as f:
+            pickle.dump((payload, offsets), f, protocol=5)
+        os.replace(tmp, self.data_file)
+
+    def read(self):
+        with open(self.data_file, 'rb') as f:
+            payload, offsets = pickle.load(f)
+
+        if offsets:
+            with open(self.buffers_file, 'rb') as f:
+                view = memoryview(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            buffers = [view[i:i + n] for i, n in offsets]
+        else:
+            buffers = []
+
+        return pickle.loads(payload, buffers=buffers)
 
 
 class BaseSpace(BaseParent):
@@ -188,3 +373,8 @@ iospec_types = {
     'PandasData': MiniPandasData
 }
 
+
+def broadcast_params(*args):
+    """Broadcast the parameters of an ItemSpace to arrays"""
+    import numpy as np
+    return np.broadcast_arrays(*(np.asarray(a) for a in args))
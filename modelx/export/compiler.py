@@ -0,0 +1,177 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Execution of a model through the code generated by the exporter
+
+The model is exported to a temporary directory and imported as
+a package under a unique name. The package reads all its data on import,
+so the directory is deleted right after the import.
+"""
+
+import sys
+import itertools
+import tempfile
+import pathlib
+import importlib.util
+
+from modelx.core.execution.trace import key_to_node
+from .exporter import Exporter, MODEL_VAR
+
+_compiled_ids = itertools.count(1)
+
+
+class CompiledCells:
+    """Pair of a cached Cells and its method in the compiled model"""
+
+    __slots__ = ("impl", "space", "name", "pulled")
+
+    def __init__(self, impl, space):
+        self.impl = impl            # CellsImpl
+        self.space = space          # Space object in the compiled model
+        self.name = impl.name
+        self.pulled = 0
+
+    def seed_inputs(self):
+        """Copy input values to the cache of the compiled model"""
+        impl = self.impl
+        if not impl.input_keys:
+            pass
+        elif impl.is_scalar():
+            setattr(self.space, "_v_" + self.name, impl.data[()])
+            setattr(self.space, "_has_" + self.name, True)
+        else:
+            cache = getattr(self.space, "_v_" + self.name)
+            single = len(impl.formula.parameters) == 1
+            for key in impl.input_keys:
+                cache[key[0] if single else key] = impl.data[key]
+
+        self.pulled = len(self.get_cache())
+
+    def get_cache(self):
+        """Return the cache of the Cells in the compiled model as a dict"""
+        if self.impl.is_scalar():
+            if getattr(self.space, "_has_" + self.name):
+                return {(): getattr(self.space, "_v_" + self.name)}
+            return {}
+        else:
+            return getattr(self.space, "_v_" + self.name)
+
+    def pull(self):
+        """Store the values calculated since the last pull in the Cells"""
+        cache = self.get_cache()
+        if len(cache) == self.pulled:
+            return 0
+
+        impl = self.impl
+        single = len(impl.formula.parameters) == 1
+        tracegraph = impl.model.tracegraph
+        count = 0
+        for key, value in itertools.islice(cache.items(), self.pulled, None):
+            if single:
+                key = (key,)
+            if not impl.has_node(key):
+                impl._store_value(key, value)
+                if impl.cache_policy is not None:
+                    impl.cache_policy.on_store(impl, key)
+                tracegraph.add_node(key_to_node(impl, key))
+                count += 1
+
+        self.pulled = len(cache)
+        return count
+
+
+class CompiledModel:
+    """Callable to evaluate Cells of a model through exported code
+
+    Returned by :meth:`Model.compile<modelx.core.model.Model.compile>`.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.module_name = "_mx_compiled_%s_%d" % (
+            model.name, next(_compiled_ids))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = pathlib.Path(tempdir) / self.module_name
+            Exporter(model, path).export()
+            spec = importlib.util.spec_from_file_location(
+                self.module_name, path / "__init__.py",
+                submodule_search_locations=[str(path)])
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[self.module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                self._remove_modules()
+                raise
+
+        self.mx_model = getattr(module, MODEL_VAR)
+        self.cells = {}     # CellsImpl: CompiledCells
+        for space in model._impl.spaces.values():
+            self._add_cells(space, self.mx_model)
+
+    def _add_cells(self, space, parent):
+        target = getattr(parent, space.name)
+        for impl in space.cells.values():
+            if impl.is_cached:
+                c = self.cells[impl] = CompiledCells(impl, target)
+                c.seed_inputs()
+
+        for child in space.spaces.values():
+            self._add_cells(child, target)
+
+    def _remove_modules(self):
+        prefix = self.module_name + "."
+        for name in list(sys.modules):
+            if name == self.module_name or name.startswith(prefix):
+                del sys.modules[name]
+
+    def get_method(self, cells):
+        """Return the method of ``cells`` in the compiled model"""
+        impl = cells._impl
+        if impl.model is not self.model._impl:
+            raise ValueError("%s not in %s" % (cells.fullname, self.model.name))
+        elif impl.parent.is_dynamic():
+            raise ValueError("%s not in a static space" % cells.fullname)
+
+        target = self.mx_model
+        for name in cells._idtuple[1:]:
+            target = getattr(target, name)
+
+        return target
+
+    def __call__(self, cells, *args, **kwargs):
+        """Evaluate ``cells`` and store the calculated values in the model"""
+        value = self.get_method(cells)(*args, **kwargs)
+        self.pull()
+        return value
+
+    def pull(self):
+        """Store the values calculated in the compiled model in the model
+
+        The values are stored as if they were calculated
+        with dependency tracing turned off, so the next change to
+        the model clears them. Values already in the model are kept.
+        Returns the number of the values stored.
+        """
+        count = sum(c.pull() for c in self.cells.values())
+        if count:
+            self.model._impl.is_untraced = True
+        return count
+
+    def close(self):
+        """Remove the modules of the compiled model"""
+        self._remove_modules()
+        self.cells.clear()
+        self.mx_model = None
@@ -50,9 +50,10 @@ SPACE_CLS_PREFIX = '_c_'
 
 class Exporter:
 
-    def __init__(self, model: Model, path):
+    def __init__(self, model: Model, path, broadcast=False):
         self.model = model
         self.path = pathlib.Path(path)
+        self.broadcast = broadcast
 
     def gen_parents(self):
         """Generator yielding model and spaces in breadth-first order"""
@@ -99,7 +100,7 @@ class Exporter:
 
                 # Write space modules
                 write_str_utf8(
-                    SpaceTranslator(parent, io_manager).code,
+                    SpaceTranslator(parent, io_manager, self.broadcast).code,
                     cur_dir / (SPACE_MODULE + '.py'))
 
         # Write IO metadata
@@ -393,12 +394,19 @@ class SpaceTranslator(ParentTranslator):
     {cache_methods}
 
     {itemspace_methods}
+
+    {broadcast_method}
     
     {getitem}
 
     {delitem}
     """)
 
+    def __init__(self, parent: BaseParent, io_manager: DataManager,
+                 broadcast=False):
+        super().__init__(parent, io_manager)
+        self.broadcast = broadcast
+
     cache_method_noparam = textwrap.dedent("""\
     def {name}(self):
         if self._has_{name}:
@@ -450,6 +458,24 @@ class SpaceTranslator(ParentTranslator):
 
     """)
 
+    broadcast_method = textwrap.dedent("""\
+    def _mx_broadcast(self, {params}):
+        {tuplized_args} = _mx_sys.broadcast_params({args})
+        _mx_base = self
+        _mx_root = _mx_base.__class__(self)
+        for _mx_s, _mx_b in zip(_mx_root._mx_walk(), _mx_base._mx_walk()):
+            _mx_s._mx_copy_refs(_mx_b, _mx_base)
+            for _mx_r in self._mx_roots:
+                _mx_r._mx_copy_params(_mx_s)
+
+            self._mx_assign_params(_mx_s, {args})
+            _mx_s._mx_roots.extend(self._mx_roots)
+            _mx_s._mx_roots.append(_mx_root)
+
+        return _mx_root
+
+    """)
+
     getitem_asis = textwrap.dedent("""\
     def __getitem__(self, item):
         return self.__call__(item)
@@ -559,10 +585,19 @@ class SpaceTranslator(ParentTranslator):
                 param_assigns=textwrap.indent(
                     self.param_assigns(attrs.params), ' ' * 4)
             )
+            if self.broadcast:
+                broadcast_method = self.broadcast_method.format(
+                    args=attrs.arg_str,
+                    params=attrs.param_str,
+                    tuplized_args=attrs.tuplized_arg_str
+                )
+            else:
+                broadcast_method = ''
             delitem = self.delitem_asis
         else:
             itemspace_dict = ''
             itemspace_methods = ''
+            broadcast_method = ''
             getitem = ''
             delitem = ''
 
@@ -580,6 +615,7 @@ class SpaceTranslator(ParentTranslator):
             methods=textwrap.indent(trans.transformed.code, ' ' * 4),
             cache_methods=textwrap.indent(''.join(cache_methods), ' ' * 4),
             itemspace_methods=textwrap.indent(itemspace_methods, ' ' * 4),
+            broadcast_method=textwrap.indent(broadcast_method, ' ' * 4),
             getitem=textwrap.indent(getitem, ' ' * 4),
             delitem=textwrap.indent(delitem, ' ' * 4)
         )
@@ -0,0 +1,191 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Evaluation of ItemSpaces of an exported model in worker processes
+
+Each worker process imports the exported package once, and evaluates
+the ItemSpaces for the keys in the shards sent to it.
+"""
+
+import os
+import sys
+import time
+import pathlib
+import importlib
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from ._mx_sys import IO_CACHE_VAR
+
+RunResult = namedtuple("RunResult", ["values", "timings"])
+
+# The parameterized space in a worker process
+_worker_space = None
+
+
+def _get_space(model, space):
+    obj = model
+    for name in space.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _init_worker(path, space, io_cache):
+    global _worker_space
+    if io_cache is not None:
+        os.environ[IO_CACHE_VAR] = io_cache
+    path = pathlib.Path(path)
+    sys.path.insert(0, str(path.parent))
+    try:
+        model = importlib.import_module(path.name).mx_model
+    finally:
+        sys.path.pop(0)
+    _worker_space = _get_space(model, space)
+
+
+def _get_params(space):
+    module = sys.modules[space.__class__.__module__]
+    return getattr(module, "_v_space_params_" + space._name)
+
+
+def _eval_shard(shard, keys, targets, args):
+    """Evaluate targets in the ItemSpaces of keys and delete them"""
+    start = time.perf_counter()
+    space = _worker_space
+    result = []
+    for key in keys:
+        item = space(*key)
+        result.append(tuple(getattr(item, t)(*args) for t in targets))
+        space._mx_itemspaces.pop(key[0] if len(key) == 1 else key, None)
+
+    return (shard, os.getpid(), time.perf_counter() - start, result,
+            _get_params(space))
+
+
+def _shard(keys, count):
+    size, rem = divmod(len(keys), count)
+    shards, start = [], 0
+    for i in range(count):
+        end = start + size + (i < rem)
+        shards.append(keys[start:end])
+        start = end
+    return [s for s in shards if s]
+
+
+def run_parallel(path, space, keys, target, args=(), workers=None,
+                 shards=None, start_method=None, io_cache=None):
+    """Evaluate Cells in ItemSpaces of an exported model in parallel
+
+    The exported package at ``path`` is imported once in each of
+    the worker processes. ``keys`` are split into ``shards``
+    contiguous shards, which are sent to the workers.
+    For each key in a shard, the ItemSpace of ``space``
+    for the key is created, the method named ``target`` in
+    the ItemSpace is called with ``args``, and the ItemSpace is deleted.
+
+    Args:
+        path: The path to the exported package.
+        space(:obj:`str`): The name of the parameterized space,
+            such as ``"Projection"``. The names of nested spaces are
+            separated by dots.
+        keys: An iterable of the arguments of the ItemSpaces.
+            Each element is a tuple of arguments or a single argument.
+        target(:obj:`str` or a sequence of :obj:`str`): The name of
+            the method to call, or a sequence of the names.
+        args(:obj:`tuple`, optional): Arguments to the methods.
+        workers(:obj:`int`, optional): Number of worker processes.
+            Defaults to the number of CPUs.
+        shards(:obj:`int`, optional): Number of shards.
+            Defaults to ``workers``.
+        start_method(:obj:`str`, optional): The start method of
+            the worker processes, ``"fork"``, ``"spawn"`` or
+            ``"forkserver"``. Defaults to the default start method
+            of :mod:`multiprocessing`.
+        io_cache(optional): The path to a directory to share the input
+            data of the model across the workers in memory-mapped files.
+            See :func:`~modelx.export_model` for details.
+
+    Returns:
+        A named tuple of ``values`` and ``timings``.
+        If ``target`` is a single name and all the values
+        are pandas objects, such as DataFrames,
+        ``values`` is the values concatenated with the keys added
+        to the index. Otherwise, ``values`` is a
+        :class:`pandas.DataFrame` indexed by the keys
+        with a column for each name in ``target``.
+        ``timings`` is a :class:`pandas.DataFrame` indexed by
+        the shard numbers, with the number of the keys,
+        the ID of the worker process and the seconds taken
+        to evaluate each shard.
+
+    Example:
+        .. code-block:: python
+
+            >>> from modelx.export.runner import run_parallel
+
+            >>> result = run_parallel(
+            ...         "BasicTerm_M_nomx", "Projection",
+            ...         range(1, 10001), "pv_net_cf", args=(0,), workers=8)
+
+            >>> result.timings
+    """
+    import pandas as pd
+
+    path = pathlib.Path(path).resolve()
+    keys = list(dict.fromkeys(
+        k if isinstance(k, tuple) else (k,) for k in keys))
+    targets = (target,) if isinstance(target, str) else tuple(target)
+    args = tuple(args)
+    workers = workers or os.cpu_count() or 1
+    shards = _shard(keys, shards or workers)
+
+    if start_method is None:
+        start_method = multiprocessing.get_start_method()
+    context = multiprocessing.get_context(start_method)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker,
+                             initargs=(str(path), space,
+                                       None if io_cache is None
+                                       else str(io_cache))) as executor:
+
+        futures = [executor.submit(_eval_shard, i, s, targets, args)
+                   for i, s in enumerate(shards)]
+        results = [f.result() for f in futures]
+
+    values = [v for _, _, _, result, _ in results for v in result]
+    timings = pd.DataFrame(
+        [(len(shards[i]), pid, sec) for i, pid, sec, _, _ in results],
+        index=pd.RangeIndex(len(shards), name="shard"),
+        columns=["keys", "pid", "seconds"])
+
+    if results:
+        params = results[0][4][:len(keys[0])]
+    else:
+        params = [None]
+    if len(params) == 1:
+        index = pd.Index([k[0] for k in keys], name=params[0])
+    else:
+        index = pd.MultiIndex.from_tuples(keys, names=params)
+
+    if len(targets) == 1 and values and all(
+            isinstance(v[0], (pd.Series, pd.DataFrame)) for v in values):
+        values = pd.concat(
+            [v[0] for v in values], keys=index, names=index.names)
+    else:
+        values = pd.DataFrame(values, index=index, columns=list(targets))
+
+    return RunResult(values, timings)
+
@@ -18,10 +18,12 @@ _MX_TO_FORMAT = {
     (0, 9, 0): 4,
     (0, 18, 0): 5,
     (0, 22, 0): 6,
-    (0, 31, 0): 7
+    (0, 31, 0): 7,
+    (0, 32, 0): 8
 }
 
 HIGHEST_VERSION = list(_MX_TO_FORMAT.values())[-1]
+DEFAULT_VERSION = 7     # Readable by modelx 0.31.0
 DEFAULT_MAX_BACKUPS = 3
 
 
@@ -93,20 +95,39 @@ def write_model(system, model, model_path,
                 is_zip, backup=True, log_input=False,
                 compression=zipfile.ZIP_DEFLATED,
                 compresslevel=None,
-                version=None):
+                version=None,
+                incremental=False,
+                array_data=False):
 
-    version = version or HIGHEST_VERSION
+    if not version:
+        version = HIGHEST_VERSION if array_data else DEFAULT_VERSION
     max_backups = DEFAULT_MAX_BACKUPS if backup else 0
 
+    model._impl.load_lazy_spaces()
     root = pathlib.Path(model_path)
-    _increment_backups(model, root, max_backups)
+    kwargs = {}
+    if incremental:
+        if is_zip:
+            raise ValueError("zip files cannot be written incrementally")
+        if version < 7:
+            raise ValueError(
+                "incremental writing requires serializer version 7 or later")
+        kwargs["incremental"] = True
+    else:
+        _increment_backups(model, root, max_backups)
+    if array_data:
+        if version < 8:
+            raise ValueError(
+                "array_data requires serializer version 8 or later")
+        kwargs["array_data"] = True
 
     serializer = _get_serializer(version)
     serializer.ModelWriter(system, model, root,
                            is_zip=is_zip,
                            log_input=log_input,
                            compression=compression,
-                           compresslevel=compresslevel
+                           compresslevel=compresslevel,
+                           **kwargs
                            ).write_model()
 
     if model.path != root:
@@ -114,7 +135,8 @@ def write_model(system, model, model_path,
     return model
 
 
-def read_model(system, model_path, name=None):
+def read_model(system, model_path, name=None, lazy=False, max_workers=None,
+               process_workers=None):
 
     kwargs = {"name": name} if name else {}
     path = pathlib.Path(model_path)
@@ -140,6 +162,12 @@ def read_model(system, model_path, name=None):
             "%r is not a modelx model: missing '_system.json' at root"
             % str(model_path))
 
-    model = serializer.ModelReader(system, path).read_model(**kwargs)
+    if params and params["serializer_version"] >= 7:
+        reader = serializer.ModelReader(
+            system, path, lazy=lazy, max_workers=max_workers,
+            process_workers=process_workers)
+    else:
+        reader = serializer.ModelReader(system, path)
+    model = reader.read_model(**kwargs)
     model.path = path
     return model
@@ -77,18 +77,27 @@ class IOSpecUnpickler(pickle.Unpickler):
             raise pickle.UnpicklingError("unsupported persistent object")
 
 
+def get_buffers(reader):
+    """Return the out-of-band buffers of the pickled data of ``reader``"""
+    # Readers before version 8 have no out-of-band buffers
+    iter_buffers = getattr(reader, "iter_pickle_buffers", None)
+    return iter_buffers() if iter_buffers else None
+
+
 class ModelPickler(pickle.Pickler):
 
-    def __init__(self, file, writer):
-        super().__init__(file)
+    def __init__(self, file, writer, **kwargs):
+        super().__init__(file, **kwargs)
         self.writer = writer
+        # Writers before version 7 identify objects by id()
+        self.get_id = getattr(writer, "get_id", id)
 
     def persistent_id(self, obj):
 
         if id(obj) in self.writer.value_id_map:
             return "DataValue", self.writer.value_id_map[id(obj)]
         elif isinstance(obj, BaseIOSpec):
-            return "BaseIOSpec", id(obj)
+            return "BaseIOSpec", self.get_id(obj)
         elif isinstance(obj, BaseSharedIO):
             return "BaseSharedIO", obj.path.as_posix(), obj.__class__, obj.persistent_args
         elif isinstance(obj, BaseNode):
@@ -119,7 +128,7 @@ class ModelPickler(pickle.Pickler):
 class ModelUnpickler(pickle.Unpickler):
 
     def __init__(self, file, reader):
-        super().__init__(file)
+        super().__init__(file, buffers=get_buffers(reader))
         self.reader = reader
         self.manager = reader.system.iomanager
         self.model = reader.model
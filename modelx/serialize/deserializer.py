@@ -1,3 +1,4 @@
+import io
 import tokenize
 import pathlib
 from collections import namedtuple
@@ -116,51 +117,68 @@ class ReadLine:
 
 def get_statement_tokens(path):
 
+    path = path if isinstance(path, pathlib.PurePath) else pathlib.Path(path)
+
+    with FileForTokenizer(path) as f:
+        return _split_statements(f)
+
+
+def get_statement_tokens_from_bytes(source: bytes):
+    """Same as :func:`get_statement_tokens` but from the contents of a file
+
+    Used in worker processes, as the tokens can be pickled.
+    """
+    buffer = io.BytesIO(source)
+    encoding, _ = tokenize.detect_encoding(buffer.readline)
+    buffer.seek(0)
+    with io.TextIOWrapper(buffer, encoding) as f:
+        return _split_statements(f)
+
+
+def _split_statements(f):
+
     result = []
     indent_level = 0
     cur_stmt = StatementTokens([], ReadLine.Sections[0])
 
-    path = path if isinstance(path, pathlib.PurePath) else pathlib.Path(path)
-
-    with FileForTokenizer(path) as f:
-        readline = ReadLine(f)
-
-        for token in tokenize.generate_tokens(readline):
-
-            token_type, token_str, (start_line, start_col), _, _ = token
-
-            if token_type == tokenize.INDENT:
-                if indent_level == 0:
-                    # assert not current_stmt
-                    popped = result.pop()
-                    popped.extend(cur_stmt)
-                    popped.section = readline.cur_sec
-                    cur_stmt = popped
-                indent_level += 1
-                # current_stmt.append(token)
-            elif token_type == tokenize.DEDENT:
-                indent_level -= 1
-                if indent_level == 0:
-                    # DEDENT comes after NL and COMMENT
-                    # Remove last NL and COMMENT before DEDENT
-                    while cur_stmt[-1].type in (tokenize.NL, tokenize.COMMENT):
-                        tk = cur_stmt.pop()
-                        if tk.line.strip() == SECTION_DIVIDER:
-                            cur_stmt.section = readline.prev_sec
-                    result.append(cur_stmt)
-                    cur_stmt = StatementTokens([], readline.cur_sec)
-            elif token_type == tokenize.NEWLINE:
-                if indent_level == 0:
-                    while cur_stmt[0].type in (tokenize.NL, tokenize.COMMENT):
-                        cur_stmt.pop(0)
-
-                    result.append(cur_stmt)
-                    cur_stmt = StatementTokens([], readline.cur_sec)
-            elif token_type in (tokenize.ENDMARKER,):
-                pass
-            else:
-                cur_stmt.append(token)
-                cur_stmt.section = readline.cur_sec
+    readline = ReadLine(f)
+
+    for token in tokenize.generate_tokens(readline):
+
+        token_type, token_str, (start_line, start_col), _, _ = token
+
+        if token_type == tokenize.INDENT:
+            if indent_level == 0:
+                # assert not current_stmt
+                popped = result.pop()
+                popped.extend(cur_stmt)
+                popped.section = readline.cur_sec
+                cur_stmt = popped
+            indent_level += 1
+            # current_stmt.append(token)
+        elif token_type == tokenize.DEDENT:
+            indent_level -= 1
+            if indent_level == 0:
+                # DEDENT comes after NL and COMMENT
+                # Remove last NL and COMMENT before DEDENT
+                while cur_stmt[-1].type in (tokenize.NL, tokenize.COMMENT):
+                    tk = cur_stmt.pop()
+                    if tk.line.strip() == SECTION_DIVIDER:
+                        cur_stmt.section = readline.prev_sec
+                result.append(cur_stmt)
+                cur_stmt = StatementTokens([], readline.cur_sec)
+        elif token_type == tokenize.NEWLINE:
+            if indent_level == 0:
+                while cur_stmt[0].type in (tokenize.NL, tokenize.COMMENT):
+                    cur_stmt.pop(0)
+
+                result.append(cur_stmt)
+                cur_stmt = StatementTokens([], readline.cur_sec)
+        elif token_type in (tokenize.ENDMARKER,):
+            pass
+        else:
+            cur_stmt.append(token)
+            cur_stmt.section = readline.cur_sec
 
     return result
 
@@ -1,7 +1,7 @@
 import pickle
 import copy
 
-from .custom_pickle import ModelUnpickler
+from .custom_pickle import ModelUnpickler, get_buffers
 from pandas.compat import pickle_compat as pc
 
 # Since pickle._Unpickler is written in pure Python and
@@ -38,7 +38,7 @@ class CompatUnpickler(CompatBase):
     """Unpickler to fix Pandas incompatibility issue"""
 
     def __init__(self, file, reader):
-        super().__init__(file)
+        super().__init__(file, buffers=get_buffers(reader))
         self.reader = reader
         self.manager = reader.system.iomanager
         self.model = reader.model
@@ -951,6 +951,7 @@ class ModelReader:
             self.parse_source(path_ / "__init__.py", self.model)
             spaces = self.result
 
+        self._prepare_sources(path_ / name / "__init__.py" for name in spaces)
         for name in spaces:
             space = target.new_space(name=name)
             self.parse_source(path_ / name / "__init__.py", space)
@@ -961,6 +962,10 @@ class ModelReader:
 
         return target
 
+    def _prepare_sources(self, paths):
+        # Called with the sources of the spaces about to be parsed
+        pass
+
     def _parse_dynamic_inputs(self, path_, static_parent):
 
         file = path_ / "_data/_dynamic_inputs"
@@ -17,18 +17,32 @@
 Adds a pseudo-python header comment block to serialized ``__init__.py`` files
 on top of serializer 6. The DocstringParser is relaxed so the docstring no
 longer needs to start at line 1, allowing the header comments to come first.
+
+When written incrementally, ``_system.json`` has a ``manifest`` entry
+that maps the path of each file in the model to the SHA-256 hash of
+its content, and only the files that differ from the files on disk
+are written. The spaces not changed since the previous incremental
+write of the model in the session, as recorded in its
+:class:`~modelx.core.changelog.ChangeLog`, are not encoded again.
 """
+import os
 import sys
 import json
+import hashlib
+import contextlib
 import pathlib
 import tempfile
 import shutil
 import zipfile
 import tokenize
+import concurrent.futures
 import modelx as mx
+from modelx.core.util import abs_to_rel_tuple
 from . import ziputil
-from .deserializer import get_statement_tokens, StatementTokens
+from .deserializer import (
+    get_statement_tokens, get_statement_tokens_from_bytes, StatementTokens)
 from . import serializer_6
+from .custom_pickle import IOSpecPickler, ModelPickler
 
 
 PSEUDO_PYTHON_HEADER = """\
@@ -39,6 +53,7 @@ PSEUDO_PYTHON_HEADER = """\
 
 
 MACROS_FILE = "_macros.py"
+SYSTEM_FILE = "_system.json"
 
 
 class MacroEncoder(serializer_6.BaseEncoder):
@@ -56,17 +71,177 @@ class MacroEncoder(serializer_6.BaseEncoder):
         return src
 
 
+class TupleID(serializer_6.TupleID):
+    """TupleID whose tuples are identified by the IDs of the writer"""
+
+    def serialize(self, writer):
+        keys = []
+        for key in self:
+            if isinstance(key, str):
+                keys.append('"%s"' % key)
+            elif isinstance(key, tuple):
+                keys.append(str(writer.get_id(key)))
+
+        if len(keys) == 1:
+            keystr = "(%s,)" % keys[0]
+        else:
+            keystr = "(%s)" % ", ".join(keys)
+
+        return keystr
+
+    def pickle_args(self, writer):
+        for key in self:
+            if isinstance(key, tuple):
+                writer.pickle(key)
+            elif isinstance(key, str):
+                pass
+            else:
+                raise ValueError("unknown tuple id")
+
+
 class ModelEncoder(serializer_6.ModelEncoder):
 
+    def __init__(self, writer, model, srcpath, datapath):
+        super().__init__(writer, model, srcpath, datapath)
+        self.refview_encoder = RefViewEncoder(
+            self.writer,
+            self.model.refs,
+            parent=self.model,
+            srcpath=self.srcpath
+        )
+
     def encode(self):
         return PSEUDO_PYTHON_HEADER + "\n\n" + super().encode()
 
 
 class SpaceEncoder(serializer_6.SpaceEncoder):
 
+    def __init__(self, writer, target, srcpath=None):
+        super().__init__(writer, target, srcpath=srcpath)
+        self.refview_encoder = RefViewEncoder(
+            self.writer,
+            self.space._own_refs,
+            parent=self.space,
+            srcpath=srcpath
+        )
+        self.cells_encoders = [
+            CellsEncoder(writer, e.target, parent=e.parent, name=e.name,
+                         srcpath=e.srcpath, datapath=e.datapath)
+            for e in self.cells_encoders]
+
     def encode(self):
         return PSEUDO_PYTHON_HEADER + "\n\n" + super().encode()
 
+    def _pickle_dynamic_space(self, file, space, static_parent):
+
+        for cells in space.cells.values():
+            for key in cells._impl.input_keys:
+                keyid = self.writer.pickle(key)
+                valid = self.writer.pickle(cells._impl.data[key])
+
+                idtuple = TupleID(abs_to_rel_tuple(
+                    cells._idtuple, static_parent._idtuple))
+                idtuple.pickle_args(self.writer)
+                file.write("(%s, %s, %s)\n" % (
+                    idtuple.serialize(self.writer), keyid, valid))
+
+                if self.writer.log_input:
+                    self.writer.input_log.append(
+                        serializer_6.output_input(cells, key))
+
+        for subspace in space.named_spaces.values():
+            self._pickle_dynamic_space(file, subspace, static_parent)
+
+        for subspace in space._named_itemspaces.values():
+            self._pickle_dynamic_space(file, subspace, static_parent)
+
+
+class RefViewEncoder(serializer_6.RefViewEncoder):
+
+    def __init__(self, writer, target, parent, name=None, srcpath=None):
+        super().__init__(writer, target, parent, name, srcpath)
+        self.encoders = [
+            EncoderSelector.select(e.target, writer)(
+                writer, e.target, parent=e.parent, name=e.name,
+                srcpath=e.srcpath, datapath=e.datapath)
+            for e in self.encoders]
+
+
+class CellsEncoder(serializer_6.CellsEncoder):
+
+    def pickle_value(self):
+        cellsdata = []
+        for key in self.target._impl.data:
+            if key in self.target._impl.input_keys:
+                value = self.target._impl.data[key]
+                cellsdata.append(
+                    (self.writer.pickle(key), self.writer.pickle(value)))
+
+                if self.writer.log_input:
+                    self.writer.input_log.append(
+                        serializer_6.output_input(self.target, key))
+
+        if cellsdata:   # Save IDs
+
+            def write_dataid(f):
+                for keyid, valid in cellsdata:
+                    f.write("(%s, %s)\n" % (keyid, valid))
+
+            ziputil.write_file_utf8(write_dataid, self.datapath, "t",
+                                    compression=self.writer.compression,
+                                    compresslevel=self.writer.compresslevel)
+
+
+class InterfaceRefEncoder(serializer_6.InterfaceRefEncoder):
+
+    def encode(self):
+        idtuple = TupleID(abs_to_rel_tuple(
+            self.target.value._idtuple,
+            self.parent._idtuple
+        ))
+        return "(\"Interface\", %s, \"%s\")" % (
+            idtuple.serialize(self.writer),
+            self.target.refmode
+        )
+
+    def pickle_value(self):
+        idtuple = TupleID(abs_to_rel_tuple(
+            self.target.value._idtuple,
+            self.parent._idtuple
+        ))
+        idtuple.pickle_args(self.writer)
+
+
+class IOSpecEncoder(serializer_6.IOSpecEncoder):
+
+    def encode(self):
+        value_id = self.writer.get_id(self.target.value)
+        spec_id = self.writer.value_id_map[id(self.target.value)]
+        return "(\"IOSpec\", %s, %s)" % (value_id, spec_id)
+
+    def pickle_value(self):
+        self.writer.pickle(self.target.value)
+
+
+class PickleEncoder(serializer_6.PickleEncoder):
+
+    def pickle_value(self):
+        self.writer.pickle(self.target.value)
+
+    def encode(self):
+        return "(\"Pickle\", %s)" % self.writer.get_id(self.target.value)
+
+
+class EncoderSelector(serializer_6.BaseSelector):
+
+    classes = [
+        InterfaceRefEncoder,
+        serializer_6.LiteralEncoder,
+        IOSpecEncoder,
+        serializer_6.ModuleEncoder,
+        PickleEncoder
+    ]
+
 
 class DocstringParser(serializer_6.DocstringParser):
     """Docstring at module level. Allows docstrings not on line 1."""
@@ -96,29 +271,150 @@ class ParserSelector(serializer_6.BaseSelector):
     ]
 
 
+def get_manifest(root):
+    """Return the manifest in ``_system.json`` under ``root``
+
+    An empty dict is returned if the model at ``root`` does not exist
+    or was not written incrementally.
+    """
+    try:
+        with open(pathlib.Path(root) / SYSTEM_FILE, encoding="utf-8") as f:
+            params = json.load(f)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        return {}
+
+    return params.get("manifest", {})
+
+
+def get_file_hash(path):
+    """Return the SHA-256 hash of the file at ``path`` or None if missing"""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+
+
+class WriteState:
+    """State of an incremental write kept for the next write to the path
+
+    Kept in :attr:`ChangeLog.writes<modelx.core.changelog.ChangeLog.writes>`.
+    ``spaces`` maps each space written to a tuple of the dict of
+    the paths of its files to their hashes and the set of the IDs its
+    files refer to. ``ids`` and ``pickled`` keep the IDs of the objects
+    in ``data.pickle``, so that the files of the spaces not changed
+    remain valid in the next write.
+    """
+
+    __slots__ = ("serial", "options", "ids", "last_id", "pickled", "spaces")
+
+    def __init__(self, serial, options, ids, last_id, pickled, spaces):
+        self.serial = serial
+        self.options = options
+        self.ids = ids
+        self.last_id = last_id
+        self.pickled = pickled
+        self.spaces = spaces
+
+
 class ModelWriter(serializer_6.ModelWriter):
 
     version = 7
+    space_encoder = SpaceEncoder
+
+    def __init__(self, system, model, path, is_zip, log_input,
+                 compression, compresslevel, incremental=False):
+        self._space_ids = None      # IDs referred to by the current space
+        super().__init__(system, model, path, is_zip=is_zip,
+                         log_input=log_input,
+                         compression=compression,
+                         compresslevel=compresslevel)
+        self._ids = {}  # id(obj) -> (ID in output, obj)
+        self._last_id = 0
+        self._set_iospecs()
+        self.incremental = incremental
+        self.state = None
+        self.written_spaces = {}    # space -> (relpaths, IDs)
+        self.reused_spaces = {}     # space -> (files, IDs)
+        if incremental:
+            self._load_state()
+
+    def _set_iospecs(self):
+        self.iospecs = {self.get_id(sp): sp for sp in self.model.iospecs}
+        self.value_id_map = {   # id(value) -> ID of iospec
+            id(sp.value): self.get_id(sp) for sp in self.model.iospecs}
+
+    def _load_state(self):
+        changelog = self.model._impl.changelog
+        self.serial = changelog.serial
+        state = changelog.writes.get(str(self.root.resolve()))
+        if state is None or state.options != self._get_options():
+            return
+
+        # Keep the IDs of the last write
+        self.state = state
+        self._ids = dict(state.ids)
+        self._last_id = state.last_id
+        self._set_iospecs()
+
+    def _get_options(self):
+        # Options that change the files written
+        return (self.version,)
+
+    def get_id(self, obj):
+        """Return the ID of ``obj`` in the output
+
+        IDs are numbered in the order objects are first written,
+        so that an unchanged model is written to identical files.
+        """
+        try:
+            result = self._ids[id(obj)][0]
+        except KeyError:
+            # Keep obj so that id(obj) is not reused
+            self._last_id += 1
+            result = self._last_id
+            self._ids[id(obj)] = (result, obj)
+
+        if self._space_ids is not None:
+            self._space_ids.add(result)
+        return result
+
+    def pickle(self, obj):
+        """Add ``obj`` to the data to pickle and return its ID"""
+        result = self.get_id(obj)
+        if result not in self.pickledata:
+            self.pickledata[result] = obj
+        return result
 
     def write_model(self):
 
+        session = None  # Writes all files through one open zip file
         try:
             if self.is_zip:
                 tempdir = tempfile.TemporaryDirectory()
                 self.temp_root = pathlib.Path(tempdir.name) / self.root.name
                 self.work_dir = pathlib.Path(tempdir.name) / (self.root.stem + '_temp')
                 self.work_dir.mkdir(parents=True, exist_ok=True)
+            elif self.incremental:
+                # Write all files in a staging directory and copy changed ones
+                tempdir = tempfile.TemporaryDirectory()
+                self.temp_root = pathlib.Path(tempdir.name) / self.root.name
+                self.work_dir = self.temp_root
 
             self.system.serializing = self
             self.system.iomanager.serializing = True
 
             ziputil.make_root(self.temp_root, self.is_zip, self.compression, self.compresslevel)
-            ziputil.write_str(json.dumps(
-                {"modelx_version": mx.VERSION[:3],
-                 "serializer_version": self.version}),
-                self.temp_root / "_system.json",
-                compression=self.compression,
-                compresslevel=self.compresslevel)
+            if self.is_zip:
+                session = ziputil.ZipWriter(
+                    self.temp_root, self.compression,
+                    self.compresslevel).open()
+            if not self.incremental:
+                ziputil.write_str(json.dumps(
+                    {"modelx_version": mx.VERSION[:3],
+                     "serializer_version": self.version}),
+                    self.temp_root / SYSTEM_FILE,
+                    compression=self.compression,
+                    compresslevel=self.compresslevel)
 
             encoder = ModelEncoder(
                 self, self.model,
@@ -142,35 +438,180 @@ class ModelWriter(serializer_6.ModelWriter):
                 ziputil.archive_dir(self.work_dir, self.temp_root,
                                     compression=self.compression,
                                     compresslevel=self.compresslevel)
+                session.close()
                 if self.root.exists() and self.root.is_dir():
                     raise IOError("'%s' is an existing directory" % self.root.name)
                 else:
                     shutil.move(self.temp_root, self.root)
 
+            elif self.incremental:
+                self._update_dir()
+
         finally:
+            if session:
+                session.close()
             self.system.serializing = None
             self.system.iomanager.serializing = None
-            if self.is_zip:
+            if self.is_zip or self.incremental:
                 tempdir.cleanup()
 
+    def write_pickledata(self):
+        if self.model.iospecs:
+            file = self.temp_root / "_data/iospecs.pickle"
+            ziputil.write_file_utf8(
+                lambda f: IOSpecPickler(f).dump(self.iospecs),
+                file, mode="b",
+                compression=self.compression,
+                compresslevel=self.compresslevel
+            )
+        if self.pickledata:
+            # In the order of IDs regardless of the spaces reused
+            self.pickledata = dict(sorted(self.pickledata.items()))
+            self._write_pickle(self.temp_root / "_data/data.pickle")
+
+    def _write_pickle(self, file):
+        ziputil.write_file_utf8(
+            lambda f: ModelPickler(f, writer=self).dump(self.pickledata),
+            file, mode="b",
+            compression=self.compression,
+            compresslevel=self.compresslevel
+        )
+
+    def _update_dir(self):
+        """Update ``root`` with the files written in ``temp_root``
+
+        Files are copied only if their contents differ from the files
+        on disk. The files of the reused spaces are kept.
+        Files in the previous manifest that are no longer written are
+        deleted. Other files in ``root`` are left as they are.
+        """
+        if self.root.exists() and not self.root.is_dir():
+            raise IOError("'%s' is not a directory" % self.root.name)
+
+        old_manifest = get_manifest(self.root)
+        manifest = {}
+        for files, _ in self.reused_spaces.values():
+            manifest.update(files)
+
+        for src in sorted(self.temp_root.rglob("*")):
+            if not src.is_file():
+                continue
+            relpath = src.relative_to(self.temp_root).as_posix()
+            content = src.read_bytes()
+            manifest[relpath] = hashlib.sha256(content).hexdigest()
+
+            dst = self.root / relpath
+            if not (dst.is_file() and dst.stat().st_size == len(content)
+                    and get_file_hash(dst) == manifest[relpath]):
+                # Replace instead of overwriting, as dst may be mapped
+                tmp = dst.with_name(dst.name + ".tmp")
+                tmp.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(content)
+                os.replace(tmp, dst)
+
+        for relpath in old_manifest.keys() - manifest.keys():
+            dst = self.root / relpath
+            if dst.is_file():
+                dst.unlink()
+            parent = dst.parent
+            while parent != self.root and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+
+        ziputil.write_str(json.dumps(
+            {"modelx_version": mx.VERSION[:3],
+             "serializer_version": self.version,
+             "manifest": manifest}, indent=2),
+            self.root / SYSTEM_FILE)
+
+        self._save_state(manifest)
+
+    def _save_state(self, manifest):
+        spaces = dict(self.reused_spaces)
+        for space, (relpaths, ids) in self.written_spaces.items():
+            spaces[space] = ({p: manifest[p] for p in relpaths}, ids)
+
+        kept = self.pickledata.keys() | self.iospecs.keys()
+        self.model._impl.changelog.writes[str(self.root.resolve())] = (
+            WriteState(
+                serial=self.serial,
+                options=self._get_options(),
+                ids={k: v for k, v in self._ids.items() if v[0] in kept},
+                last_id=self._last_id,
+                pickled=self.pickledata,
+                spaces=spaces))
+
     def _write_recursive(self, encoder):
 
-        ziputil.write_str_utf8(encoder.encode(), encoder.srcpath,
-                               compression=self.compression,
-                               compresslevel=self.compresslevel)
+        space = None    # Space whose files are tracked for the next write
+        is_reused = False
+        if self.incremental and encoder.target is not self.model:
+            space = encoder.target._impl
+            is_reused = self._reuse_space(space)
 
-        for space in encoder.target.spaces.values():
+        if not is_reused:
+            saved = self._space_ids
+            ids = self._space_ids = set() if space is not None else None
+            ziputil.write_str_utf8(encoder.encode(), encoder.srcpath,
+                                   compression=self.compression,
+                                   compresslevel=self.compresslevel)
+            self._space_ids = saved
 
-            srcpath = (encoder.srcpath.parent / space.name / "__init__.py")
+        for child in encoder.target.spaces.values():
 
-            e = SpaceEncoder(
+            srcpath = (encoder.srcpath.parent / child.name / "__init__.py")
+
+            e = self.space_encoder(
                 self,
-                space,
+                child,
                 srcpath=srcpath
                 )
             self._write_recursive(e)
 
+        if is_reused:
+            return
+
+        saved, self._space_ids = self._space_ids, ids
         encoder.instruct().execute()
+        self._space_ids = saved
+
+        if space is not None and not space._named_itemspaces:
+            # Dynamic inputs are not tracked for skipping
+            srcdir = encoder.srcpath.parent
+            paths = [encoder.srcpath] + sorted(
+                p for p in (srcdir / "_data").rglob("*") if p.is_file())
+            self.written_spaces[space] = (
+                [p.relative_to(self.temp_root).as_posix() for p in paths],
+                ids)
+
+    def _reuse_space(self, space):
+        """Reuse the files of ``space`` if not changed since the last write
+
+        The files are reused if no change to ``space`` is recorded
+        since the last write and they have the same hashes on disk
+        as when written. The objects the files refer to by ID are
+        added to ``pickledata``.
+        """
+        state = self.state
+        if state is None or self.log_input or space._named_itemspaces:
+            return False
+
+        record = state.spaces.get(space)
+        if (record is None or space.model.changelog.last_changed(
+                space) > state.serial):
+            return False
+
+        files, ids = record
+        for relpath, hash_ in files.items():
+            if get_file_hash(self.root / relpath) != hash_:
+                return False
+
+        for id_ in ids:
+            if id_ in state.pickled:
+                self.pickledata[id_] = state.pickled[id_]
+
+        self.reused_spaces[space] = record
+        return True
 
     def _write_macros(self):
         macros = self.model.macros
@@ -261,14 +702,144 @@ class MacroParserSelector(serializer_6.BaseSelector):
     ]
 
 
+_UNREAD = object()     # Pickle data not read yet
+
+
+class LazySpaceLoader:
+    """Read the top-level spaces of a lazily read model on first access
+
+    Assigned to ``ModelImpl.lazy_loader`` by :class:`ModelReader`.
+    Each top-level space is read with its whole subtree, together with
+    the spaces it depends on, when it is first accessed.
+    """
+
+    def __init__(self, reader, names):
+        self.reader = reader
+        self.names = list(names)    # Names of the spaces not read yet
+
+    def load(self, name):
+        if name not in self.names:
+            return
+
+        self.names.remove(name)
+        reader = self.reader
+        system = reader.system
+        model = reader.model
+
+        saved = (reader.instructions,
+                 system.serializing,
+                 system.iomanager.serializing)
+        reader.instructions = serializer_6.CompoundInstruction()
+        system.serializing = reader
+        system.iomanager.serializing = True
+        try:
+            with reader.open_archive():
+                reader.parse_dir(reader.path, target=model, spaces=[name])
+                reader.execute_instructions()
+        except BaseException:
+            if name in model._impl.spaces:
+                model._impl.del_attr(name)
+            self.names.append(name)
+            raise
+        finally:
+            (reader.instructions,
+             system.serializing,
+             system.iomanager.serializing) = saved
+
+        if not self.names:
+            model._impl.lazy_loader = None
+
+    def load_all(self):
+        while self.names:
+            self.load(self.names[0])
+
+
 class ModelReader(serializer_6.ModelReader):
 
     version = ModelWriter.version
+    parser_selector = ParserSelector
+    pickledata_loaders = ["load_pickledata"]
+
+    def __init__(self, system, path, lazy=False, max_workers=None,
+                 process_workers=None):
+        super().__init__(system, path)
+        self.lazy = lazy
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self._source_pool = None
+        self._sources = {}  # path -> Future of statement tokens
+        if lazy:
+            self._pickledata = self._iospecs = _UNREAD
+
+    @property
+    def pickledata(self):
+        if self._pickledata is _UNREAD:
+            self.read_pickledata()
+        return self._pickledata
+
+    @pickledata.setter
+    def pickledata(self, value):
+        self._pickledata = value
+
+    @property
+    def iospecs(self):
+        if self._iospecs is _UNREAD:
+            self.read_pickledata()
+        return self._iospecs
+
+    @iospecs.setter
+    def iospecs(self, value):
+        self._iospecs = value
+
+    def read_pickledata(self):
+        self._pickledata = self._iospecs = None
+        super().read_pickledata()
+
+    def _prepare_sources(self, paths):
+        # Tokenise the sources in the worker processes ahead of parsing
+        if self._source_pool is None:
+            return
+        for path_ in paths:
+            source = ziputil.read_file(lambda f: f.read(), path_, "b")
+            self._sources[path_] = self._source_pool.submit(
+                get_statement_tokens_from_bytes, source)
+
+    @contextlib.contextmanager
+    def open_source_pool(self, max_workers):
+        """Tokenise space sources in ``max_workers`` processes
+
+        Only tokenising and splitting into statements are done in the
+        processes. The parsers and their instructions, which
+        modify the model, are still run one by one in this process.
+        """
+        if not max_workers:
+            yield
+            return
+
+        self._source_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers)
+        try:
+            # Start the processes now, as forking them later while
+            # threads are decompressing archive members is unsafe.
+            self._source_pool.submit(int).result()
+            yield
+        finally:
+            for future in self._sources.values():
+                future.cancel()
+            self._sources.clear()
+            self._source_pool.shutdown()
+            self._source_pool = None
 
     def parse_source(self, path_, obj):
 
-        for stmt in get_statement_tokens(path_):
-            parser = ParserSelector.select(stmt)(
+        future = self._sources.pop(path_, None)
+        if future is not None:
+            stmts = future.result()
+        else:
+            stmts = get_statement_tokens(path_)
+
+        for stmt in stmts:
+            parser = self.parser_selector.select(stmt)(
                 stmt, self, obj, srcpath=path_
             )
             parser.set_instruction()
@@ -284,9 +855,37 @@ class ModelReader(serializer_6.ModelReader):
             parser = parser_cls(stmt, self, self.model, srcpath=macro_path)
             parser.set_instruction()
 
+    def open_archive(self, max_workers=None):
+        """Return a session to read the zipped model through one handle"""
+        if zipfile.is_zipfile(self.path):
+            return ziputil.ZipReader(self.path, max_workers=max_workers)
+        else:
+            return contextlib.nullcontext()
+
     def _read_model_inner(self):
-        model = self.parse_dir()
+        if self.lazy:
+            # Spaces read lazily later are not decompressed in advance
+            with self.open_archive():
+                return self._read_model_lazily()
+
+        with self.open_source_pool(self.process_workers), \
+                self.open_archive(self.max_workers):
+            model = self.parse_dir()
+            self.parse_macros()
+            self.execute_instructions()
+            return model
+
+    def _read_model_lazily(self):
+        # Read the model without its spaces
+        model = self.model = mx.new_model()
+        self.parse_source(self.path / "__init__.py", model)
+        spaces = self.result
         self.parse_macros()
+        model._impl.lazy_loader = LazySpaceLoader(self, spaces)
+        self.execute_instructions()
+        return model
+
+    def execute_instructions(self):
         self.instructions.execute_selected_methods([
             "doc",
             "set_formula",
@@ -297,13 +896,13 @@ class ModelReader(serializer_6.ModelReader):
             "new_macro",
         ])
         self.instructions.execute_selected_methods(["add_bases"])
-        self.read_pickledata()
-        self.instructions.execute_selected_methods(["load_pickledata"])
+        if not self.lazy:   # Otherwise read when first needed
+            self.read_pickledata()
+        self.instructions.execute_selected_methods(
+            self.pickledata_loaders)
         self.instructions.execute_selected_methods(
             ["__setattr__", "set_ref"])
         self.instructions.execute_selected_methods(
             ["_set_dynamic_inputs"])
 
         assert not self.instructions
-
-        return model
@@ -0,0 +1,308 @@
+# Copyright (c) 2017-2026 Fumito Hamamura <fumito.ham@gmail.com>
+
+# This library is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation version 3.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Serializer version 8.
+
+Adds files that readers of version 7 do not read on top of serializer 7.
+
+When written with ``array_data``, the input values of a Cells whose keys
+are integers and whose values are numbers are written in
+``_data/<cells>.npy`` as an N-dimensional array instead of
+``data.pickle``. The offsets of the keys are written in
+``_data/<cells>.json``, and ``_data/<cells>.mask.npy`` marks the elements
+that have values unless all of them do. The arrays are memory-mapped
+when the model is read from a folder, except on Windows
+(see :data:`MAP_FILES`).
+
+``_data/data.pickle`` is written by pickle protocol 5. The buffers of
+values that are at least :data:`OUT_OF_BAND_SIZE` bytes, such as the
+data of NumPy arrays and pandas objects, are written out of band
+in ``_data/buffers/<n>.bin`` in the order they are pickled.
+When the model is read from a folder, the buffers are memory-mapped
+copy-on-write, except on Windows.
+"""
+import io
+import sys
+import json
+import math
+import mmap
+import numbers
+import itertools
+from . import ziputil
+from . import serializer_6
+from . import serializer_7
+from .custom_pickle import ModelPickler
+
+
+# Files mapped on Windows cannot be deleted or replaced,
+# so a model read from a folder could not be written back to it.
+MAP_FILES = sys.platform != "win32"
+
+ARRAY_DENSITY = 4   # Max ratio of the array size to the number of inputs
+
+
+def get_array_paths(datapath):
+    """Return the paths of the values, mask and offsets of input data"""
+    name = datapath.name
+    return (datapath.with_name(name + ".npy"),
+            datapath.with_name(name + ".mask.npy"),
+            datapath.with_name(name + ".json"))
+
+
+def get_input_array(cells):
+    """Return the input values of ``cells`` in an array
+
+    A tuple of the values, the offsets of the keys and the mask is
+    returned. The mask is :obj:`None` if all the elements have values.
+    :obj:`None` is returned instead if any key is not integers,
+    if any value is not an :obj:`int` or :obj:`float`,
+    or if the array would be :data:`ARRAY_DENSITY` times larger than
+    the number of the input values.
+    """
+    import numpy as np
+    from modelx.core.cells import MappedData
+
+    impl = cells._impl
+    data = impl.data
+    if (data.__class__ is MappedData and not data.hidden
+            and not impl.input_keys.others):
+        return data.values, data.offset, data.mask
+
+    nparams = len(cells.parameters)
+    if not nparams or not impl.input_keys:
+        return None
+
+    keys, values = [], []
+    for key in impl.input_keys:
+        for k in key:
+            if isinstance(k, bool) or not isinstance(k, numbers.Integral):
+                return None
+        keys.append(key)
+        values.append(data[key])
+
+    is_int = [isinstance(v, numbers.Integral) for v in values]
+    if any(isinstance(v, (bool, np.bool_)) for v in values) or (
+            any(is_int) and not all(is_int)):
+        return None
+
+    values = np.asarray(values)
+    keys = np.asarray(keys)
+    if values.dtype.kind not in "iuf" or keys.dtype.kind not in "iu":
+        return None
+
+    offset = keys.min(axis=0)
+    shape = tuple(int(n) for n in keys.max(axis=0) - offset + 1)
+    size = math.prod(shape)
+    if size > ARRAY_DENSITY * len(values):
+        return None
+
+    index = tuple((keys - offset).T)
+    array = np.zeros(shape, dtype=values.dtype)
+    array[index] = values
+    if size == len(values):
+        mask = None
+    else:
+        mask = np.zeros(shape, dtype=np.bool_)
+        mask[index] = True
+
+    return array, tuple(int(o) for o in offset), mask
+
+
+class CellsEncoder(serializer_7.CellsEncoder):
+
+    def pickle_value(self):
+        result = get_input_array(self.target) if (
+            self.writer.array_data) else None
+        if result is None:
+            return super().pickle_value()
+
+        import numpy as np
+
+        values, offset, mask = result
+        values_path, mask_path, offset_path = get_array_paths(self.datapath)
+        kwargs = {"compression": self.writer.compression,
+                  "compresslevel": self.writer.compresslevel}
+        ziputil.write_file_utf8(
+            lambda f: np.save(f, values, allow_pickle=False),
+            values_path, "b", **kwargs)
+        if mask is not None:
+            ziputil.write_file_utf8(
+                lambda f: np.save(f, mask, allow_pickle=False),
+                mask_path, "b", **kwargs)
+        ziputil.write_str_utf8(
+            json.dumps({"offset": list(offset)}), offset_path, **kwargs)
+
+        if self.writer.log_input:
+            for key in self.target._impl.input_keys:
+                self.writer.input_log.append(
+                    serializer_6.output_input(self.target, key))
+
+
+class SpaceEncoder(serializer_7.SpaceEncoder):
+
+    def __init__(self, writer, target, srcpath=None):
+        super().__init__(writer, target, srcpath=srcpath)
+        self.cells_encoders = [
+            CellsEncoder(writer, e.target, parent=e.parent, name=e.name,
+                         srcpath=e.srcpath, datapath=e.datapath)
+            for e in self.cells_encoders]
+
+
+def load_array(path):
+    import numpy as np
+
+    if ziputil.find_zip_parent(path):
+        return ziputil.read_file(
+            lambda f: np.load(io.BytesIO(f.read()), allow_pickle=False),
+            path, "b")
+    elif MAP_FILES:
+        return np.load(path, mmap_mode="r", allow_pickle=False)
+    else:
+        return np.load(path, allow_pickle=False)
+
+
+OUT_OF_BAND_SIZE = 1 << 20  # Min size of buffers pickled out of band
+
+
+def get_buffer_path(datadir, index):
+    """Return the path of an out-of-band buffer of ``data.pickle``"""
+    return datadir / "buffers" / ("%d.bin" % index)
+
+
+def read_buffer(f):
+    buffer = bytearray()
+    for chunk in iter(lambda: f.read(1 << 24), b""):
+        buffer += chunk
+    return buffer
+
+
+def load_buffer(path):
+    """Return a writable buffer of the contents of ``path``
+
+    The file is memory-mapped copy-on-write if it is not in a zip file
+    and :data:`MAP_FILES` is ``True``, so the buffer is not written
+    back to the file. Otherwise, the file is read into a bytearray.
+    """
+    if ziputil.find_zip_parent(path):
+        return ziputil.read_file(read_buffer, path, "b")
+    with open(path, "rb") as f:
+        if MAP_FILES:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            return read_buffer(f)
+
+
+class CellsArrayDataMixin:
+    """Set the input values of a Cells from the array files if any"""
+
+    def set_instruction(self):
+        compinst = super().set_instruction()
+        if ziputil.exists(get_array_paths(self.datapath)[0]):
+            compinst.append(
+                serializer_6.Instruction(self.load_arraydata, priority=2))
+        return compinst
+
+    def load_arraydata(self):
+        values_path, mask_path, offset_path = get_array_paths(self.datapath)
+        offset = json.loads(ziputil.read_str_utf8(offset_path))["offset"]
+        mask = load_array(mask_path) if ziputil.exists(mask_path) else None
+        self.impl.cells[self.cellsname].set_input_array(
+            load_array(values_path), offset, mask)
+
+
+class LambdaAssignParser(CellsArrayDataMixin,
+                         serializer_6.LambdaAssignParser):
+    pass
+
+
+class CellsFuncDefParser(CellsArrayDataMixin,
+                         serializer_6.CellsFuncDefParser):
+    pass
+
+
+class ParserSelector(serializer_6.BaseSelector):
+    classes = [
+        serializer_7.DocstringParser,
+        serializer_6.ImportFromParser,
+        serializer_6.RenameParser,
+        LambdaAssignParser,
+        serializer_6.LambdaDocstringParser,
+        serializer_6.ParentAttrAssignParser,
+        serializer_6.CellsAttrAssignParser,
+        serializer_6.RefAssignParser,
+        serializer_6.SpaceFuncDefParser,
+        CellsFuncDefParser
+    ]
+
+
+class ModelWriter(serializer_7.ModelWriter):
+
+    version = 8
+    space_encoder = SpaceEncoder
+
+    def __init__(self, system, model, path, is_zip, log_input,
+                 compression, compresslevel, incremental=False,
+                 array_data=False):
+        self.array_data = array_data
+        super().__init__(system, model, path, is_zip=is_zip,
+                         log_input=log_input,
+                         compression=compression,
+                         compresslevel=compresslevel,
+                         incremental=incremental)
+
+    def _get_options(self):
+        return super()._get_options() + (self.array_data,)
+
+    def _write_pickle(self, file):
+        buffers = []
+
+        def buffer_callback(buffer):
+            if memoryview(buffer).nbytes < OUT_OF_BAND_SIZE:
+                return True     # Pickled in band
+            buffers.append(buffer)
+            return False
+
+        if sys.version_info >= (3, 8):
+            kwargs = {"protocol": 5, "buffer_callback": buffer_callback}
+        else:
+            kwargs = {}
+
+        ziputil.write_file_utf8(
+            lambda f: ModelPickler(
+                f, writer=self, **kwargs).dump(self.pickledata),
+            file, mode="b",
+            compression=self.compression,
+            compresslevel=self.compresslevel
+        )
+        for i, buffer in enumerate(buffers):
+            ziputil.write_file(
+                lambda f: f.write(buffer.raw()),
+                get_buffer_path(file.parent, i),
+                mode="b",
+                compression=self.compression,
+                compresslevel=self.compresslevel
+            )
+            buffer.release()
+
+
+class ModelReader(serializer_7.ModelReader):
+
+    version = ModelWriter.version
+    parser_selector = ParserSelector
+    pickledata_loaders = ["load_pickledata", "load_arraydata"]
+
+    def iter_pickle_buffers(self):
+        """Yield the out-of-band buffers of ``data.pickle`` in order"""
+        for i in itertools.count():
+            yield load_buffer(get_buffer_path(self.path / "_data", i))
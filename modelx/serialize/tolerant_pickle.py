@@ -37,7 +37,7 @@ import pickle
 import warnings
 
 from . import ziputil
-from .custom_pickle import ModelUnpickler, IOSpecUnpickler
+from .custom_pickle import ModelUnpickler, IOSpecUnpickler, get_buffers
 
 try:
     from .pandas_compat import CompatBase as _CompatBase
@@ -102,7 +102,7 @@ class _TolerantUnpickler(_CompatBase):
     """Unpickler that substitutes placeholders for objects that fail to load."""
 
     def __init__(self, file, reader):
-        super().__init__(file)
+        super().__init__(file, buffers=get_buffers(reader))
         self.reader = reader
         self.manager = reader.system.iomanager
         self.model = reader.model
@@ -23,6 +23,7 @@ import os
 import warnings
 import time
 import tokenize
+from concurrent.futures import ThreadPoolExecutor
 
 
 def remove_extended_prefix(path):
@@ -56,6 +57,18 @@ def _compress_kwargs(compression, compresslevel):
     return kwargs
 
 
+def _compress_type_kwargs(compression, compresslevel):
+
+    kwargs = dict(
+        compress_type=compression,
+        compresslevel=compresslevel)
+
+    if sys.version_info[:2] <= (3, 6):
+        kwargs.pop("compresslevel")
+
+    return kwargs
+
+
 def make_root(root: pathlib.Path, is_zip: bool,
               compression=None,
               compresslevel=None):
@@ -94,6 +107,10 @@ def find_zip_parent(path: pathlib.Path):
 
 def exists(path: pathlib.Path):
 
+    session = _find_writer(path) or _find_reader(path)
+    if session:
+        return session.exists(get_archive_path(path, session.root))
+
     root = find_zip_parent(path)
 
     if root:
@@ -115,6 +132,10 @@ def exists(path: pathlib.Path):
 
 def is_dir(path: pathlib.Path):
 
+    session = _find_writer(path) or _find_reader(path)
+    if session:
+        return session.is_dir(get_archive_path(path, session.root))
+
     root = find_zip_parent(path)
 
     if root:
@@ -133,32 +154,255 @@ def is_dir(path: pathlib.Path):
         return path.is_dir()
 
 
-def _archive_exists(archive: str, file: zipfile.ZipFile):
+# Files larger than this are not read into memory for the worker pool
+_MAX_POOLED_SIZE = 1 << 26
+
+# Total size of the files a reader decompresses in advance
+_MAX_PREFETCH_SIZE = 1 << 30
+
+
+def _find_session(sessions, path: pathlib.Path):
+    """Return the session in ``sessions`` whose zip file contains ``path``"""
+    if sessions:
+        for session in reversed(sessions):  # Try without resolving first
+            if session.path == path or session.path in path.parents:
+                return session
+        p = remove_extended_prefix(path.resolve())
+        for session in reversed(sessions):
+            if session.root == p or session.root in p.parents:
+                return session
+    return None
+
 
-    if archive not in file.namelist():
-        return False
+def _find_writer(path: pathlib.Path):
+    """Return the open :class:`ZipWriter` whose zip file contains ``path``"""
+    return _find_session(ZipWriter.sessions, path)
+
+
+def _find_reader(path: pathlib.Path):
+    """Return the open :class:`ZipReader` whose zip file contains ``path``"""
+    return _find_session(ZipReader.sessions, path)
+
+
+def _find_zip_root(path: pathlib.Path):
+    """Return the zip file containing ``path`` and its open writer"""
+    writer = _find_writer(path)
+    if writer:
+        return writer.root, writer
     else:
-        warnings.warn(
-            "'%s' already exists in %s" % (archive, str(file)))
-        return True
+        return find_zip_parent(path), None
+
+
+def _find_zip_source(path: pathlib.Path):
+    """Return the zip file containing ``path`` and its open reader"""
+    reader = _find_reader(path)
+    if reader:
+        return reader.root, reader
+    else:
+        return find_zip_parent(path), None
+
+
+class BaseZipSession:
+    """Base class of sessions keeping a zip file open
+
+    Sessions can be nested. ``root`` is closed when the outermost
+    session is closed.
+    """
+
+    sessions = None     # Open sessions of each subclass
+
+    def __init__(self, root: pathlib.Path, max_workers=None):
+        self.path = pathlib.Path(root)
+        self.root = remove_extended_prefix(self.path.resolve())
+        self.max_workers = max_workers
+        self.file = None
+        self.names = set()
+        self.dirs = set()   # Parent directories of names, ending with "/"
+        self._pool = None
+        self._depth = 0
+
+    def open(self):
+        if not self._depth:
+            self.file = self._open_file()
+            for name in self.file.namelist():
+                self._add_name(name)
+            if self.max_workers:
+                self._pool = ThreadPoolExecutor(self.max_workers)
+            self.sessions.append(self)
+            try:
+                self.on_open()
+            except BaseException:
+                self._depth = 1
+                self.close()
+                raise
+        self._depth += 1
+        return self
+
+    def close(self):
+        if not self._depth:
+            return
+        self._depth -= 1
+        if not self._depth:
+            self.sessions.remove(self)
+            try:
+                self.on_close()
+            finally:
+                if self._pool:
+                    self._pool.shutdown()
+                    self._pool = None
+                self.file.close()
+                self.file = None
+                self.names.clear()
+                self.dirs.clear()
 
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_file(self):
+        raise NotImplementedError
+
+    def on_open(self):
+        pass
+
+    def on_close(self):
+        pass
+
+    def _add_name(self, name):
+        self.names.add(name)
+        i = name.find("/")
+        while i >= 0:
+            self.dirs.add(name[:i + 1])
+            i = name.find("/", i + 1)
+
+    def exists(self, archive: str):
+        return (not archive or archive in self.names
+                or archive + "/" in self.dirs)
+
+    def is_dir(self, archive: str):
+        return not archive or archive + "/" in self.dirs
 
-def is_valid_archive_path(archive, file: zipfile.ZipFile):
-    """Check archive is a valid file path
 
-    Check if ``archive`` is not an existing dir in ``file``.
-    Check if parents of ``archive`` are not paths to existing files.
+class ZipReader(BaseZipSession):
+    """Session to read files in a zip file through one open handle
+
+    While a session is open, the functions in this module that read
+    files in ``root`` read them through the session's
+    :class:`zipfile.ZipFile` object instead of opening ``root`` for
+    each file, and check the existence of files against the names
+    kept in the session instead of scanning the central directory.
+
+    If ``max_workers`` is given, the files in ``root`` are decompressed
+    in advance by a thread pool of ``max_workers`` threads in the order
+    they are stored, and kept in memory until they are read.
+    Large files are decompressed when they are read.
+    """
+
+    sessions = []
+
+    def __init__(self, root: pathlib.Path, max_workers=None):
+        super().__init__(root, max_workers)
+        self._prefetched = {}   # name -> future of the decompressed data
+
+    def _open_file(self):
+        return zipfile.ZipFile(self.root, mode="r")
+
+    def on_open(self):
+        if self._pool:
+            total = 0
+            for info in self.file.infolist():
+                if info.is_dir() or info.file_size > _MAX_POOLED_SIZE:
+                    continue
+                total += info.file_size
+                if total > _MAX_PREFETCH_SIZE:
+                    break
+                self._prefetched[info.filename] = self._pool.submit(
+                    self.file.read, info)
+
+    def on_close(self):
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+
+    def open_member(self, archive: str):
+        """Return a binary file object to read ``archive``"""
+        future = self._prefetched.pop(archive, None)
+        if future is not None:
+            return io.BytesIO(future.result())
+        return self.file.open(archive, mode="r")
+
+
+class ZipWriter(BaseZipSession):
+    """Session to write files in a zip file through one open handle
+
+    While a session is open, the functions in this module that write
+    files in ``root`` add the files through the session's
+    :class:`zipfile.ZipFile` object instead of opening ``root`` for
+    each file, and check the existing entries against the names
+    kept in the session instead of scanning the central directory.
     """
-    archive = str(archive)
 
-    if archive + "/" in set(n[:len(archive + "/")] for n in file.namelist()):
-        return False
+    sessions = []
 
-    for name in file.namelist():
-        if name.split("/") == archive.split("/")[-1]:
+    def __init__(self, root: pathlib.Path,
+                 compression=zipfile.ZIP_DEFLATED,
+                 compresslevel=None):
+
+        super().__init__(root)
+        self.compression = compression
+        self.compresslevel = compresslevel
+
+    def _open_file(self):
+        return zipfile.ZipFile(
+            self.root, mode="a",
+            **_compress_kwargs(self.compression, self.compresslevel))
+
+    def check_archive(self, archive: str):
+        """Check if ``archive`` can be written
+
+        Returns :obj:`False` with a warning if ``archive`` already exists.
+        Raises :class:`ValueError` if ``archive`` is an existing directory.
+        """
+        if archive in self.names:
+            warnings.warn(
+                "'%s' already exists in %s" % (archive, str(self.file)))
             return False
+        elif archive + "/" in self.dirs:
+            raise ValueError("invalid archive '%s'" % archive)
+        else:
+            return True
+
+    def writestr(self, archive: str, data: bytes,
+                 compression=None, compresslevel=None):
+        """Write ``data`` as ``archive`` unless ``archive`` exists"""
+        if not self.check_archive(archive):
+            return
+        self._add_name(archive)
+
+        if compression is None:
+            compression = self.compression
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+        self.file.writestr(archive, data,
+                           **_compress_type_kwargs(
+                               compression, compresslevel))
+
+    def write(self, filename, archive: str,
+              compression=None, compresslevel=None):
+        """Write the file ``filename`` as ``archive`` unless it exists"""
+        if not self.check_archive(archive):
+            return
+        self._add_name(archive)
 
-    return True
+        if compression is None:
+            compression = self.compression
+        if compresslevel is None:
+            compresslevel = self.compresslevel
+        self.file.write(filename, archive,
+                        **_compress_type_kwargs(
+                            compression, compresslevel))
 
 
 def write_str(string: str, path: pathlib.Path,
@@ -185,23 +429,15 @@ def pandas_to_pickle(obj, path: pathlib.Path,
                      compression=None,
                      compresslevel=None):
 
-    root = find_zip_parent(path)
+    root, writer = _find_zip_root(path)
 
     if root:
         with tempfile.TemporaryDirectory() as dirname:
             filepath = str(pathlib.Path(dirname).joinpath("temp"))
             obj.to_pickle(filepath)
             archive = get_archive_path(path, root)
-            with zipfile.ZipFile(
-                    root,
-                    mode="a",
-                    **_compress_kwargs(compression, compresslevel)
-                    ) as f:
-                if not _archive_exists(archive, f):
-                    if is_valid_archive_path(archive, f):
-                        f.write(filepath, archive)
-                    else:
-                        raise ValueError("invalid archive '%s'" % archive)
+            with writer or ZipWriter(root, compression, compresslevel) as f:
+                f.write(filepath, archive, compression, compresslevel)
 
     else:
         make_parent_dir(path)
@@ -233,22 +469,17 @@ def write_file(callback, path: pathlib.Path, mode,
         else:
             return path.open("wt", encoding=encoding, newline=newline)
 
-    root = find_zip_parent(path)
+    root, writer = _find_zip_root(path)
 
     if root:
         archive = get_archive_path(path, root)
         with get_io(mode) as buff:
-            with zipfile.ZipFile(
-                    root, mode="a",
-                    **_compress_kwargs(compression, compresslevel)
-            ) as f:
-                if not _archive_exists(archive, f):
-                    if is_valid_archive_path(archive, f):
-                        callback(buff)
-                        buff.seek(0)
-                        f.writestr(archive, encode(buff.read()))
-                    else:
-                        raise ValueError("invalid archive '%s'" % archive)
+            with writer or ZipWriter(root, compression, compresslevel) as f:
+                if f.check_archive(archive):
+                    callback(buff)
+                    buff.seek(0)
+                    f.writestr(archive, encode(buff.read()),
+                               compression, compresslevel)
 
     else:
         make_parent_dir(path)
@@ -266,36 +497,29 @@ def write_file_utf8(callback, path: pathlib.Path, mode, newline=None,
 def copy_file(src: pathlib.Path, dst: pathlib.Path,
               compression=None, compresslevel=None):
 
-    root_src = find_zip_parent(src)
-    root_dst = find_zip_parent(dst)
+    root_src, reader = _find_zip_source(src)
+    root_dst, writer = _find_zip_root(dst)
 
     if root_src and root_dst:
 
         arc_src = get_archive_path(src, root_src)
         arc_dst = get_archive_path(dst, root_dst)
-        with zipfile.ZipFile(root_src, mode="r") as zip_src:
-            with zip_src.open(arc_src, mode="r") as f_src:
-                with zipfile.ZipFile(
-                        root_dst, mode="a",
-                        **_compress_kwargs(compression, compresslevel)
-                        ) as zip_dst:
-                    if not _archive_exists(arc_dst, zip_dst):
-                        if is_valid_archive_path(arc_dst, zip_dst):
-                            zip_dst.writestr(arc_dst, f_src.read())
-                        else:
-                            raise ValueError("invalid archive '%s'" % arc_dst)
+        with reader or ZipReader(root_src) as zip_src:
+            with zip_src.open_member(arc_src) as f_src:
+                with writer or ZipWriter(
+                        root_dst, compression, compresslevel) as zip_dst:
+                    if zip_dst.check_archive(arc_dst):
+                        zip_dst.writestr(arc_dst, f_src.read(),
+                                         compression, compresslevel)
 
     elif root_src and not root_dst:
 
         arc_src = get_archive_path(src, root_src)
-        with zipfile.ZipFile(root_src, mode="r") as zip_src:
-            with tempfile.TemporaryDirectory() as dirname:
-                zip_src.extract(arc_src, path=dirname)
+        with reader or ZipReader(root_src) as zip_src:
+            with zip_src.open_member(arc_src) as f_src:
                 make_parent_dir(dst)
-                shutil.copyfile(
-                    str(pathlib.Path(dirname) / arc_src),
-                    str(pathlib.Path(dst))
-                )
+                with open(dst, "wb") as f_dst:
+                    shutil.copyfileobj(f_src, f_dst)
 
     elif not root_src and root_dst:
 
@@ -306,14 +530,9 @@ def copy_file(src: pathlib.Path, dst: pathlib.Path,
         retries = 3
         for i in range(retries):
             try:
-                with zipfile.ZipFile(root_dst, mode="a",
-                                     **_compress_kwargs(compression, compresslevel)
-                                     ) as zip_dst:
-                    if not _archive_exists(arc_dst, zip_dst):
-                        if is_valid_archive_path(arc_dst, zip_dst):
-                            zip_dst.write(src, arc_dst)
-                        else:
-                            raise ValueError("invalid archive '%s'" % arc_dst)
+                with writer or ZipWriter(
+                        root_dst, compression, compresslevel) as zip_dst:
+                    zip_dst.write(src, arc_dst, compression, compresslevel)
             except PermissionError:
                 if i < retries - 1:
                     warnings.warn(
@@ -362,7 +581,7 @@ def read_str_utf8(path: pathlib.Path, newline=None):
 def read_file(callback, path: pathlib.Path, mode,
                 encoding=None, newline=None):
 
-    root = find_zip_parent(path)
+    root, reader = _find_zip_source(path)
 
     def open_path(mode):
         if mode == "b":
@@ -372,8 +591,8 @@ def read_file(callback, path: pathlib.Path, mode,
 
     if root:
         archive = get_archive_path(path, root)
-        with zipfile.ZipFile(root, mode="r") as f_zip:
-            with f_zip.open(archive, mode="r") as f_zipext:
+        with reader or ZipReader(root) as f_zip:
+            with f_zip.open_member(archive) as f_zipext:
 
                 if mode == "t":
                     f = io.TextIOWrapper(
@@ -411,7 +630,7 @@ def open_for_readline(filename):
 class FileForTokenizer:
     def __init__(self, path):
 
-        root = find_zip_parent(path)
+        root, reader = _find_zip_source(path)
         self.is_zip = False if not root else True
 
         if not self.is_zip:
@@ -427,13 +646,9 @@ class FileForTokenizer:
 
         else:
             arch_path = get_archive_path(path, root)
+            self.zip_file = (reader or ZipReader(root)).open()
             try:
-                self.zip_file = zipfile.ZipFile(root, mode="r")
-            except:
-                self.zip_file.close()
-                raise
-            try:
-                self.buffer = self.zip_file.open(arch_path, mode='r')
+                self.buffer = self.zip_file.open_member(arch_path)
                 encoding, lines = tokenize.detect_encoding(self.buffer.readline)
                 self.buffer.seek(0)
                 self.text = io.TextIOWrapper(self.buffer, encoding, line_buffering=True)
@@ -60,4 +60,37 @@ def test_namespace_in_fromula():
     assert bar() is s._impl.namespace
 
     m._impl._check_sanity()
-    m.close()
\ No newline at end of file
+    m.close()
+
+def test_ns_dict_updated_in_place():
+    """Formulas keep their functions when names are added or removed."""
+    m = mx.new_model()
+    s = m.new_space("Space1")
+    s.x = 1
+
+    @mx.defcells(space=s)
+    def foo():
+        return x
+
+    assert foo() == 1
+    impl = foo._impl
+    ns_dict, altfunc = s._impl.ns_dict, impl.altfunc
+    assert impl.global_names == ("x",)
+
+    s.y = 2
+    assert "y" in s._impl.ns_dict
+    del s.y
+    assert "y" not in s._impl.ns_dict
+    s.x = 3
+    assert foo() == 3
+    assert s._impl.ns_dict is ns_dict
+    assert impl.altfunc is altfunc
+    assert impl._is_global_updated
+
+    foo.formula = lambda: 2 * x
+    assert foo() == 6
+    assert impl.altfunc is not altfunc
+    assert impl.global_names == ("x",)
+
+    m._impl._check_sanity()
+    m.close()
@@ -0,0 +1,229 @@
+import modelx as mx
+from modelx.core.cells import ArrayData
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def arraymodel():
+    """
+        Space1---cf(t): base + t
+        |        pv(t): cf(t) + pv(t+1) / (1 + rate)
+        |        total(): pv(0)
+        |
+        Items[i]---scaled(t): pv(t) * i
+        base = 100
+        rate = 0.05
+    """
+    m = mx.new_model()
+    s = m.new_space("Space1")
+    s.base = 100
+    s.rate = 0.05
+
+    @mx.defcells
+    def cf(t):
+        return base + t
+
+    @mx.defcells
+    def pv(t):
+        return cf(t) + pv(t + 1) / (1 + rate) if t < 9 else cf(t)
+
+    @mx.defcells
+    def total():
+        return pv(0)
+
+    items = s.new_space("Items", formula=lambda i: None)
+
+    @mx.defcells(space=items)
+    def scaled(t):
+        return pv(t) * i
+
+    items.pv = pv
+
+    yield s
+    m._impl._check_sanity()
+    for c in (s.cf, s.pv, s.total):
+        c._impl.check_sanity()
+    m.close()
+
+
+def expected_pv(s):
+    cf = [s.base + t for t in range(10)]
+    pv = [0] * 10
+    pv[9] = cf[9]
+    for t in range(8, -1, -1):
+        pv[t] = cf[t] + pv[t + 1] / (1 + s.rate)
+    return pv
+
+
+def test_values(arraymodel):
+
+    s = arraymodel
+    s.cf.cache_policy = mx.ArrayCache(size=10, dtype=int)
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+
+    assert s.total() == pytest.approx(expected_pv(s)[0])
+    assert isinstance(s.cf._impl.data, ArrayData)
+    assert s.cf(3) == 103 and type(s.cf(3)) is int
+    assert list(s.pv) == list(range(10))
+    assert len(s.pv) == 10
+    assert s.pv.eval_many(np.arange(10)) == pytest.approx(expected_pv(s))
+
+    # One trace node for each array
+    graph = s.model.tracegraph
+    assert len(graph) == 3
+    assert graph.number_of_edges() == 2
+
+
+def test_clear_by_dependency(arraymodel):
+
+    s = arraymodel
+    s.cf.cache_policy = mx.ArrayCache(size=10)
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+    s.total()
+
+    s.cf[5] = 200
+    assert not len(s.pv)
+    assert not s.total._impl.data
+    assert set(s.cf) == {5}     # Calculated values cleared
+
+    pv = expected_pv(s)
+    assert s.total() != pytest.approx(pv[0])
+    assert s.cf.is_input(5)
+
+    s.cf.clear_at(5)
+    assert not len(s.pv)
+    assert s.total() == pytest.approx(pv[0])
+
+    s.rate = 0.1
+    assert not len(s.pv)
+    assert s.total() == pytest.approx(expected_pv(s)[0])
+
+
+def test_input_values_kept(arraymodel):
+
+    s = arraymodel
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+    s.pv[9] = 0
+    s.total()
+    assert len(s.pv) == 10
+
+    s.cf.clear_at(3)
+    assert list(s.pv) == [9]
+    assert s.pv.is_input(9)
+
+
+def test_other_keys(arraymodel):
+
+    s = arraymodel
+    s.pv.cache_policy = mx.ArrayCache(size=5)
+    s.total()
+    data = s.pv._impl.data
+
+    assert set(data.others) == {(t,) for t in range(5, 10)}
+    s.pv[20] = "a"
+    s.pv[np.int64(2)] = "b"
+    assert s.pv(20) == "a"
+    assert s.pv(2) == "b"
+    assert (2,) in data.others
+    assert not data.mask[2]
+
+    s.pv[2] = 1.5
+    assert s.pv(2) == 1.5
+    assert (2,) not in data.others
+
+
+def test_eval_many_missing(arraymodel):
+
+    s = arraymodel
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+    assert s.pv._impl.data.take([0, 1]) is None
+    assert s.pv.eval_many([0, 1]) == pytest.approx(expected_pv(s)[:2])
+    assert s.pv._impl.data.take([0, 1]) is not None
+    assert s.pv.eval_many(0) == pytest.approx(expected_pv(s)[0])
+
+
+def test_error_rollback(arraymodel):
+
+    s = arraymodel
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+    s.pv(5)
+
+    def cf(t):
+        return 1 / (t - 3) + 100
+
+    s.cf.formula = cf
+    s.pv(5)
+    with pytest.raises(mx.core.errors.FormulaError):
+        s.pv(0)
+
+    assert set(s.pv) == set(range(5, 10))
+    s.pv._impl.check_sanity()
+
+
+def test_switch_policy(arraymodel):
+
+    s = arraymodel
+    s.total()
+    s.pv.cache_policy = mx.ArrayCache(size=10)
+    assert not len(s.pv)
+    assert not s.total._impl.data
+
+    s.total()
+    s.pv.cache_policy = None
+    assert type(s.pv._impl.data) is dict
+    assert not s.pv._impl.data
+    assert s.total() == pytest.approx(expected_pv(s)[0])
+
+    with pytest.raises(ValueError):
+        s.total.cache_policy = mx.ArrayCache(size=10)
+
+
+def test_dynamic_cells(arraymodel):
+
+    s = arraymodel
+    s.Items.scaled.cache_policy = mx.ArrayCache(size=10)
+    assert s.Items[2].scaled(0) == pytest.approx(expected_pv(s)[0] * 2)
+    assert isinstance(s.Items[2].scaled._impl.data, ArrayData)
+
+
+@pytest.mark.parametrize(
+    "dtype, value",
+    [
+        (float, "1"),
+        (float, 7),
+        (int, 2.7),
+        (int, 2.0),
+        (int, 1 << 70),
+        (np.float32, 0.1),
+    ]
+)
+def test_values_unchanged(dtype, value):
+
+    m = mx.new_model()
+    s = m.new_space("Space1")
+    s.value = value
+    s.new_cells("foo", formula=lambda t: value)
+    s.foo.cache_policy = mx.ArrayCache(size=10, dtype=dtype)
+
+    first = s.foo(1)
+    cached = s.foo(1)
+    assert first is value
+    assert type(cached) is type(value) and cached == value
+    assert not s.foo._impl.data.mask[1]
+    m.close()
+
+
+@pytest.mark.parametrize("dtype, value", [(float, 2.5), (int, 3)])
+def test_values_in_array(dtype, value):
+
+    m = mx.new_model()
+    s = m.new_space("Space1")
+    s.value = value
+    s.new_cells("foo", formula=lambda t: value)
+    s.foo.cache_policy = mx.ArrayCache(size=10, dtype=dtype)
+
+    s.foo(1)
+    assert s.foo._impl.data.mask[1]
+    assert type(s.foo(1)) is dtype and s.foo(1) == value
+    m.close()
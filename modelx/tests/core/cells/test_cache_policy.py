@@ -0,0 +1,214 @@
+import modelx as mx
+import pytest
+
+
+@pytest.fixture
+def lrumodel():
+    """
+        Space1---foo(s, t): foo(s, t-1) + bar(s)
+        |        bar(s)
+        |        baz(s): foo(s, 10)
+        |
+        Items[i]---qux(): j
+        j = bar(i)
+    """
+    m = mx.new_model()
+    s = m.new_space("Space1")
+
+    @mx.defcells
+    def foo(s, t):
+        return foo(s, t - 1) + bar(s) if t > 0 else 0
+
+    @mx.defcells
+    def bar(s):
+        return s
+
+    @mx.defcells
+    def baz(s):
+        return foo(s, 10)
+
+    items = s.new_space("Items", formula=lambda i: {"refs": {"j": bar(i)}})
+
+    @mx.defcells(space=items)
+    def qux():
+        return j
+
+    items.bar = bar
+
+    yield s
+    m._impl._check_sanity()
+    for c in (s.foo, s.bar, s.baz):
+        c._impl.check_sanity()
+    m.close()
+
+
+def test_lru_bound(lrumodel):
+
+    s = lrumodel
+    s.foo.cache_policy = mx.LRU(maxsize=5)
+    assert s.foo.cache_policy.maxsize == 5
+
+    for i in range(10):
+        s.foo(i, 0)
+
+    assert set(s.foo) == {(i, 0) for i in range(5, 10)}
+
+    s.foo(5, 0)     # Use foo(5, 0) recently
+    s.foo(10, 0)
+    assert (5, 0) in s.foo
+    assert (6, 0) not in s.foo
+
+
+def test_lru_keeps_dependents(lrumodel):
+
+    s = lrumodel
+    s.bar.cache_policy = mx.LRU(maxsize=2)
+
+    assert s.baz(1) == 10
+    s.bar(2)
+    s.bar(3)    # Evicts bar(1) but not its dependents
+
+    assert 1 not in s.bar
+    assert 1 in s.baz
+    assert len(s.foo) == 11
+
+    s.bar[1] = 2    # Clears the dependents of the evicted value
+    assert 1 not in s.baz
+    assert set(s.foo) == {(1, 0)}
+    assert s.baz(1) == 20
+
+
+def test_lru_clear_evicted(lrumodel):
+
+    s = lrumodel
+    s.bar.cache_policy = mx.LRU(maxsize=1)
+    assert s.baz(1) == 10
+    s.bar(2)
+    assert 1 not in s.bar
+
+    s.bar.formula = lambda s: 2 * s
+    assert not len(s.baz)
+    assert s.baz(1) == 20
+
+    s.bar(2)
+    s.bar.cache_policy = None   # Clears the dependents of evicted values
+    assert not len(s.baz)
+    assert set(s.bar) == {2}
+
+
+def test_lru_keeps_calculating_values(lrumodel):
+
+    s = lrumodel
+    s.foo.cache_policy = mx.LRU(maxsize=3)
+    assert s.baz(1) == 10     # foo(1, t) depends on foo(1, t-1)
+    assert len(s.foo) <= 3    # Evicted when baz(1) returns
+
+    s.foo(2, 0)
+    assert len(s.foo) <= 3
+    assert s.baz(1) == 10
+
+
+def test_lru_deep_recursion():
+
+    m = mx.new_model()
+    s = m.new_space()
+
+    @mx.defcells
+    def pv(t):
+        return 1 + pv(t + 1) if t < 3000 else 0
+
+    pv.cache_policy = mx.LRU(maxsize=50)
+    try:
+        assert pv(0) == 3000
+        assert len(pv) <= 50
+        assert 0 in pv
+    finally:
+        m._impl._check_sanity()
+        m.close()
+
+
+def test_lru_input_not_evicted(lrumodel):
+
+    s = lrumodel
+    s.foo.cache_policy = mx.LRU(maxsize=1)
+    s.foo[0, 0] = 100
+    s.foo[1, 0] = 200
+    s.foo(2, 0)
+    s.foo(3, 0)
+
+    assert set(s.foo) == {(0, 0), (1, 0), (3, 0)}
+    assert s.foo.is_input(0, 0)
+
+
+def test_lru_keeps_itemspace(lrumodel):
+
+    s = lrumodel
+    s.bar.cache_policy = mx.LRU(maxsize=1)
+    assert s.Items[1].qux() == 1
+    s.bar(2)
+
+    assert 1 not in s.bar
+    assert 1 in s.Items.itemspaces
+    s.bar[1] = 3
+    assert 1 not in s.Items.itemspaces
+    assert s.Items[1].qux() == 3
+
+
+def test_lru_keeps_recursive_result():
+
+    m = mx.new_model()
+    s = m.new_space()
+    s.calls = []
+
+    @mx.defcells
+    def pv(t):
+        calls.append(t)
+        return 1 + pv(t + 1) if t < 100 else 0
+
+    pv.cache_policy = mx.LRU(maxsize=10)
+    try:
+        assert pv(0) == 100
+        assert len(pv) == 10
+        assert 0 in pv
+
+        s.calls.clear()
+        assert pv(0) == 100
+        assert not s.calls  # Not calculated again
+
+        pv[50] = 0  # Evicted value changed
+        assert 0 not in pv
+        assert pv(0) == 50
+    finally:
+        m._impl._check_sanity()
+        pv._impl.check_sanity()
+        m.close()
+
+
+def test_lru_dynamic_cells(lrumodel):
+
+    s = lrumodel
+    s.Items.qux.cache_policy = mx.LRU(maxsize=1)
+    assert s.Items[1].qux.cache_policy.maxsize == 1
+
+
+def test_remove_policy(lrumodel):
+
+    s = lrumodel
+    s.foo.cache_policy = mx.LRU(maxsize=1)
+    s.foo(1, 0)
+    s.foo.cache_policy = None
+    s.foo(2, 0)
+
+    assert set(s.foo) == {(1, 0), (2, 0)}
+    assert type(s.foo._impl.data) is dict
+
+
+def test_lru_untraced(lrumodel):
+
+    s = lrumodel
+    s.foo.cache_policy = mx.LRU(maxsize=3)
+    with mx.untraced():
+        assert s.baz(1) == 10
+
+    assert len(s.foo) == 3
+    assert not len(s.model._impl.tracegraph)
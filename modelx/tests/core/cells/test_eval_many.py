@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import modelx as mx
+
+
+@pytest.fixture
+def evalmodel():
+
+    m, s = mx.new_model(), mx.new_space()
+
+    @mx.defcells
+    def foo(t):
+        return foo(t - 1) + 1 if t > 0 else 0
+
+    @mx.defcells
+    def bar(x, y=10):
+        return foo(x) * y
+
+    @mx.defcells
+    def baz():
+        return 3
+
+    @mx.defcells
+    def qux(x):
+        return bar_cells.eval_many(np.arange(x)).sum()
+
+    s.np = np
+    s.bar_cells = bar
+
+    yield s
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_single_param(evalmodel):
+
+    s = evalmodel
+    s.foo[2] = 10
+    result = s.foo.eval_many(np.arange(5))
+
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [0, 1, 10, 11, 12]
+    assert s.foo.is_input(2)
+    assert set(s.foo) == set(range(5))
+    assert all(type(t) is int for t in s.foo)
+
+
+def test_broadcast(evalmodel):
+
+    s = evalmodel
+    x = np.arange(3)[:, None]
+    y = np.array([1, 2, 3, 4])
+
+    result = s.bar.eval_many(x, y=y)
+    assert result.shape == (3, 4)
+    assert result.tolist() == [[s.bar(i, j) for j in y] for i in range(3)]
+
+    assert s.bar.eval_many([1, 1, 2]).tolist() == [10, 10, 20]
+    assert s.baz.eval_many().tolist() == 3
+
+
+def test_dependency(evalmodel):
+
+    s = evalmodel
+    assert s.qux(3) == 30
+
+    s.foo[1] = 5
+    assert 3 not in s.qux
+    assert (1, 10) not in s.bar
+    assert (0, 10) in s.bar
+
+    assert s.qux(3) == 10 * (0 + 5 + 6)
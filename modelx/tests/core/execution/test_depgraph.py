@@ -0,0 +1,78 @@
+import random
+import networkx as nx
+import pytest
+
+from modelx.core.execution.depgraph import DependencyGraph
+
+
+def make_graphs(seed, size=50, edges=150):
+    rnd = random.Random(seed)
+    g, nxg = DependencyGraph(), nx.DiGraph()
+    for _ in range(edges):
+        u, v = sorted(rnd.sample(range(size), 2))  # acyclic
+        g.add_edge(u, v)
+        nxg.add_edge(u, v)
+    return g, nxg
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_same_as_networkx(seed):
+
+    g, nxg = make_graphs(seed)
+
+    assert list(g.nodes) == list(nxg.nodes)
+    assert set(g.edges) == set(nxg.edges)
+    assert g.topological_sort() == list(nx.topological_sort(nxg))
+
+    for n in list(nxg.nodes)[:10]:
+        assert list(g.successors(n)) == list(nxg.successors(n))
+        assert list(g.predecessors(n)) == list(nxg.predecessors(n))
+        assert g.dfs_postorder_nodes(n) == list(
+            nx.dfs_postorder_nodes(nxg, n))
+        assert g.descendants(n) == nx.descendants(nxg, n)
+        for m in (n, 0, 49):
+            assert g.any_reachable(n, lambda x: x == m) == (
+                m == n or m in nx.descendants(nxg, n))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_remove_and_reuse(seed):
+
+    g, nxg = make_graphs(seed)
+    rnd = random.Random(seed)
+
+    removed = rnd.sample(list(nxg.nodes), 10)
+    for n in removed:
+        g.remove_node(n)
+        nxg.remove_node(n)
+
+    assert set(g.edges) == set(nxg.edges)
+
+    for n in removed:
+        g.add_edge(n, "new")
+        nxg.add_edge(n, "new")
+
+    assert list(g.nodes) == list(nxg.nodes)
+    assert set(g.edges) == set(nxg.edges)
+    assert g.topological_sort() == list(nx.topological_sort(nxg))
+    assert g.number_of_nodes() == nxg.number_of_nodes()
+
+
+def test_duplicate_edge():
+
+    g = DependencyGraph()
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    g.add_edge(1, 2)
+
+    assert g.out_degree(1) == 2
+    assert g.in_degree(2) == 1
+    assert (1, 2) in g.edges
+    assert (2, 1) not in g.edges
+
+
+def test_unhashable():
+
+    g = DependencyGraph()
+    assert not g.has_node([1])
+    assert [1] not in g
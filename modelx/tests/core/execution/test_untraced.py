@@ -0,0 +1,138 @@
+import modelx as mx
+import pytest
+
+
+@pytest.fixture
+def pvmodel():
+    """
+        Space1---pv(t), cf(t), rate
+        |
+        Items[i]---bar(), i depends on cf(i)
+    """
+    m = mx.new_model()
+    s = m.new_space("Space1")
+    s.rate = 0.1
+
+    @mx.defcells
+    def cf(t):
+        return 10
+
+    @mx.defcells
+    def pv(t):
+        return cf(t) + pv(t + 1) / (1 + rate) if t < 100 else 0
+
+    items = s.new_space("Items", formula=lambda i: {"refs": {"x": cf(i)}})
+    items.cf = s.cf
+
+    @mx.defcells(space=items)
+    def bar():
+        return x
+
+    yield m
+
+    mx.set_tracing(True)
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_no_dependency_recorded(pvmodel):
+
+    s = pvmodel.Space1
+
+    with mx.untraced():
+        assert not mx.get_tracing()
+        s.pv(0)
+
+    assert mx.get_tracing()
+    assert len(s.pv) == 101
+    assert len(s.cf) == 100
+    assert not len(pvmodel._impl.tracegraph)
+    assert not len(pvmodel._impl.refgraph)
+    s.pv._impl.check_sanity()
+
+
+def test_itemspace_untraced(pvmodel):
+
+    s = pvmodel.Space1
+
+    with mx.untraced():
+        assert s.Items[1].bar() == 10
+        assert s.Items[2].bar() == 10
+
+    assert len(s.Items.itemspaces) == 2
+    assert not len(pvmodel._impl.tracegraph)
+    assert not len(pvmodel._impl.refgraph)
+
+    s.rate = 0.2
+    assert not s.Items.itemspaces
+
+
+def test_input_clears_model(pvmodel):
+
+    s = pvmodel.Space1
+
+    mx.set_tracing(False)
+    s.pv(0)
+    s.Items[1].bar()
+    s.cf[50] = 20
+
+    assert len(s.pv) == 0
+    assert dict(s.cf) == {50: 20}
+    assert not s.Items.itemspaces
+
+    expected = s.pv(0)
+    mx.set_tracing(True)
+    s.cf.clear_at(50)
+    assert s.pv(0) != expected
+
+
+def test_ref_change_clears_model(pvmodel):
+
+    s = pvmodel.Space1
+
+    mx.set_tracing(False)
+    pv0 = s.pv(0)
+    mx.set_tracing(True)
+
+    s.rate = 0.2
+    assert len(s.pv) == 0
+    assert s.pv(0) < pv0
+
+
+def test_formula_change_clears_model(pvmodel):
+
+    s = pvmodel.Space1
+
+    with mx.untraced():
+        pv0 = s.pv(0)
+
+    s.cf.formula = lambda t: 20
+    assert len(s.pv) == 0
+    assert s.pv(0) == pytest.approx(pv0 * 2)
+
+
+def test_traced_after_clear(pvmodel):
+
+    s = pvmodel.Space1
+
+    with mx.untraced():
+        s.pv(0)
+
+    s.cf.clear()    # Clears the model and resets the untraced state
+    assert not pvmodel._impl.is_untraced
+
+    s.pv(0)
+    s.cf[99] = 20
+    assert len(s.pv) == 1   # Only pv(100) is left
+    assert len(s.cf) == 100
+
+
+def test_stacktrace_unavailable(pvmodel):
+
+    with mx.untraced():
+        with pytest.raises(RuntimeError):
+            mx.start_stacktrace()
+
+    with mx.trace_stack():
+        with pytest.raises(RuntimeError):
+            mx.set_tracing(False)
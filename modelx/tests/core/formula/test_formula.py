@@ -68,3 +68,82 @@ def test_lambda_as_param():
     f = Formula(lambdadef2)
     assert f.func(1) == 3
     assert f.source == lambdadef2_extracted
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs",
+    [
+        (lambda: 0, (), {}),
+        (lambda x, y: 0, (1, 2), {}),
+        (lambda x, y: 0, [1, 2], {}),
+        (lambda x, y: 0, (1,), {"y": 2}),
+        (lambda x, y=3: 0, (1,), {}),
+        (lambda x, y=3, z=4: 0, (1, 2), {}),
+        (lambda x, y=3, z=4: 0, (1,), {"z": 5}),
+        (lambda x, /, y=3: 0, (1,), {}),
+        (lambda x, *args: 0, (1, 2, 3), {}),
+        (lambda x, *, y=3: 0, (1,), {}),
+        (lambda x, **kwargs: 0, (1,), {"z": 2}),
+    ]
+)
+def test_bind_key(func, args, kwargs):
+
+    formula = Formula(func)
+    boundargs = formula.signature.bind(*args, **kwargs)
+    boundargs.apply_defaults()
+
+    assert formula.bind_key(args, kwargs) == tuple(
+        boundargs.arguments.values())
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs",
+    [
+        (lambda x, y: 0, (1,), {}),
+        (lambda x, y: 0, (1, 2, 3), {}),
+        (lambda x, y=3: 0, (), {}),
+        (lambda x, y=3: 0, (1,), {"z": 2}),
+    ]
+)
+def test_bind_key_error(func, args, kwargs):
+
+    with pytest.raises(TypeError):
+        Formula(func).bind_key(args, kwargs)
+
+
+@pytest.mark.parametrize(
+    "src, name, expected",
+    [
+        (funcdef1, None, funcdef1_nodeco),
+        (funcdef1, "bar", funcdef1_renamed),
+        (lambdadef1, None, lambdadef1_extracted),
+        (lambdadef1, "bar", lambdadef1_extracted),
+    ]
+)
+def test_formula_cache(tmp_path, monkeypatch, src, name, expected):
+
+    monkeypatch.setenv("MX_FORMULA_CACHE", str(tmp_path))
+    f = Formula(src, name=name)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Created from the cache without analyzing the source
+    monkeypatch.setattr(
+        "modelx.core.formula.is_funcdef", None)
+    cached = Formula(src, name=name)
+    assert cached.func is not f.func
+    assert cached.name == f.name
+    assert cached.func(1) == f.func(1)
+    assert cached.source == expected
+    assert cached._is_lambda == f._is_lambda
+
+
+def test_formula_cache_broken_entry(tmp_path, monkeypatch):
+
+    monkeypatch.setenv("MX_FORMULA_CACHE", str(tmp_path))
+    Formula(funcdef1)
+    entry, = tmp_path.iterdir()
+    entry.write_bytes(b"broken")
+
+    f = Formula(funcdef1)
+    assert f.func(1) == 2
+    assert f.source == funcdef1_nodeco
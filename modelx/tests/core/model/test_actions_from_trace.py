@@ -0,0 +1,104 @@
+import modelx as mx
+import pytest
+
+
+@pytest.fixture
+def actionmodel():
+    """
+        Space1---Cells1(): 1
+              |--Cells2(x): Cells2(x - 1) if x > 0 else Cells1()
+              +--Cells3(x): Cells1() + Cells2(x)
+    """
+    m = mx.new_model()
+    s = m.new_space()
+
+    @mx.defcells
+    def Cells1():
+        return 1
+
+    @mx.defcells
+    def Cells2(x):
+        if x > 0:
+            return Cells2(x-1)
+        else:
+            return Cells1()
+
+    @mx.defcells
+    def Cells3(x):
+        return Cells1() + Cells2(x)
+
+    yield m, s
+    m._impl._check_sanity()
+    m.close()
+
+
+def get_expected(s):
+    return [
+        ['calc', [s.Cells1.node(), s.Cells2.node(x=0)]],
+        ['paste', [s.Cells2.node(x=0), s.Cells1.node()]],
+        ['clear', []],
+        ['calc', [s.Cells2.node(x=1), s.Cells2.node(x=2)]],
+        ['paste', [s.Cells2.node(x=2)]],
+        ['clear', [s.Cells2.node(x=1), s.Cells2.node(x=0)]],
+        ['calc', [s.Cells3.node(x=2)]],
+        ['paste', [s.Cells3.node(x=2)]],
+        ['clear', [s.Cells1.node(), s.Cells2.node(x=2)]]]
+
+
+def test_values_cleared(actionmodel):
+
+    m, s = actionmodel
+    actions = m.generate_actions([s.Cells3.node(2)], step_size=2)
+    assert get_expected(s) == actions
+    assert not dict(s.Cells1)
+    assert not dict(s.Cells2)
+    assert not dict(s.Cells3)
+
+
+def test_action_from_calculated(actionmodel):
+
+    m, s = actionmodel
+    s.Cells3(2)
+    s.Cells2(5)
+    actions = m.generate_actions([s.Cells3.node(2)], step_size=2)
+    assert get_expected(s) == actions
+
+    # Values calculated before are kept
+    assert dict(s.Cells3) == {2: 2}
+    assert len(s.Cells2) == 6
+
+
+def test_action_untraced(actionmodel):
+
+    m, s = actionmodel
+    with mx.untraced():
+        with pytest.raises(RuntimeError):
+            m.generate_actions([s.Cells3.node(2)])
+
+    with mx.untraced():
+        s.Cells3(2)
+    actions = m.generate_actions([s.Cells3.node(2)], step_size=2)
+    assert get_expected(s) == actions
+
+
+def test_action_itemspace():
+    """
+        Items[i]---a(x): x * i
+        Space1---b(x): Items[1].a(x) + 1 if x == 0 else b(x - 1)
+    """
+    m = mx.new_model()
+    items = m.new_space("Items", formula=lambda i: None)
+    items.new_cells("a", formula=lambda x: x * i)
+    s = m.new_space("Space1")
+    s.Items = items
+    s.new_cells("b", formula=lambda x: Items[1].a(x) + 1 if x == 0 else b(x - 1))
+
+    actions = m.generate_actions([s.b.node(3)])
+    calc = actions[0][1]
+    assert items.node(1) in calc
+    assert calc[-1] == s.b.node(3)
+    assert not len(s.b)
+
+    m.execute_actions(actions)
+    assert dict(s.b) == {3: 1}
+    m.close()
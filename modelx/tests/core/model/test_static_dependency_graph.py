@@ -0,0 +1,91 @@
+import modelx as mx
+import pytest
+
+
+@pytest.fixture
+def depmodel():
+    """
+        S---foo(): x
+        |   bar(): foo() + Child.y
+        |   x = 1
+        +---Child
+            y = 2
+    """
+    m = mx.new_model()
+    s = m.new_space("S")
+    s.x = 1
+
+    @mx.defcells(space=s)
+    def foo():
+        return x
+
+    @mx.defcells(space=s)
+    def bar():
+        return foo() + Child.y
+
+    child = s.new_space("Child")
+    child.y = 2
+
+    yield m, s
+    m._impl._check_sanity()
+    m.close()
+
+
+def node(obj):
+    return obj._impl.to_node()
+
+
+def preds(graph, obj):
+    return set(graph.predecessors(node(obj)))
+
+
+def test_static_dependency_graph(depmodel):
+
+    m, s = depmodel
+    g = m.static_dependency_graph()
+
+    assert preds(g, s.foo) == {s._impl.refs["x"].to_node()}
+    assert preds(g, s.bar) == {node(s.foo), node(s.Child)}
+    assert s.bar() == 3     # Graph is built without calculation
+
+
+def test_reuse_entries(depmodel):
+
+    m, s = depmodel
+    m.static_dependency_graph()
+    entry = m._impl.depindex._entries[s._impl][s.foo._impl]
+
+    m.static_dependency_graph()
+    assert m._impl.depindex._entries[s._impl][s.foo._impl] is entry
+
+
+def test_change_formula(depmodel):
+
+    m, s = depmodel
+    m.static_dependency_graph()
+    s.foo.formula = lambda: bar.formula is not None
+    g = m.static_dependency_graph()
+    assert preds(g, s.foo) == {node(s.bar)}
+
+
+def test_new_ref(depmodel):
+
+    m, s = depmodel
+    m.static_dependency_graph()
+    s.new_cells("baz", formula=lambda: z)
+    assert not preds(m.static_dependency_graph(), s.baz)
+
+    s.z = 3
+    assert preds(m.static_dependency_graph(), s.baz) == {
+        s._impl.refs["z"].to_node()}
+
+
+def test_del_cells(depmodel):
+
+    m, s = depmodel
+    m.static_dependency_graph()
+    foo = s.foo._impl
+    del s.foo
+    g = m.static_dependency_graph()
+    assert foo not in m._impl.depindex._entries[s._impl]
+    assert preds(g, s.bar) == {node(s.Child)}
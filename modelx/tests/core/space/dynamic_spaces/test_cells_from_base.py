@@ -0,0 +1,50 @@
+import modelx as mx
+from modelx.core.cells import DynamicCellsImpl
+import pytest
+
+
+@pytest.fixture
+def itemspace():
+    m = mx.new_model()
+    s = m.new_space("Space1", formula=lambda i: None)
+    s.new_cells("foo", formula=lambda x: x * i)
+    s.new_cells("bar", formula=lambda: 2 * i)
+    s.bar.cache_policy = mx.LRU(10)
+    yield s[1]
+    m._impl._check_sanity()
+    m.close()
+
+
+def get_slots(impl):
+    slots = set(DynamicCellsImpl.__slots__)
+    for cls in DynamicCellsImpl.mro():
+        slots.update(getattr(cls, "__slots__", ()))
+    return {k: getattr(impl, k) for k in slots if hasattr(impl, k)}
+
+
+@pytest.mark.parametrize("name", ["foo", "bar"])
+def test_same_as_init(itemspace, name):
+    """from_base initializes the same slots as __init__"""
+    space = itemspace._impl
+    base = space._dynbase.cells[name]
+    init = DynamicCellsImpl(space=space, base=base, is_derived=True)
+    fast = DynamicCellsImpl.from_base(space, base)
+    init_slots, fast_slots = get_slots(init), get_slots(fast)
+
+    assert init_slots.keys() == fast_slots.keys()
+    for k in ("interface", "data", "input_keys"):
+        assert type(init_slots.pop(k)) is type(fast_slots.pop(k))
+    assert init_slots == fast_slots
+
+    assert space.observers.count(fast) == 1
+    for c in (init, fast):
+        space.remove_observer(c)
+
+
+def test_itemspace_cells(itemspace):
+    assert itemspace.foo(3) == 3
+    assert itemspace.bar() == 2
+    assert itemspace.foo._impl in itemspace._impl.observers
+    parent = itemspace.parent
+    parent.new_cells("baz", formula=lambda: 3 * i)
+    assert parent[1].baz() == 3
@@ -0,0 +1,128 @@
+import modelx as mx
+import pytest
+
+
+@pytest.fixture
+def maxmodel():
+    """
+        Items[i]---foo(): i * 2
+        |          bar(): Outer.g(i + 1) + 1 if i < 5 else 0
+        |
+        Outer---total(n): sum(Items[k].foo() for k in range(n))
+                g(i): Items[i].bar()
+    """
+    m = mx.new_model()
+    items = m.new_space("Items", formula=lambda i: None)
+    outer = m.new_space("Outer")
+
+    @mx.defcells(space=items)
+    def foo():
+        return i * 2
+
+    @mx.defcells(space=items)
+    def bar():
+        return Outer.g(i + 1) + 1 if i < 5 else 0
+
+    @mx.defcells(space=outer)
+    def total(n):
+        return sum(Items[k].foo() for k in range(n))
+
+    @mx.defcells(space=outer)
+    def g(i):
+        return Items[i].bar()
+
+    items.Outer = outer
+    outer.Items = items
+
+    yield items, outer
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_max_itemspaces(maxmodel):
+
+    items, _ = maxmodel
+    assert items.max_itemspaces is None
+    items.max_itemspaces = 3
+    assert items.max_itemspaces == 3
+
+    assert [items[k].foo() for k in range(10)] == list(range(0, 20, 2))
+    assert list(items.itemspaces) == [7, 8, 9]
+
+    items[7]    # Use items[7] recently
+    items[10]
+    assert set(items.itemspaces) == {7, 9, 10}
+
+    items.max_itemspaces = 1
+    assert list(items.itemspaces) == [10]
+
+    items.max_itemspaces = None
+    assert [items[k].foo() for k in range(5)] == list(range(0, 10, 2))
+    assert len(items.itemspaces) == 6
+
+
+def test_evict_with_dependents(maxmodel):
+
+    items, outer = maxmodel
+    items.max_itemspaces = 2
+
+    # Items are kept while their dependents are calculated
+    # and evicted with the dependents when total(5) returns
+    assert outer.total(5) == 20
+    assert len(items.itemspaces) == 2
+    assert not dict(outer.total)
+
+    items[10]
+    assert len(items.itemspaces) == 2
+    assert 10 in items.itemspaces
+    assert outer.total(5) == 20
+
+
+def test_keep_busy_items(maxmodel):
+
+    items, outer = maxmodel
+    items.max_itemspaces = 1
+
+    assert items[0].bar() == 5
+    assert list(items.itemspaces) == [5]
+
+    items[10]
+    assert list(items.itemspaces) == [10]
+    assert not dict(outer.g)
+
+
+def test_many_items(maxmodel):
+
+    items, outer = maxmodel
+    items.max_itemspaces = 10
+
+    assert outer.total(3000) == 3000 * 2999
+    assert len(items.itemspaces) == 10
+    assert not outer._impl.system.executor.blocked_evictions
+
+
+def test_evicted_dependents(maxmodel):
+
+    items, outer = maxmodel
+    items.max_itemspaces = 2
+    outer.g.cache_policy = mx.LRU(maxsize=1)
+
+    assert outer.g(0) == 5
+    assert len(items.itemspaces) == 2
+    assert len(outer.g) <= 1
+
+
+def test_untraced(maxmodel):
+
+    items, _ = maxmodel
+    items.max_itemspaces = 1
+    with mx.untraced():
+        assert [items[k].foo() for k in range(3)] == [0, 2, 4]
+    assert len(items.itemspaces) == 3
+
+
+def test_invalid_max_itemspaces(maxmodel):
+
+    items, _ = maxmodel
+    with pytest.raises(ValueError):
+        items.max_itemspaces = 0
@@ -0,0 +1,68 @@
+import multiprocessing
+import pandas as pd
+import pytest
+
+import modelx as mx
+
+
+@pytest.fixture(scope="module")
+def projection():
+    """
+        Projection[policy_id]---pv(t), cf(t)
+                                rate, premium
+    """
+    m = mx.new_model("ParallelMapModel")
+    p = m.new_space("Projection", formula=lambda policy_id: None)
+    p.rate = 0.05
+    p.premium = 100
+
+    @mx.defcells(space=p)
+    def cf(t):
+        return premium * policy_id
+
+    @mx.defcells(space=p)
+    def pv(t):
+        return cf(t) + pv(t + 1) / (1 + rate) if t < 10 else 0
+
+    yield p
+    m._impl._check_sanity()
+    m.close()
+
+
+def expected(p, keys, target="pv"):
+    result = pd.DataFrame(
+        [getattr(p[k], target)(0) for k in keys],
+        index=pd.Index(keys, name="policy_id"), columns=[target])
+    p.clear_items()
+    return result
+
+
+start_methods = [m for m in ("fork", "spawn")
+                 if m in multiprocessing.get_all_start_methods()]
+
+
+@pytest.mark.parametrize("start_method", start_methods)
+def test_parallel_map(projection, start_method):
+
+    p = projection
+    keys = list(range(1, 21))
+    streamed = {}
+
+    df = p.parallel_map(
+        keys, "pv", args=(0,), workers=2, chunksize=3,
+        callback=lambda k, v: streamed.__setitem__(k, v),
+        start_method=start_method)
+
+    pd.testing.assert_frame_equal(df, expected(p, keys))
+    assert streamed == df["pv"].to_dict()
+    assert not p.itemspaces
+
+
+def test_multiple_targets(projection):
+
+    p = projection
+    df = p.parallel_map([3, 1, 2], ["pv", "cf"], args=(0,), workers=2)
+
+    assert list(df.index) == [3, 1, 2]
+    assert list(df.columns) == ["pv", "cf"]
+    assert df.loc[2, "cf"] == 200
@@ -0,0 +1,83 @@
+import gc
+import pickle
+from modelx.core.chainmap import CustomChainMap, ChainedDict
+
+import pytest
+
+
+@pytest.fixture
+def chained():
+    first, second = ChainedDict(a=1), ChainedDict(a=2, b=3)
+    return first, second, CustomChainMap(first, second)
+
+
+def test_lookup(chained):
+    first, second, m = chained
+    assert m["a"] == 1
+    assert m.get("b") == 3
+    assert m.get("c") is None
+    assert "c" not in m
+    with pytest.raises(KeyError):
+        m["c"]
+    assert list(m) == ["a", "b"]
+    assert len(m) == 2
+
+
+@pytest.mark.parametrize("change", [
+    lambda d: d.__setitem__("c", 4),
+    lambda d: d.update(c=4),
+    lambda d: d.setdefault("c", 4),
+    lambda d: d.pop("a"),
+    lambda d: d.__delitem__("a"),
+    lambda d: d.popitem(),
+    lambda d: d.clear(),
+])
+@pytest.mark.parametrize("layer", [0, 1])
+def test_change_layer(chained, change, layer):
+    m = chained[2]
+    d = chained[layer]
+    assert dict(m.items()) == {"a": 1, "b": 3}
+
+    version = d.version
+    change(d)
+    assert d.version > version
+    expected = {}
+    for mapping in reversed(m.maps):
+        expected.update(mapping)
+    assert dict(m.items()) == expected
+
+
+def test_set_through_chainmap(chained):
+    first, _, m = chained
+    assert "c" not in m
+    m["c"] = 4
+    assert m["c"] == 4 and first["c"] == 4
+    del m["c"]
+    assert "c" not in m
+
+
+def test_plain_dict():
+    first, second = ChainedDict(a=1), {"b": 2}
+    m = CustomChainMap(first, second)
+    assert m["b"] == 2
+    second["c"] = 3
+    assert m["c"] == 3
+
+
+def test_deleted_chainmaps():
+    d = ChainedDict(a=1)
+    for _ in range(100):
+        m = CustomChainMap(d)
+        assert m["a"] == 1
+    del m
+    gc.collect()
+    assert len(d.chainmaps) < 100
+
+
+def test_pickle(chained):
+    first, second, m = chained
+    m["c"] = 4
+    first2, second2, m2 = pickle.loads(pickle.dumps(chained))
+    assert dict(m2.items()) == dict(m.items())
+    first2["d"] = 5
+    assert m2["d"] == 5
@@ -0,0 +1,95 @@
+import sys
+import pathlib
+
+import modelx as mx
+import pytest
+
+sample_dir = pathlib.Path(__file__).parent / 'samples'
+
+
+@pytest.fixture
+def compiled_model():
+    """
+        CompiledModel-----Space1-----pv(t)
+                       |          +--cf(t)
+                       |          +--rate
+                       |          +--Child-----double(x, y)
+                       +--Items[i]-----bar()
+    """
+    m = mx.new_model('CompiledModel')
+    s = m.new_space('Space1')
+    s.rate = 0.01
+
+    @mx.defcells
+    def cf(t):
+        return 10
+
+    @mx.defcells
+    def pv(t):
+        return cf(t) if t == 9 else cf(t) + pv(t + 1) / (1 + rate)
+
+    s.cf[3] = 100
+    s.new_space('Child').new_cells('double', formula=lambda x, y: 2 * (x + y))
+
+    items = m.new_space('Items', formula=lambda i: None)
+    items.new_cells('bar', formula=lambda: 3 * i)
+
+    yield m
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_compile(compiled_model):
+    m = compiled_model
+    s = m.Space1
+    expected = s.pv(0)
+    s.pv.clear()
+    assert not len(s.pv)
+
+    compiled = m.compile()
+    try:
+        assert compiled(s.pv, 0) == pytest.approx(expected)
+        assert not s.pv._impl.model.tracegraph.edges
+        assert set(s.pv.keys()) == set(range(10))
+        assert set(s.cf.keys()) == set(range(10))
+        assert s.cf.is_input(3)
+        assert compiled(s.Child.double, 1, 2) == 6
+        assert s.Child.double(1, 2) == 6
+        assert s.pv(0) == pytest.approx(expected)
+        assert s.cf(3) == 100
+
+        assert compiled.mx_model.Items[2].bar() == 6
+
+    finally:
+        compiled.close()
+
+    assert not any(k.startswith(compiled.module_name) for k in sys.modules)
+
+
+def test_compile_clear(compiled_model):
+    m = compiled_model
+    s = m.Space1
+    compiled = m.compile()
+    try:
+        compiled(s.pv, 0)
+        assert len(s.pv) == 10
+        s.rate = 0.02       # Clears all values stored by compiled
+        assert not len(s.pv)
+        assert compiled.pull() == 0
+    finally:
+        compiled.close()
+
+
+def test_compile_errors(compiled_model):
+    m = compiled_model
+    other = mx.new_model('OtherModel')
+    other.new_space('Space1').new_cells('foo', formula=lambda: 1)
+    compiled = m.compile()
+    try:
+        with pytest.raises(ValueError):
+            compiled(other.Space1.foo)
+        with pytest.raises(ValueError):
+            compiled(m.Items[1].bar)
+    finally:
+        compiled.close()
+        other.close()
@@ -389,4 +389,48 @@ def test_model_level_ref(tmp_path):
         assert nomx.Foo.ProductID is nomx.Consts.ProductID
     finally:
         sys.path.pop(0)
-        m.close()
\ No newline at end of file
+        m.close()
+
+
+def test_broadcast(tmp_path):
+    import numpy as np
+
+    m = mx.new_model('BroadcastModel')
+    s = m.new_space('Projection', formula=lambda policy_id, scale=1: None)
+    s.rates = pd.Series([0.01, 0.02, 0.03], index=[1, 2, 3])
+
+    @mx.defcells
+    def cf(t):
+        return scale * rates.loc[policy_id] * (t + 1)
+
+    @mx.defcells
+    def pv(t):
+        return cf(t) if t == 9 else cf(t) + pv(t + 1) / 1.01
+
+    nomx_path = tmp_path / 'model'
+    try:
+        m.export(nomx_path / 'BroadcastModel_nomx', broadcast=True)
+
+        sys.path.insert(0, str(nomx_path))
+        from BroadcastModel_nomx import mx_model as nomx
+
+        space = nomx.Projection._mx_broadcast([1, 2, 3])
+        np.testing.assert_allclose(
+            space.pv(0), [m.Projection[i].pv(0) for i in [1, 2, 3]])
+        assert space is not nomx.Projection._mx_broadcast([1, 2, 3])
+        assert not nomx.Projection._mx_itemspaces
+
+        space = nomx.Projection._mx_broadcast([1, 2, 3], 2)
+        assert space.scale.tolist() == [2, 2, 2]
+        np.testing.assert_allclose(
+            space.cf(0), [m.Projection[i, 2].cf(0) for i in [1, 2, 3]])
+
+        # Same results as evaluating each key in the exported model
+        keys = [(1, 1), (2, 1), (3, 2), (1, 5), (3, 5)]
+        space = nomx.Projection._mx_broadcast(*zip(*keys))
+        for t in [0, 5, 9]:
+            np.testing.assert_allclose(
+                space.pv(t), [nomx.Projection[k].pv(t) for k in keys])
+    finally:
+        sys.path.pop(0)
+        m.close()
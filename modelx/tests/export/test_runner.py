@@ -0,0 +1,165 @@
+import multiprocessing
+import pandas as pd
+import pytest
+
+import modelx as mx
+from modelx.export.runner import run_parallel
+
+
+@pytest.fixture(scope="module")
+def exported(tmp_path_factory):
+    """
+        RunnerModel-----Projection[policy_id, scale=1]---pv(t), cf(t)
+                                                         result()
+                                                         rate, premium, pd
+    """
+    m = mx.new_model("RunnerModel")
+    p = m.new_space("Projection", formula=lambda policy_id, scale=1: None)
+    p.rate = 0.05
+    p.premium = 100
+    p.pd = pd
+
+    @mx.defcells(space=p)
+    def cf(t):
+        return premium * policy_id * scale
+
+    @mx.defcells(space=p)
+    def pv(t):
+        return cf(t) + pv(t + 1) / (1 + rate) if t < 10 else 0
+
+    @mx.defcells(space=p)
+    def result():
+        return pd.DataFrame({"cf": [cf(t) for t in range(3)]})
+
+    path = tmp_path_factory.mktemp("model") / "RunnerModel_nomx"
+    m.export(path)
+    yield p, path
+    m.close()
+
+
+start_methods = [m for m in ("fork", "spawn")
+                 if m in multiprocessing.get_all_start_methods()]
+
+
+@pytest.mark.parametrize("start_method", start_methods)
+def test_run_parallel(exported, start_method):
+
+    p, path = exported
+    keys = list(range(1, 11))
+    result = run_parallel(path, "Projection", keys, ["pv", "cf"], args=(0,),
+                          workers=2, shards=3, start_method=start_method)
+
+    expected = pd.DataFrame(
+        [(p[k].pv(0), p[k].cf(0)) for k in keys],
+        index=pd.Index(keys, name="policy_id"), columns=["pv", "cf"])
+    pd.testing.assert_frame_equal(result.values, expected)
+
+    timings = result.timings
+    assert timings["keys"].tolist() == [4, 3, 3]
+    assert timings.index.name == "shard"
+    assert (timings["seconds"] >= 0).all()
+    assert len(set(timings["pid"])) <= 2
+
+
+def test_run_parallel_concat(exported):
+
+    p, path = exported
+    keys = [(1, 2), (3, 1)]
+    result = run_parallel(path, "Projection", keys, "result", workers=2)
+
+    expected = pd.concat(
+        [p[k].result() for k in keys],
+        keys=pd.MultiIndex.from_tuples(keys, names=["policy_id", "scale"]))
+    pd.testing.assert_frame_equal(result.values, expected)
+    assert result.values.index.names == ["policy_id", "scale", None]
+
+
+def test_io_cache(tmp_path, monkeypatch):
+    import numpy as np
+
+    m = mx.new_model("IOCacheModel")
+    p = m.new_space("Projection", formula=lambda policy_id: None)
+    p.table = pd.DataFrame({"rate": np.arange(10) / 100})
+    p.array = np.arange(5)
+
+    @mx.defcells(space=p)
+    def rate():
+        return table["rate"][policy_id]
+
+    @mx.defcells(space=p)
+    def is_shared():
+        return not (table["rate"].values.flags.writeable
+                    or array.flags.writeable)
+
+    nomx_path = tmp_path / "model"
+    cache = tmp_path / "cache"
+    m.export(nomx_path / "IOCacheModel_nomx")
+    try:
+        result = run_parallel(nomx_path / "IOCacheModel_nomx", "Projection",
+                              [1, 2, 3], ["rate", "is_shared"], workers=2,
+                              io_cache=cache)
+        assert result.values["rate"].tolist() == [0.01, 0.02, 0.03]
+        assert result.values["is_shared"].all()
+
+        cache_dir, = cache.iterdir()
+        assert {f.name for f in cache_dir.iterdir()} == {
+            "data.pickle", "buffers.bin"}
+
+        monkeypatch.setenv("MX_IO_CACHE", str(cache))
+        monkeypatch.syspath_prepend(str(nomx_path))
+        from IOCacheModel_nomx import mx_model as nomx
+        pd.testing.assert_frame_equal(nomx.Projection.table, p.table)
+        assert nomx.Projection[2].is_shared()
+    finally:
+        m.close()
+
+
+@pytest.mark.parametrize("stale", ["dead", "old"])
+def test_io_cache_stale_lock(tmp_path, stale):
+    import os
+    import sys
+    import time
+    import subprocess
+    from modelx.export._mx_sys import SharedIOCache
+
+    package = tmp_path / "package"
+    package.mkdir()
+    cache = SharedIOCache(package, tmp_path / "cache")
+    cache.dir.mkdir(parents=True)
+
+    if stale == "dead":
+        if os.name != "posix":
+            pytest.skip("process check is POSIX only")
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        cache.lock_file.write_text("%d %f" % (proc.pid, time.time()))
+    else:   # No PID to check
+        cache.lock_file.write_text("")
+        stamp = time.time() - SharedIOCache.stale_after - 1
+        os.utime(cache.lock_file, (stamp, stamp))
+
+    start = time.monotonic()
+    assert cache.load(lambda: ({"a": 1}, {})) == ({"a": 1}, {})
+    assert time.monotonic() - start < 10
+    assert cache.data_file.exists()
+    assert not cache.lock_file.exists()
+
+
+def test_io_cache_live_lock(tmp_path):
+    import os
+    import time
+    from modelx.export._mx_sys import SharedIOCache
+
+    package = tmp_path / "package"
+    package.mkdir()
+    cache = SharedIOCache(package, tmp_path / "cache")
+    cache.timeout = 0.5
+    cache.dir.mkdir(parents=True)
+
+    # Held by a live process for longer than stale_after
+    stamp = time.time() - SharedIOCache.stale_after - 1
+    cache.lock_file.write_text("%d %f" % (os.getpid(), stamp))
+
+    assert cache.load(lambda: ({"a": 1}, {})) == ({"a": 1}, {})
+    assert cache.lock_file.exists()
+    assert not cache.data_file.exists()
@@ -0,0 +1,44 @@
+"""Argument binding by Formula.bind_key against inspect.Signature.bind
+
+The throughput benchmarks require pytest-benchmark and are skipped by
+default, as the other benchmarks in this package.
+"""
+import pytest
+
+from modelx.core.formula import Formula
+
+
+def bind_by_signature(sig, args, kwargs):
+    boundargs = sig.bind(*args, **kwargs)
+    boundargs.apply_defaults()
+    return tuple(boundargs.arguments.values())
+
+
+CASES = {
+    "no_default": (lambda x, y: None, (1, 2)),
+    "default": (lambda x, y=1: None, (1,))
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_bind_key_matches_signature(case):
+
+    func, args = CASES[case]
+    formula = Formula(func)
+    sig, bind_key = formula.signature, formula.bind_key
+
+    assert bind_key(args, {}) == bind_by_signature(sig, args, {})
+
+
+@pytest.mark.skip()
+@pytest.mark.parametrize("case", CASES)
+def test_bind_by_signature(benchmark, case):
+    func, args = CASES[case]
+    benchmark(bind_by_signature, Formula(func).signature, args, {})
+
+
+@pytest.mark.skip()
+@pytest.mark.parametrize("case", CASES)
+def test_bind_key(benchmark, case):
+    func, args = CASES[case]
+    benchmark(Formula(func).bind_key, args, {})
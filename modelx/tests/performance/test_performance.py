@@ -44,3 +44,34 @@ def test_space_items(benchmark):
             s[i]
 
     benchmark(run)
+
+
+@pytest.fixture
+def pv_model():
+
+    m, s = mx.new_model(), mx.new_space()
+
+    @mx.defcells
+    def pv(t):
+        return 1 + pv(t - 1) / 1.01 if t > 0 else 0
+
+    @mx.defcells
+    def total(t):
+        return sum(pv(i) for i in range(t))
+
+    yield s
+    mx.set_tracing(True)
+    m.close()
+
+
+@pytest.mark.skip()
+@pytest.mark.parametrize("tracing", [True, False])
+def test_recursion_tracing(benchmark, pv_model, tracing):
+
+    mx.set_tracing(tracing)
+
+    def run():
+        pv_model.total(5000)
+        pv_model.pv.clear()
+
+    benchmark(run)
@@ -0,0 +1,94 @@
+"""Memory and throughput of TraceGraph against networkx.DiGraph
+
+The memory comparison runs as an ordinary test. The throughput
+benchmarks require pytest-benchmark and are skipped by default, as
+the other benchmarks in this package.
+"""
+import tracemalloc
+import networkx as nx
+import pytest
+
+import modelx as mx
+from modelx.core.execution.trace import TraceGraph
+
+
+class Obj:
+    pass
+
+
+def make_nodes(nobjs, size):
+    """Create nodes in advance, as they are owned by the executor"""
+    return [[(obj, (t,)) for t in range(size)]
+            for obj in [Obj() for _ in range(nobjs)]]
+
+
+def build(graph_type, nodes):
+    """Build a graph like the one fibo-style recursion creates"""
+    g = graph_type()
+    for obj_nodes in nodes:
+        g.add_node(obj_nodes[0])
+        for t in range(1, len(obj_nodes)):
+            g.add_edge(obj_nodes[t - 1], obj_nodes[t])
+            g.add_edge(nodes[0][t - 1], obj_nodes[t])
+    return g
+
+
+def measure(graph_type, nodes):
+    tracemalloc.start()
+    try:
+        g = build(graph_type, nodes)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return g, current
+
+
+def test_memory():
+
+    nodes = make_nodes(10, 1000)
+
+    _, nx_mem = measure(nx.DiGraph, nodes)
+    g, mem = measure(TraceGraph, nodes)
+
+    assert len(g) == 10 * 1000
+    assert mem * 2 < nx_mem
+
+
+@pytest.fixture
+def fibo_model():
+
+    m, s = mx.new_model(), mx.new_space()
+
+    @mx.defcells
+    def fibo(n):
+        return fibo(n - 1) + fibo(n - 2) if n > 1 else n
+
+    @mx.defcells
+    def total(n):
+        return sum(fibo(i) for i in range(n))
+
+    yield m
+    m._impl._check_sanity()
+    m.close()
+
+
+@pytest.mark.skip()
+def test_build_tracegraph(benchmark):
+    benchmark(build, TraceGraph, make_nodes(10, 1000))
+
+
+@pytest.mark.skip()
+def test_build_networkx(benchmark):
+    benchmark(build, nx.DiGraph, make_nodes(10, 1000))
+
+
+@pytest.mark.skip()
+def test_calc_and_clear(benchmark, fibo_model):
+
+    s = fibo_model.spaces["Space1"]
+
+    def run():
+        s.total(3000)
+        s.fibo.clear_at(0)
+
+    benchmark(run)
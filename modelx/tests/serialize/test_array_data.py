@@ -0,0 +1,161 @@
+import pytest
+import numpy as np
+import modelx as mx
+from modelx.core.cells import MappedData
+from modelx.serialize import serializer_8
+
+
+@pytest.fixture
+def arraymodel(tmp_path):
+    """
+        ArrayModel-----Space1-----qx(age, dur): Full grid of floats
+                               +--count(x): Ints with gaps
+                               +--sparse(x): Too sparse for an array
+                               +--label(x): Strings
+                               +--total(age)
+    """
+    m = mx.new_model("ArrayModel")
+    s = m.new_space("Space1")
+    s.new_cells("qx", formula=lambda age, dur: None)
+    for age in range(20, 30):
+        for dur in range(5):
+            s.qx[age, dur] = age / 1000 + dur
+
+    s.new_cells("count", formula=lambda x: 0)
+    s.count[1] = 3
+    s.count[4] = 5
+
+    s.new_cells("sparse", formula=lambda x: 0)
+    s.sparse[1] = 1.5
+    s.sparse[1000] = 2.5
+
+    s.new_cells("label", formula=lambda x: "")
+    s.label[1] = "a"
+
+    s.new_cells("total", formula=lambda age: sum(qx(age, d) for d in range(5)))
+    expected = {age: s.total(age) for age in range(20, 30)}
+
+    path = tmp_path / "model"
+    m.write(path, array_data=True)
+    m.close()
+
+    yield path, expected
+
+
+def test_array_files(arraymodel):
+
+    path, _ = arraymodel
+    files = set(p.name for p in (path / "Space1" / "_data").iterdir())
+    assert {"qx.npy", "qx.json", "count.npy", "count.mask.npy",
+            "count.json", "sparse", "label"} == files
+
+
+def test_read_mapped(arraymodel):
+
+    path, expected = arraymodel
+    m = mx.read_model(path)
+    s = m.Space1
+    data = s.qx._impl.data
+    assert isinstance(data, MappedData)
+    assert isinstance(data.values, np.memmap) == serializer_8.MAP_FILES
+    assert len(data) == len(s.qx._impl.input_keys) == 50
+
+    assert {age: s.total(age) for age in range(20, 30)} == expected
+    assert s.count(1) == 3 and s.count(2) == 0 and s.count(4) == 5
+    assert type(s.count(1)) is int
+    assert s.sparse(1000) == 2.5
+    assert not isinstance(s.sparse._impl.data, MappedData)
+    assert s.label(1) == "a"
+
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_change_mapped(arraymodel):
+
+    path, expected = arraymodel
+    m = mx.read_model(path)
+    s = m.Space1
+    impl = s.qx._impl
+
+    assert s.total(20) == expected[20]
+    s.qx[20, 0] = 100.0
+    assert s.total(20) == pytest.approx(expected[20] - 0.02 + 100)
+    s.qx.clear_at(21, 0)
+    assert (21, 0) not in impl.data
+    assert (21, 0) not in impl.input_keys
+    assert len(impl.data) == len(impl.input_keys) == 49
+    m._impl._check_sanity()
+
+    # Changed values are written to the array
+    m.write(path.parent / "model2", array_data=True)
+    m2 = mx.read_model(path.parent / "model2", name="Model2")
+    assert isinstance(m2.Space1.qx._impl.data, MappedData)
+    assert m2.Space1.qx(20, 0) == 100
+    assert (21, 0) not in m2.Space1.qx._impl.data
+    m2.close()
+
+    s.qx.clear_all()
+    assert not impl.data
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_cache_policy_unmaps(arraymodel):
+
+    path, expected = arraymodel
+    m = mx.read_model(path)
+    s = m.Space1
+    s.qx.cache_policy = mx.LRU(10)
+    assert not isinstance(s.qx._impl.data, MappedData)
+    assert len(s.qx._impl.input_keys) == 50
+    assert s.total(25) == expected[25]
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_zip_read(arraymodel, tmp_path):
+
+    path, expected = arraymodel
+    m = mx.read_model(path)
+    m.zip(tmp_path / "model.zip")
+    m.close()
+
+    m = mx.read_model(tmp_path / "model.zip")
+    assert {age: m.Space1.total(age) for age in range(20, 30)} == expected
+    m.close()
+
+
+def test_version_required(tmp_path):
+
+    m = mx.new_model("ArrayModel7")
+    try:
+        with pytest.raises(ValueError):
+            mx.write_model(m, tmp_path / "model", version=7,
+                           array_data=True)
+    finally:
+        m.close()
+
+
+@pytest.mark.parametrize("map_files", [True, False])
+@pytest.mark.parametrize("backup, incremental",
+                         [(True, False), (False, False), (False, True)])
+def test_rewrite_same_path(arraymodel, monkeypatch, map_files,
+                           backup, incremental):
+
+    path, expected = arraymodel
+    monkeypatch.setattr(serializer_8, "MAP_FILES", map_files)
+    m = mx.read_model(path)
+    assert isinstance(m.Space1.qx._impl.data.values, np.memmap) == map_files
+
+    m.Space1.qx[20, 0] = 100.0
+    m.write(path, backup=backup, incremental=incremental, array_data=True)
+    m.Space1.total.clear()
+    assert m.Space1.total(21) == expected[21]
+    m.close()
+
+    m = mx.read_model(path)
+    assert m.Space1.qx(20, 0) == 100
+    assert {age: m.Space1.total(age) for age in range(21, 30)} == {
+        age: expected[age] for age in range(21, 30)}
+    m.close()
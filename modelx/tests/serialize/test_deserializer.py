@@ -19,3 +19,11 @@ def test_compare_statements():
     path_ = datadir / 'dummy_init.py'
     for t, a in zip(deserializer.get_statements(path_), get_statmetns_atok(path_)):
         assert t == a
+
+
+def test_statement_tokens_from_bytes():
+    path_ = datadir / 'dummy_init.py'
+    expected = deserializer.get_statement_tokens(path_)
+    actual = deserializer.get_statement_tokens_from_bytes(path_.read_bytes())
+    assert actual == expected
+    assert [t.section for t in actual] == [t.section for t in expected]
@@ -0,0 +1,198 @@
+import os
+import json
+import pytest
+import pandas as pd
+import modelx as mx
+from modelx.serialize import serializer_7
+from modelx.serialize.serializer_7 import get_manifest
+
+
+@pytest.fixture
+def incmodel():
+    """
+        IncModel-----SpaceA-----foo(x)
+                  |          +--df = DataFrame
+                  |
+                  +--SpaceB-----bar(x)
+    """
+    m = mx.new_model("IncModel")
+    a = m.new_space("SpaceA")
+    a.new_cells("foo", formula=lambda x: 2 * x)
+    a.foo[1] = 10
+    a.df = pd.DataFrame({"x": [1, 2]})
+    b = m.new_space("SpaceB")
+    b.new_cells("bar", formula=lambda x: 3 * x)
+
+    yield m
+    m._impl._check_sanity()
+    m.close()
+
+
+def get_mtimes(path):
+    return {p.relative_to(path).as_posix(): p.stat().st_mtime_ns
+            for p in path.rglob("*") if p.is_file()
+            and p.name != "_system.json"}
+
+
+def test_unchanged_model(incmodel, tmp_path):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+    manifest = get_manifest(path)
+    assert "SpaceA/__init__.py" in manifest
+    assert "SpaceA/_data/foo" in manifest
+    assert "_data/data.pickle" in manifest
+
+    (path / "README.md").write_text("Not a part of the model")
+    mtimes = get_mtimes(path)
+
+    mx.write_model(incmodel, path, incremental=True)
+    assert get_mtimes(path) == mtimes
+    assert get_manifest(path) == manifest
+    assert (path / "README.md").exists()
+    assert not (tmp_path / "model_BAK1").exists()
+
+
+def test_changed_space(incmodel, tmp_path):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+    mtimes = get_mtimes(path)
+
+    incmodel.SpaceB.bar.formula = lambda x: 4 * x
+    incmodel.write(path, incremental=True)
+
+    changed = {k for k, v in get_mtimes(path).items() if mtimes[k] != v}
+    assert changed == {"SpaceB/__init__.py"}
+
+    m = mx.read_model(path, name="Restored")
+    assert m.SpaceB.bar(2) == 8
+    assert m.SpaceA.foo(1) == 10
+    m.close()
+
+
+def test_changed_input(incmodel, tmp_path):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+    mtimes = get_mtimes(path)
+
+    incmodel.SpaceA.foo[1] = 20
+    incmodel.write(path, incremental=True)
+
+    changed = {k for k, v in get_mtimes(path).items() if mtimes[k] != v}
+    assert changed == {"SpaceA/_data/foo", "_data/data.pickle"}
+
+    m = mx.read_model(path, name="Restored")
+    assert m.SpaceA.foo(1) == 20
+    m.close()
+
+
+def test_unchanged_space_not_encoded(incmodel, tmp_path, monkeypatch):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+
+    encoded = []
+    encode = serializer_7.SpaceEncoder.encode
+
+    def encode_spy(self):
+        encoded.append(self.target.name)
+        return encode(self)
+
+    monkeypatch.setattr(serializer_7.SpaceEncoder, "encode", encode_spy)
+
+    incmodel.write(path, incremental=True)
+    assert encoded == []
+
+    incmodel.SpaceB.bar.formula = lambda x: 4 * x
+    incmodel.write(path, incremental=True)
+    assert encoded == ["SpaceB"]
+
+    # Written to another path in full
+    incmodel.write(tmp_path / "other", incremental=True)
+    assert encoded == ["SpaceB", "SpaceA", "SpaceB"]
+
+
+@pytest.mark.parametrize("change, check", [
+    [lambda m: setattr(m.SpaceA, "doc", "New doc"),
+     lambda m: m.SpaceA.doc == "New doc"],
+    [lambda m: setattr(m.SpaceA.foo, "allow_none", True),
+     lambda m: m.SpaceA.foo.allow_none],
+    [lambda m: setattr(m.SpaceA, "parameters", ("i",)),
+     lambda m: m.SpaceA.parameters == ("i",)],
+    [lambda m: setattr(m.SpaceA, "y", 3),
+     lambda m: m.SpaceA.y == 3],
+    [lambda m: m.SpaceA.foo.clear_at(1),
+     lambda m: not dict(m.SpaceA.foo)],
+    [lambda m: m.SpaceA.foo.rename("baz"),
+     lambda m: "baz" in m.SpaceA.cells],
+    [lambda m: m.SpaceB.add_bases(m.SpaceA),
+     lambda m: m.SpaceB.foo(1) == 2]
+])
+def test_change_written(incmodel, tmp_path, change, check):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+
+    change(incmodel)
+    incmodel.write(path, incremental=True)
+
+    m = mx.read_model(path, name="Restored")
+    assert check(m)
+    m.close()
+
+
+@pytest.mark.parametrize("relpath", ["SpaceA/__init__.py", "SpaceA/_data/foo"])
+def test_file_changed_on_disk(incmodel, tmp_path, relpath):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+    content = (path / relpath).read_bytes()
+
+    # Same size and modification time as written
+    mtime = (path / relpath).stat().st_mtime_ns
+    (path / relpath).write_bytes(content.replace(b"1", b"3"))
+    os.utime(path / relpath, ns=(mtime, mtime))
+
+    incmodel.write(path, incremental=True)
+    assert (path / relpath).read_bytes() == content
+
+
+def test_deleted_space(incmodel, tmp_path):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+
+    del incmodel.SpaceA
+    incmodel.write(path, incremental=True)
+
+    assert not (path / "SpaceA").exists()
+    assert not any(k.startswith("SpaceA/") for k in get_manifest(path))
+
+    m = mx.read_model(path, name="Restored")
+    assert list(m.spaces) == ["SpaceB"]
+    m.close()
+
+
+def test_full_write_after_incremental(incmodel, tmp_path):
+
+    path = tmp_path / "model"
+    incmodel.write(path, incremental=True)
+    incmodel.write(path, backup=False)
+
+    with open(path / "_system.json") as f:
+        assert "manifest" not in json.load(f)
+
+    incmodel.SpaceA.foo[1] = 30
+    incmodel.write(path, incremental=True)
+    m = mx.read_model(path, name="Restored")
+    assert m.SpaceA.foo(1) == 30
+    m.close()
+
+
+def test_incremental_errors(incmodel, tmp_path):
+
+    with pytest.raises(ValueError):
+        mx.write_model(incmodel, tmp_path / "model", incremental=True,
+                       version=6)
@@ -0,0 +1,107 @@
+import pytest
+import pandas as pd
+import modelx as mx
+
+
+@pytest.fixture
+def lazymodel(tmp_path_factory):
+    """
+        LazyModel-----SpaceA-----foo(x)
+                   |          +--df = DataFrame
+                   |          +--SpaceC-----baz()
+                   |
+                   +--SpaceB(SpaceA)-----bar(x)
+                   |                  +--refA = SpaceA
+                   |
+                   +--SpaceD
+                   +--gref = 3
+    """
+    m = mx.new_model("LazyModel")
+    a = m.new_space("SpaceA")
+    a.new_cells("foo", formula=lambda x: 2 * x)
+    a.foo[1] = 10
+    a.df = pd.DataFrame({"x": [1, 2]})
+    a.new_space("SpaceC").new_cells("baz", formula=lambda: 5)
+    b = m.new_space("SpaceB", bases=a)
+    b.new_cells("bar", formula=lambda x: foo(x) + refA.foo(x))
+    b.refA = a
+    m.new_space("SpaceD")
+    m.gref = 3
+
+    path = tmp_path_factory.mktemp("lazy")
+    m.write(path / "model")
+    zip_path = path / "model.zip"
+    m.zip(zip_path)
+    m.close()
+    return path / "model", zip_path
+
+
+@pytest.mark.parametrize("zipped", [False, True])
+def test_load_on_access(lazymodel, zipped):
+
+    m = mx.read_model(lazymodel[zipped], lazy=True)
+    loader = m._impl.lazy_loader
+    assert not m._impl.spaces
+    assert set(loader.names) == {"SpaceA", "SpaceB", "SpaceD"}
+    assert m.gref == 3
+
+    assert m.SpaceB.bar(1) == 12
+    assert set(m._impl.spaces) == {"SpaceA", "SpaceB"}
+    assert loader.names == ["SpaceD"]
+    assert m.SpaceA.df.equals(pd.DataFrame({"x": [1, 2]}))
+    assert m.SpaceA.SpaceC.baz() == 5
+    assert "SpaceD" in dir(m)
+
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_spaces_loads_all(lazymodel):
+
+    m = mx.read_model(lazymodel[0], lazy=True)
+    assert set(m.spaces) == {"SpaceA", "SpaceB", "SpaceD"}
+    assert m._impl.lazy_loader is None
+    assert m.SpaceB.bases == [m.SpaceA]
+    assert m.SpaceB.refA is m.SpaceA
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_get_object(lazymodel):
+
+    m = mx.read_model(lazymodel[0], lazy=True)
+    assert mx.get_object("LazyModel.SpaceA.SpaceC.baz")() == 5
+    m.close()
+
+
+def test_write_lazy_model(lazymodel, tmp_path):
+
+    m = mx.read_model(lazymodel[0], lazy=True)
+    m.write(tmp_path / "model")
+    m.close()
+
+    m = mx.read_model(tmp_path / "model")
+    assert set(m.spaces) == {"SpaceA", "SpaceB", "SpaceD"}
+    assert m.SpaceB.bar(1) == 12
+    m.close()
+
+
+def test_new_space_with_pending_name(lazymodel):
+
+    m = mx.read_model(lazymodel[0], lazy=True)
+    with pytest.raises(ValueError):
+        m.new_space("SpaceD")
+
+    s = m.new_space()
+    assert s.name not in ("SpaceA", "SpaceB", "SpaceD")
+    assert m._impl.lazy_loader is None
+    m.close()
+
+
+def test_del_pending_space(lazymodel):
+
+    m = mx.read_model(lazymodel[0], lazy=True)
+    del m.SpaceD
+    assert "SpaceD" not in m.spaces
+    m._impl._check_sanity()
+    m.close()
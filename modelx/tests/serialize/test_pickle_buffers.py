@@ -0,0 +1,104 @@
+import mmap
+import pytest
+import numpy as np
+import pandas as pd
+import modelx as mx
+from modelx.serialize import serializer_8
+
+
+@pytest.fixture
+def buffermodel(monkeypatch):
+    """
+        BufferModel-----Space1-----array: Large array
+                                +--df: Large DataFrame
+                                +--small: Small array
+                                +--foo(x): Large array input
+    """
+    monkeypatch.setattr(serializer_8, "OUT_OF_BAND_SIZE", 1000)
+
+    m = mx.new_model("BufferModel")
+    s = m.new_space("Space1")
+    s.array = np.arange(1000.0)
+    s.df = pd.DataFrame({"x": np.arange(1000.0), "y": np.arange(1000)})
+    s.small = np.arange(3)
+    s.new_cells("foo", formula=lambda x: None)
+    s.foo[1] = np.ones(1000)
+
+    yield m
+    m.close()
+
+
+def is_mapped(array):
+    base = array
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, memoryview) and isinstance(base.obj, mmap.mmap)
+
+
+@pytest.mark.parametrize("is_zip", [False, True])
+def test_pickle_buffers(buffermodel, tmp_path, is_zip):
+
+    m = buffermodel
+    path = tmp_path / ("model.zip" if is_zip else "model")
+    if is_zip:
+        mx.zip_model(m, path, version=8)
+    else:
+        mx.write_model(m, path, version=8)
+        names = set(p.name for p in (path / "_data" / "buffers").iterdir())
+        assert names == {"0.bin", "1.bin", "2.bin", "3.bin"}
+
+    m2 = mx.read_model(path)
+    s = m2.Space1
+    assert np.array_equal(s.array, m.Space1.array)
+    assert s.df.equals(m.Space1.df)
+    assert np.array_equal(s.small, m.Space1.small)
+    assert np.array_equal(s.foo[1], np.ones(1000))
+    assert is_mapped(s.array) == (serializer_8.MAP_FILES and not is_zip)
+
+    # Writable without changing the file
+    s.array[0] = 100
+    m2.close()
+
+    m3 = mx.read_model(path)
+    assert m3.Space1.array[0] == 0
+    m3.close()
+
+
+def test_version_7_in_band(buffermodel, tmp_path):
+
+    m = buffermodel
+    path = tmp_path / "model"
+    m.write(path)   # Version 7 by default
+    assert not (path / "_data" / "buffers").exists()
+
+    m2 = mx.read_model(path)
+    assert np.array_equal(m2.Space1.array, m.Space1.array)
+    assert not is_mapped(m2.Space1.array)
+    m2.close()
+
+
+@pytest.mark.parametrize("map_files", [True, False])
+@pytest.mark.parametrize("backup, incremental",
+                         [(True, False), (False, False), (False, True)])
+def test_rewrite_same_path(buffermodel, tmp_path, monkeypatch, map_files,
+                           backup, incremental):
+    # Mapped files cannot be deleted or replaced on Windows
+
+    path = tmp_path / "model"
+    mx.write_model(buffermodel, path, version=8)
+
+    monkeypatch.setattr(serializer_8, "MAP_FILES", map_files)
+    m = mx.read_model(path, name="BufferModel2")
+    assert is_mapped(m.Space1.array) == map_files
+
+    m.Space1.array = np.arange(1000.0) + 1
+    mx.write_model(m, path, backup=backup, incremental=incremental,
+                   version=8)
+    assert m.Space1.df.equals(buffermodel.Space1.df)
+    m.close()
+
+    m = mx.read_model(path, name="BufferModel3")
+    assert np.array_equal(m.Space1.array, np.arange(1000.0) + 1)
+    assert m.Space1.df.equals(buffermodel.Space1.df)
+    assert np.array_equal(m.Space1.foo[1], np.ones(1000))
+    m.close()
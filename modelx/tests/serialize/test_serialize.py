@@ -209,6 +209,39 @@ def test_zip_compression(
         assert info.compress_type == compression
 
 
+def test_read_zip_max_workers(combined_testmodel_fixture, tmp_path):
+
+    model = combined_testmodel_fixture
+    model.zip(tmp_path / "model.zip")
+
+    m = mx.read_model(tmp_path / "model.zip", max_workers=2)
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_read_process_workers(testmodel, tmp_path):
+
+    testmodel.write(tmp_path / "model")
+    m = mx.read_model(tmp_path / "model", process_workers=2)
+    testutil.compare_model(testmodel, m)
+    m._impl._check_sanity()
+    m.close()
+
+
+def test_read_max_workers_no_processes(testmodel, tmp_path, monkeypatch):
+    import concurrent.futures
+
+    def no_processes(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(
+        concurrent.futures, "ProcessPoolExecutor", no_processes)
+    testmodel.zip(tmp_path / "model.zip")
+    m = mx.read_model(tmp_path / "model.zip", max_workers=2)
+    testutil.compare_model(testmodel, m)
+    m.close()
+
+
 @pytest.mark.parametrize("write_method", ["write_model", "zip_model"])
 def test_nested_space(tmp_path, write_method):
 
@@ -1,4 +1,4 @@
-"""Load-compatibility gates for models saved by serializer versions 4-7.
+"""Load-compatibility gates for models saved by serializer versions 4-8.
 
 Phase 0 of the core refactoring (devnotes/CoreRefactorDesign.md):
 the ``model_v<N>`` directories under
@@ -8,7 +8,7 @@ there for exactly how each was produced).  Loading them must keep
 working while the core is refactored.
 
 Serializers 2-3 are deprecated for loading (and 2-5 for writing), so
-only versions 4-7 are gated (design doc revision 2026-07-15).
+only versions 4-8 are gated (design doc revision 2026-07-15).
 """
 
 import pathlib
@@ -21,7 +21,7 @@ from modelx.tests.testdata.serializer_compat import fixturemodel
 
 DATADIR = pathlib.Path(fixturemodel.__file__).parent
 
-VERSIONS = [4, 5, 6, 7]
+VERSIONS = [4, 5, 6, 7, 8]
 
 
 @pytest.mark.parametrize("version", VERSIONS)
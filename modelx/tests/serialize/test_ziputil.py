@@ -180,3 +180,62 @@ def test_copy_file(tmp_path, is_src_zip, is_dst_zip):
                       compresslevel=None)
 
     assert ziputil.read_str_utf8(dst) == text
+
+
+def test_zip_writer(tmp_path):
+
+    zip_root = tmp_path / "root.zip"
+    ziputil.make_root(zip_root, is_zip=True,
+                      compression=zipfile.ZIP_DEFLATED)
+
+    large = bytes(range(256)) * 10000
+    files = {"a/empty": b"", "a/b/small": b"small", "a/large": large}
+
+    with ziputil.ZipWriter(zip_root) as writer:
+        for name, data in files.items():
+            ziputil.write_file(lambda f: f.write(data), zip_root / name, "b")
+
+        with writer:    # Nested session
+            ziputil.write_str_utf8("text", zip_root / "a/c/text")
+        assert ziputil.exists(zip_root / "a/b")
+        assert ziputil.is_dir(zip_root / "a/c")
+        assert not ziputil.is_dir(zip_root / "a/large")
+        assert not ziputil.exists(zip_root / "x")
+
+        with pytest.warns(UserWarning):
+            writer.writestr("a/b/small", b"other")
+        with pytest.raises(ValueError):
+            writer.writestr("a/b", b"other")
+
+    with zipfile.ZipFile(zip_root) as f:
+        assert f.testzip() is None
+        assert f.namelist() == list(files) + ["a/c/text"]
+        for name, data in files.items():
+            assert f.read(name) == data
+
+    assert not ziputil.ZipWriter.sessions
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_zip_reader(tmp_path, max_workers):
+
+    zip_root = tmp_path / "root.zip"
+    ziputil.make_root(zip_root, is_zip=True,
+                      compression=zipfile.ZIP_DEFLATED)
+    ziputil.write_str_utf8("abc", zip_root / "a/b/text",
+                           compression=zipfile.ZIP_DEFLATED)
+    ziputil.write_str_utf8("def", zip_root / "a/text",
+                           compression=zipfile.ZIP_DEFLATED)
+
+    with ziputil.ZipReader(zip_root, max_workers=max_workers) as reader:
+        assert ziputil.read_str_utf8(zip_root / "a/b/text") == "abc"
+        with reader:    # Nested session
+            assert ziputil.read_str_utf8(zip_root / "a/text") == "def"
+        assert ziputil.read_str_utf8(zip_root / "a/text") == "def"
+        assert ziputil.is_dir(zip_root / "a/b")
+        assert not ziputil.exists(zip_root / "a/c")
+
+        ziputil.copy_file(zip_root / "a/b/text", tmp_path / "copied")
+        assert (tmp_path / "copied").read_text() == "abc"
+
+    assert not ziputil.ZipReader.sessions
@@ -1,13 +1,13 @@
 """Regenerate the serializer-compat fixture models.
 
 The ``model_v<N>`` directories next to this module hold the fixture
-model of ``fixturemodel.py`` saved with serializer versions 4-7.  They
+model of ``fixturemodel.py`` saved with serializer versions 4-8.  They
 are load-compatibility gates for the core refactoring (Phase 0 of
 devnotes/CoreRefactorDesign.md): later modelx versions must keep
 loading these exact files, so they are normally never regenerated.
 
 Serializers 2-3 are deprecated for loading and 2-5 for writing (design
-doc revision 2026-07-15), so only 4-7 are gated and only 6-7 are
+doc revision 2026-07-15), so only 4-8 are gated and only 6-8 are
 writable by this script.
 
 How the fixtures were generated (2026-07-14):
@@ -17,6 +17,10 @@ How the fixtures were generated (2026-07-14):
 
       python -m modelx.tests.testdata.serializer_compat.generate
 
+- ``model_v8``: by ``generate()`` for version 8 only when the version
+  was added (v0.32.0 development, 2026-10-17), leaving the others as
+  they were.
+
 - ``model_v5``: current master cannot *write* formats 2-5 (the old
   writers rotted when ``source`` was removed from cells in v0.22.0
   development, commit e1cb313).  It was written by running
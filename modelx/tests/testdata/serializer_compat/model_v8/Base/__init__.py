@@ -0,0 +1,48 @@
+# modelx: pseudo-python
+# This file is part of a modelx model.
+# It can be imported as a Python module, but functions defined herein
+# are model formulas and may not be executable as standard Python.
+
+"""Base space"""
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = []
+
+_allow_none = None
+
+_spaces = [
+    "Child"
+]
+
+# ---------------------------------------------------------------------------
+# Cells
+
+def foo(x):
+    if x == 0:
+        return 0
+    return foo(x - 1) + m
+
+
+bar = lambda x: x * m
+
+# ---------------------------------------------------------------------------
+# References
+
+m = 3
+
+self_space = ("Interface", (".",), "auto")
+
+the_model = ("Interface", ("..",), "auto")
+
+the_cells = ("Interface", (".", "foo"), "auto")
+
+s = "abc"
+
+lst = ("Pickle", 1)
+
+dct = ("Pickle", 2)
+
+tpl = ("Pickle", 3)
\ No newline at end of file
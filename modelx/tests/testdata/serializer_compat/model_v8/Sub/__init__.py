@@ -0,0 +1,21 @@
+# modelx: pseudo-python
+# This file is part of a modelx model.
+# It can be imported as a Python module, but functions defined herein
+# are model formulas and may not be executable as standard Python.
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = [
+    ".Base"
+]
+
+_allow_none = None
+
+_spaces = []
+
+# ---------------------------------------------------------------------------
+# References
+
+m = 30
\ No newline at end of file